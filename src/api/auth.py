@@ -227,7 +227,7 @@ async def get_current_customer(
     token_data = decode_token(token)
     
     # Load customer from repository
-    customer = customer_repository.get_by_id(UUID(token_data.customer_id))
+    customer = await customer_repository.get_by_id(UUID(token_data.customer_id))
     
     if not customer:
         raise HTTPException(
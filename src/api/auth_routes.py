@@ -62,7 +62,7 @@ async def signup(request: SignupRequest):
     """
     try:
         # Create customer
-        customer = customer_repository.create(
+        customer = await customer_repository.create(
             email=request.email,
             password=request.password,
             name=request.name,
@@ -104,7 +104,7 @@ async def login(request: LoginRequest):
     Validates credentials and returns JWT token.
     """
     # Get customer by email
-    customer = customer_repository.get_by_email(request.email)
+    customer = await customer_repository.get_by_email(request.email)
     
     if not customer:
         raise HTTPException(
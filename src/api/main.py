@@ -34,6 +34,9 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting Gmail Cleanup API...")
     logger.info("📊 Initializing database connection...")
+    from src.infrastructure.customer_repository import customer_repository
+    loaded = await customer_repository.load()
+    logger.info(f"👥 Loaded {loaded} customers from storage")
     # TODO: Initialize database pool
     # TODO: Initialize Redis connection for rate limiting
     # TODO: Start background tasks (usage tracking, cleanup jobs)
@@ -42,6 +45,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down Gmail Cleanup API...")
+    await customer_repository.close()
     # TODO: Close database pool
     # TODO: Close Redis connection
     # TODO: Stop background tasks
@@ -47,7 +47,10 @@ from src.infrastructure.supabase_client import init_supabase_client
 from src.infrastructure.db_repositories import PostgreSQLAgentRepository
 
 # Import Gmail cleanup router
-from src.api.routers.gmail_cleanup import router as gmail_cleanup_router
+from src.api.routers.gmail_cleanup import (
+    flush_observability as flush_gmail_observability,
+    router as gmail_cleanup_router,
+)
 
 
 # Global dependencies (initialized in lifespan)
@@ -177,6 +180,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     observability.log("info", "Shutting down API server")
+    await flush_gmail_observability()
 
 
 # Create FastAPI app
@@ -97,6 +97,12 @@ def get_observability() -> GmailCleanupObservability:
     return _observability
 
 
+async def flush_observability() -> None:
+    """Emit buffered cleanup logs/metrics (call on shutdown)."""
+    if _observability is not None:
+        await _observability.flush()
+
+
 def get_repository() -> GmailCleanupRepository:
     """Get repository instance (singleton)."""
     global _repository
@@ -8,9 +8,8 @@ orchestrating domain entities and infrastructure services.
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dataclasses import asdict
+import asyncio
 import uuid
-import time
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from src.domain.email_thread import MailboxSnapshot, EmailThread, EmailMessage
 from src.domain.cleanup_policy import CleanupPolicy, CleanupAction
@@ -24,7 +23,14 @@ from src.domain.metrics import (
 from src.infrastructure.gmail_client import GmailClient
 from src.infrastructure.gmail_persistence import GmailCleanupRepository
 from src.infrastructure.gmail_observability import GmailCleanupObservability
-from src.rate_limiting import RateLimiter, RateLimitConfig, RateLimitError
+from src.rate_limiting import RateLimiter, RateLimitConfig, RateLimitError, get_rate_limiter
+
+# Gmail API quota, shared by every use case acting on the same OAuth project
+GMAIL_RATE_LIMIT_CONFIG = RateLimitConfig(
+    max_requests_per_minute=250,
+    max_requests_per_hour=10000,
+    max_requests_per_day=100000,
+)
 
 def _run_coro_in_thread(coro):
     """Run an awaitable in a fresh thread with its own event loop and return the result.
@@ -34,7 +40,6 @@ def _run_coro_in_thread(coro):
     would raise, so we run the coroutine in a separate thread.
     """
     import concurrent.futures
-    import asyncio
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
         fut = ex.submit(lambda: asyncio.run(coro))
@@ -219,11 +224,10 @@ class ExecuteCleanupUseCase:
         self.gmail = gmail_client
         self.repository = repository
         self.observability = observability
-        self.rate_limiter = rate_limiter or RateLimiter(RateLimitConfig(
-            max_requests_per_minute=250,  # Gmail API quota
-            max_requests_per_hour=10000,
-            max_requests_per_day=100000,
-        ))
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            getattr(gmail_client, "project_id", None) or "gmail",
+            GMAIL_RATE_LIMIT_CONFIG,
+        )
     
     class _MaybeAwaitableRun:
         """Wrapper that is both awaitable and acts like a `CleanupRun`.
@@ -255,7 +259,18 @@ class ExecuteCleanupUseCase:
                     customer_id=self._customer_id,
                     persist_run=False,
                 )
-                self._result = _run_coro_in_thread(coro)
+                observability = self._use_case.observability
+                
+                async def _run_and_flush():
+                    # The thread's loop closes after this; emit buffered
+                    # logs/metrics while it's still running
+                    try:
+                        return await coro
+                    finally:
+                        if observability:
+                            await observability.flush()
+                
+                self._result = _run_coro_in_thread(_run_and_flush())
                 self._executed = True
             return self._result
 
@@ -379,9 +394,11 @@ class ExecuteCleanupUseCase:
                             try:
                                 if hasattr(self.gmail, 'execute_action'):
                                     # execute_action is expected to be async: (user_id, thread_id, action)
+                                    await self._acquire_quota(user_id)
                                     result = await self.gmail.execute_action(user_id, message.thread_id, action_type)
                                 elif hasattr(self.gmail, 'batch_execute_actions'):
                                     # use batch API if available
+                                    await self._acquire_quota(user_id)
                                     await self.gmail.batch_execute_actions(user_id, [(message.thread_id, action_type)])
                                     result = True
                                 else:
@@ -475,62 +492,28 @@ class ExecuteCleanupUseCase:
         
         return run
     
-    def _execute_action_with_retry(
-        self,
-        message_id: str,
-        action: CleanupAction,
-        params: dict,
-        user_id: str,
-    ) -> None:
-        """Execute action with rate limiting and retry logic."""
-        # Small delay to respect Gmail API rate limits
-        time.sleep(0.01)
+    async def _acquire_quota(self, user_id: str) -> None:
+        """
+        Record one Gmail API request against the shared quota.
         
-        # Execute with exponential backoff retry
-        return self._execute_action_with_backoff(message_id, action, params)
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(Exception),
-    )
-    def _execute_action_with_backoff(
-        self,
-        message_id: str,
-        action: CleanupAction,
-        params: dict,
-    ) -> None:
-        """Execute action with exponential backoff retry."""
-        return self._execute_action(message_id, action, params)
-    
-    def _execute_action(
-        self,
-        message_id: str,
-        action: CleanupAction,
-        params: dict,
-    ) -> None:
-        """Execute a single cleanup action."""
-        if action == CleanupAction.DELETE:
-            self.gmail.trash_message(message_id)
-        elif action == CleanupAction.ARCHIVE:
-            self.gmail.archive_message(message_id)
-        elif action == CleanupAction.MARK_READ:
-            self.gmail.mark_read(message_id)
-        elif action == CleanupAction.MARK_UNREAD:
-            self.gmail.mark_unread(message_id)
-        elif action == CleanupAction.STAR:
-            self.gmail.star_message(message_id)
-        elif action == CleanupAction.UNSTAR:
-            self.gmail.unstar_message(message_id)
-        elif action == CleanupAction.APPLY_LABEL:
-            label = params.get('label')
-            if label:
-                self.gmail.modify_labels(message_id, add_labels=[label])
-        elif action == CleanupAction.REMOVE_LABEL:
-            label = params.get('label')
-            if label:
-                self.gmail.modify_labels(message_id, remove_labels=[label])
-        # SKIP action does nothing
+        Waits out the limiter's `retry_after` when a window is full.
+        
+        Raises:
+            RateLimitError: If the limiter refuses without a retry time
+                (e.g. its emergency stop is on)
+        """
+        while True:
+            try:
+                await self.rate_limiter.check_and_record(
+                    tokens=0,
+                    estimated_cost=0.0,
+                    user_id=user_id,
+                )
+                return
+            except RateLimitError as e:
+                if e.retry_after is None:
+                    raise
+                await asyncio.sleep(e.retry_after)
 
 
 class GenerateSummaryReportUseCase:
@@ -102,12 +102,13 @@ class PlanQuota:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Customer:
     """
     Customer entity representing a SaaS customer account.
     
-    Includes plan tier, billing info, and quota management.
+    Includes plan tier, billing info, and quota management. Immutable:
+    use `dataclasses.replace` to derive an updated copy.
     """
     id: UUID
     email: str
@@ -120,6 +121,7 @@ class Customer:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     last_login_at: Optional[datetime] = None
+    cancelled_at: Optional[datetime] = None
     
     # Billing
     stripe_customer_id: Optional[str] = None
@@ -6,7 +6,8 @@ independent of any external API or infrastructure.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -30,7 +31,7 @@ class EmailImportance(str, Enum):
     SPAM = "spam"  # Suspected spam
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddress:
     """Email address with optional display name."""
     address: str
@@ -47,7 +48,7 @@ class EmailAddress:
         return self.address.split('@')[-1] if '@' in self.address else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage:
     """
     Single email message entity.
@@ -104,7 +105,7 @@ class EmailMessage:
             return self.from_address.domain.lower() == domain_or_email.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailThread:
     """
     Email thread (conversation) entity.
@@ -175,17 +176,16 @@ class MailboxSnapshot:
     Snapshot of mailbox state at a point in time.
     
     Used for analysis, reporting, and tracking changes over time.
+    
+    Per-message statistics (unread, inbox, size, ...) are computed from
+    `threads` on first access, so snapshots that are only used to drive
+    cleanup actions never pay for them.
     """
     user_id: str
     captured_at: datetime
     threads: List[EmailThread]
     total_messages: int = 0
     total_threads: int = 0
-    unread_count: int = 0
-    inbox_count: int = 0
-    archived_count: int = 0
-    trash_count: int = 0
-    total_size_bytes: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     @property
@@ -201,21 +201,55 @@ class MailboxSnapshot:
     @classmethod
     def from_threads(cls, user_id: str, threads: List[EmailThread]) -> 'MailboxSnapshot':
         """Create snapshot from list of threads."""
-        all_messages = [msg for thread in threads for msg in thread.messages]
-        
         return cls(
             user_id=user_id,
             captured_at=datetime.utcnow(),
             threads=threads,
-            total_messages=len(all_messages),
+            total_messages=sum(len(thread.messages) for thread in threads),
             total_threads=len(threads),
-            unread_count=sum(1 for msg in all_messages if msg.is_unread),
-            inbox_count=sum(1 for msg in all_messages if msg.is_in_inbox),
-            archived_count=sum(1 for msg in all_messages if msg.is_archived),
-            trash_count=sum(1 for msg in all_messages if msg.is_trashed),
-            total_size_bytes=sum(msg.size_bytes for msg in all_messages),
         )
     
+    @cached_property
+    def _message_stats(self) -> Tuple[int, int, int, int, int]:
+        """Single pass over all messages: (unread, inbox, archived, trash, size_bytes)."""
+        unread = inbox = archived = trash = size_bytes = 0
+        for thread in self.threads:
+            for msg in thread.messages:
+                labels = msg.labels
+                in_inbox = "INBOX" in labels
+                in_trash = "TRASH" in labels
+                unread += msg.is_unread
+                inbox += in_inbox
+                trash += in_trash
+                archived += not in_inbox and not in_trash
+                size_bytes += msg.size_bytes
+        return unread, inbox, archived, trash, size_bytes
+    
+    @property
+    def unread_count(self) -> int:
+        """Number of unread messages."""
+        return self._message_stats[0]
+    
+    @property
+    def inbox_count(self) -> int:
+        """Number of messages in the inbox."""
+        return self._message_stats[1]
+    
+    @property
+    def archived_count(self) -> int:
+        """Number of archived messages."""
+        return self._message_stats[2]
+    
+    @property
+    def trash_count(self) -> int:
+        """Number of trashed messages."""
+        return self._message_stats[3]
+    
+    @property
+    def total_size_bytes(self) -> int:
+        """Total size of all messages in bytes."""
+        return self._message_stats[4]
+    
     @property
     def size_mb(self) -> float:
         """Total size in megabytes."""
@@ -5,6 +5,8 @@ Custom exceptions that represent domain-specific error conditions.
 These are caught and handled by the application layer.
 """
 
+from typing import Optional
+
 
 class DomainError(Exception):
     """Base exception for all domain errors."""
@@ -135,6 +137,16 @@ class MessageQueueError(DomainError):
     pass
 
 
+class GmailAPIError(DomainError):
+    """Raised when a Gmail API call fails."""
+
+    def __init__(self, operation: str, reason: str, status_code: Optional[int] = None):
+        super().__init__(f"Gmail {operation} failed: {reason}")
+        self.operation = operation
+        self.reason = reason
+        self.status_code = status_code
+
+
 class ValidationError(DomainError):
     """Raised when domain validation fails."""
 
@@ -6,12 +6,20 @@ for Gmail cleanup functionality. Following Dependency Inversion Principle.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import AsyncIterator, List, Dict, Any, Mapping, Optional, Tuple, TypedDict
+import asyncio
 from datetime import datetime
 
 from src.domain.email_thread import EmailThread, EmailMessage
 
 
+class BatchResult(TypedDict):
+    """Outcome counts returned by the batch_* operations."""
+    success: int
+    failed: int
+
+
 class IGmailClient(ABC):
     """
     Interface for Gmail API operations.
@@ -23,6 +31,19 @@ class IGmailClient(ABC):
     - Offline development and testing
     """
 
+    async def __aenter__(self) -> 'IGmailClient':
+        """
+        Open connections shared across a cleanup run.
+        
+        Adapters that pool HTTP connections create the pool here so every
+        call in `async with client:` reuses it.
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Release connections opened by `__aenter__`."""
+        pass
+
     @abstractmethod
     def list_threads(
         self,
@@ -35,7 +56,8 @@ class IGmailClient(ABC):
         
         Args:
             query: Gmail search query (e.g., "is:unread older_than:30d")
-            max_results: Maximum number of threads to return
+            max_results: Maximum number of threads to return; 0 means no
+                limit (every matching thread)
             label_ids: Filter by label IDs (e.g., ["INBOX", "UNREAD"])
             
         Returns:
@@ -47,6 +69,34 @@ class IGmailClient(ABC):
         """
         pass
 
+    async def iter_threads(
+        self,
+        query: str = '',
+        label_ids: Optional[List[str]] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[EmailThread]:
+        """
+        Stream threads matching query, one page at a time.
+        
+        Lets callers act on early threads while later pages are still
+        being fetched. The default buffers an unlimited `list_threads`
+        call (``max_results=0``) in a worker thread; adapters with
+        paginated APIs should override it.
+        
+        Args:
+            query: Gmail search query
+            label_ids: Filter by label IDs
+            page_size: Threads fetched per API page
+            
+        Yields:
+            EmailThread domain entities
+        """
+        threads = await asyncio.to_thread(
+            self.list_threads, query=query, max_results=0, label_ids=label_ids
+        )
+        for thread in threads:
+            yield thread
+
     @abstractmethod
     def get_thread(self, thread_id: str) -> EmailThread:
         """
@@ -123,12 +173,12 @@ class IGmailClient(ABC):
         pass
 
     @abstractmethod
-    def batch_modify_messages(
+    async def batch_modify_messages(
         self,
         message_ids: List[str],
         add_labels: Optional[List[str]] = None,
         remove_labels: Optional[List[str]] = None,
-    ) -> Dict[str, int]:
+    ) -> BatchResult:
         """
         Modify labels on multiple messages in a single API call.
         
@@ -148,7 +198,32 @@ class IGmailClient(ABC):
         pass
 
     @abstractmethod
-    def batch_archive_messages(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_execute(
+        self,
+        requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several API calls in one HTTP round trip.
+        
+        Gmail accepts up to 100 sub-requests per batch; callers are
+        responsible for chunking larger workloads. The async batch_*
+        methods submit their chunks concurrently.
+        
+        Args:
+            requests: (method, path, body) per sub-request, with path
+                relative to the API root (e.g. "users/me/messages/123/trash")
+            
+        Returns:
+            Parsed response body per sub-request, in request order. Failed
+            sub-requests carry an 'error' key.
+            
+        Raises:
+            GmailAPIError: If the batch request itself fails
+        """
+        pass
+
+    @abstractmethod
+    async def batch_archive_messages(self, message_ids: List[str]) -> BatchResult:
         """
         Archive multiple messages (remove INBOX label).
         
@@ -161,7 +236,7 @@ class IGmailClient(ABC):
         pass
 
     @abstractmethod
-    def batch_trash_messages(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_trash_messages(self, message_ids: List[str]) -> BatchResult:
         """
         Move multiple messages to trash.
         
@@ -174,7 +249,7 @@ class IGmailClient(ABC):
         pass
 
     @abstractmethod
-    def batch_mark_read(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_mark_read(self, message_ids: List[str]) -> BatchResult:
         """
         Mark multiple messages as read (remove UNREAD label).
         
@@ -191,11 +266,27 @@ class IGmailClient(ABC):
         """
         Get all available labels.
         
+        Implementations may cache the result; `create_label` must
+        invalidate any such cache.
+        
         Returns:
             List of label definitions with id, name, type
         """
         pass
 
+    def get_label_map(self) -> Mapping[str, str]:
+        """
+        Get a read-only label name -> label ID mapping.
+        
+        Use instead of scanning `get_labels()` when resolving names.
+        
+        Returns:
+            Mapping of label name to label ID
+        """
+        return MappingProxyType(
+            {label['name']: label['id'] for label in self.get_labels()}
+        )
+
     @abstractmethod
     def create_label(self, name: str) -> str:
         """
@@ -249,7 +340,7 @@ class IGmailClient(ABC):
         pass
 
     @abstractmethod
-    def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
+    async def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
         """Batch delete (or trash) messages. Returns summary dict (e.g., {'success': n, 'failed': m})."""
         pass
 
@@ -6,10 +6,11 @@ adapters. Following the Dependency Inversion Principle from SOLID.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
+import asyncio
 
-from .models import Agent, ExecutionResult, Message, Tool
+from .models import Agent, CompletionRequest, ExecutionResult, Message, Tool
 
 
 class ILLMProvider(ABC):
@@ -18,8 +19,6 @@ class ILLMProvider(ABC):
     
     This abstraction decouples the domain from specific LLM implementations,
     allowing easy swapping of providers without changing business logic.
-    
-    TODO: Add batch processing for multiple prompts
     """
 
     @abstractmethod
@@ -81,6 +80,53 @@ class ILLMProvider(ABC):
         """
         pass
 
+    async def batch_completions(
+        self,
+        requests: List[CompletionRequest],
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[Tuple[int, Message]]:
+        """
+        Generate completions for many prompts, yielding each as it finishes.
+        
+        Results arrive in completion order, not request order; the index
+        identifies which request each message answers. The default runs
+        `generate_completion` concurrently; providers with a native batch
+        API should override this.
+        
+        Args:
+            requests: Prompts to complete
+            max_concurrency: Maximum in-flight calls for the default fan-out
+            
+        Yields:
+            (request index, generated message) pairs
+            
+        Raises:
+            LLMProviderError: If any completion fails
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def complete(index: int, request: CompletionRequest) -> Tuple[int, Message]:
+            async with semaphore:
+                message = await self.generate_completion(
+                    messages=request.messages,
+                    model=request.model,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    tools=request.tools,
+                )
+            return index, message
+
+        tasks = [
+            asyncio.create_task(complete(index, request))
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     @abstractmethod
     async def get_embedding(self, text: str, model: str = "default") -> List[float]:
         """
@@ -138,6 +184,8 @@ class IVectorStore(ABC):
         """
         Insert vectors with associated metadata.
         
+        Implementations may also accept a 2-D numpy array for `vectors`.
+        
         Returns:
             List of vector IDs
         """
@@ -159,6 +207,27 @@ class IVectorStore(ABC):
         """
         pass
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches against one collection.
+        
+        Default runs `search` per vector concurrently; stores with a
+        multi-query endpoint override this to use a single request.
+        
+        Returns:
+            One result list per query vector, in input order
+        """
+        return list(await asyncio.gather(*(
+            self.search(collection, vector, limit=limit, filter=filter)
+            for vector in query_vectors
+        )))
+
     @abstractmethod
     async def delete_collection(self, name: str) -> None:
         """Delete a vector collection."""
@@ -351,6 +420,31 @@ class IObservabilityService(ABC):
         """Record a metric value."""
         pass
 
+    def record_metrics(
+        self,
+        samples: List[Tuple[str, float, Optional[Dict[str, str]]]],
+    ) -> None:
+        """
+        Record several metric values in one call.
+        
+        Lets providers amortize per-emit overhead (locks, buffers, log
+        lines) across related samples. Defaults to one `record_metric` each.
+        
+        Args:
+            samples: (name, value, labels) per metric
+        """
+        for name, value, labels in samples:
+            self.record_metric(name, value, labels)
+
+    def level_enabled(self, level: str) -> bool:
+        """
+        Check whether messages at ``level`` would be emitted.
+
+        Lets hot paths skip building log payloads that would be filtered
+        out anyway. Implementations without level filtering emit everything.
+        """
+        return True
+
     @abstractmethod
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MessageRole(str, Enum):
@@ -54,6 +54,22 @@ class Message(BaseModel):
         frozen = True  # Immutable
 
 
+class CompletionRequest(BaseModel):
+    """
+    One prompt in a batch submitted to an LLM provider.
+    
+    Mirrors the arguments of `ILLMProvider.generate_completion`.
+    """
+
+    messages: List[Message]
+    model: str
+    temperature: float = 0.7
+    max_tokens: int = 4000
+    tools: Optional[List[Dict[str, Any]]] = None
+
+    model_config = ConfigDict(frozen=True)
+
+
 class AgentStatus(str, Enum):
     """Agent execution status."""
 
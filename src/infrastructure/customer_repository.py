@@ -4,30 +4,176 @@ Customer Repository - Data access for customer entities.
 Handles CRUD operations for customers in the database.
 """
 
-from typing import Optional, List
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Iterable, Sized, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
-from dataclasses import asdict
+from dataclasses import replace
+from itertools import islice
+
+from sortedcontainers import SortedList
 
 from src.domain.customer import Customer, PlanTier, CustomerStatus, SubscriptionStatus
-from src.api.auth import hash_password
+from src.infrastructure.customer_storage import (
+    CustomerStorage,
+    DuplicateEmailError,
+    InMemoryCustomerStorage,
+)
+
+# Upper bound for (trial_ends_at, id) keys sharing the same timestamp
+_MAX_UUID = UUID(int=(1 << 128) - 1)
+
+# Stand-in for an index bucket that doesn't exist yet; never mutated
+_EMPTY: SortedList = SortedList()
 
 
 class CustomerRepository:
     """
     Repository for customer data access.
     
-    In production, this would use SQLAlchemy with PostgreSQL.
-    For now, uses in-memory storage for development.
+    Lookups and filtered queries are served from in-memory indexes; every
+    write goes through to a pluggable `CustomerStorage` backend (SQLite or
+    Redis in production, in-memory by default) so customers survive
+    restarts. Call `load()` at startup to warm the indexes from storage.
     """
     
-    def __init__(self):
+    def __init__(self, storage: Optional[CustomerStorage] = None):
+        """
+        Initialize repository.
+        
+        Args:
+            storage: Persistence backend (defaults to in-memory, no persistence)
+        """
+        self._storage = storage or InMemoryCustomerStorage()
         # In-memory storage: {customer_id: customer}
         self._customers_by_id: dict[UUID, Customer] = {}
         # Index by email for login lookups
         self._customers_by_email: dict[str, Customer] = {}
+        # Listing order: every customer as a (created_at, id) key. Secondary
+        # indexes for filtered queries hold the same keys, so pages are
+        # stable no matter when a customer last changed bucket.
+        self._ordered: SortedList = SortedList()
+        self._by_status: dict[CustomerStatus, SortedList] = {}
+        self._by_plan: dict[PlanTier, SortedList] = {}
+        self._by_sub_status: dict[Optional[SubscriptionStatus], SortedList] = {}
+        # Customers with a trial end date, ordered by (trial_ends_at, id)
+        self._trial_index: SortedList = SortedList()
+        # Worker processes for bulk password hashing, started on first use
+        self._hash_pool: Optional[ProcessPoolExecutor] = None
+    
+    def _cache(self, customer: Customer) -> None:
+        """Add a customer loaded from storage to the in-memory indexes."""
+        old = self._customers_by_id.get(customer.id)
+        if old is not None:
+            self._customers_by_email.pop(old.email, None)
+        self._customers_by_id[customer.id] = customer
+        self._customers_by_email[customer.email] = customer
+        self._reindex(old, customer)
+    
+    def _get_hash_pool(self) -> ProcessPoolExecutor:
+        """Start the password-hashing pool on first use; later batches reuse it."""
+        if self._hash_pool is None:
+            self._hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._hash_pool
+    
+    async def close(self) -> None:
+        """Shut down the hashing pool and close the storage backend."""
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown()
+            self._hash_pool = None
+        await self._storage.close()
+    
+    async def load(self) -> int:
+        """
+        Warm the in-memory indexes from the storage backend.
+        
+        Returns:
+            Number of customers loaded
+        """
+        loaded = 0
+        async for customer in self._storage.scan():
+            self._cache(customer)
+            loaded += 1
+        return loaded
+    
+    def _reindex(self, old: Optional[Customer], new: Customer) -> None:
+        """Move a customer between secondary index buckets if its keys changed."""
+        self._reindex_trial(old, new)
+        
+        new_sort_key = (new.created_at, new.id)
+        old_sort_key = (old.created_at, old.id) if old else None
+        new_keys = (new.status, new.plan_tier, new.subscription_status)
+        old_keys = (
+            (old.status, old.plan_tier, old.subscription_status) if old else None
+        )
+        if old_keys == new_keys and old_sort_key == new_sort_key:
+            return
+        
+        if old_sort_key != new_sort_key:
+            if old_sort_key is not None:
+                self._ordered.discard(old_sort_key)
+            self._ordered.add(new_sort_key)
+        
+        indexes = (self._by_status, self._by_plan, self._by_sub_status)
+        for position, (index, new_key) in enumerate(zip(indexes, new_keys)):
+            if old_keys is not None:
+                old_key = old_keys[position]
+                if old_key == new_key and old_sort_key == new_sort_key:
+                    continue
+                index[old_key].discard(old_sort_key)
+            index.setdefault(new_key, SortedList()).add(new_sort_key)
+    
+    def _reindex_trial(self, old: Optional[Customer], new: Customer) -> None:
+        """Keep the trial-expiry index in step with ``trial_ends_at``."""
+        old_ends = old.trial_ends_at if old else None
+        new_ends = new.trial_ends_at
+        if old_ends == new_ends:
+            return
+        
+        if old_ends is not None:
+            self._trial_index.discard((old_ends, new.id))
+        if new_ends is not None:
+            self._trial_index.add((new_ends, new.id))
+    
+    def _filtered_keys(
+        self,
+        status: Optional[CustomerStatus],
+        plan_tier: Optional[PlanTier],
+    ) -> Iterable[Tuple[datetime, UUID]]:
+        """
+        (created_at, id) keys of customers matching the given filters, oldest first.
+        
+        Unfiltered and single-filter results are sorted index buckets (sized
+        and sliceable by position); the two-filter intersection is produced
+        lazily so pagination can stop early.
+        """
+        if status and plan_tier:
+            by_status = self._by_status.get(status, _EMPTY)
+            by_plan = self._by_plan.get(plan_tier, _EMPTY)
+            smaller, larger = sorted((by_status, by_plan), key=len)
+            return filter(larger.__contains__, smaller)
+        if status:
+            return self._by_status.get(status, _EMPTY)
+        if plan_tier:
+            return self._by_plan.get(plan_tier, _EMPTY)
+        return self._ordered
     
-    def create(
+    def _page(
+        self,
+        keys: Iterable[Tuple[datetime, UUID]],
+        limit: int,
+        offset: int,
+    ) -> List[Customer]:
+        """Customers for keys[offset:offset + limit]."""
+        if isinstance(keys, SortedList):
+            page = keys.islice(offset, offset + limit)
+        else:
+            page = islice(keys, offset, offset + limit)
+        return [self._customers_by_id[cid] for _, cid in page]
+    
+    async def create(
         self,
         email: str,
         password: str,
@@ -49,25 +195,35 @@ class CustomerRepository:
         Raises:
             ValueError: If email already exists
         """
-        # Check if email already exists
-        if email in self._customers_by_email:
+        from src.api.auth import hash_password
+        
+        # The index is keyed by lowercased email; storage may hold customers
+        # this instance hasn't loaded
+        if await self._email_taken(email.lower()):
             raise ValueError(f"Customer with email {email} already exists")
         
-        # Create customer with 14-day trial
+        # bcrypt is deliberately slow; keep it off the event loop
+        password_hash = await asyncio.to_thread(hash_password, password)
+        
+        # Create customer with 14-day trial. Storage enforces email
+        # uniqueness, so a signup that raced this one fails here.
         customer = Customer.create(
             email=email,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             name=name,
             plan_tier=plan_tier,
         )
-        
-        # Store in both indexes
-        self._customers_by_id[customer.id] = customer
-        self._customers_by_email[email] = customer
-        
+        await self._storage.set(customer)
+        self._cache(customer)
         return customer
     
-    def get_by_id(self, customer_id: UUID) -> Optional[Customer]:
+    async def _email_taken(self, email: str) -> bool:
+        """Check the email index, then storage, for a customer owning `email`."""
+        if email in self._customers_by_email:
+            return True
+        return await self._storage.get_by_email(email) is not None
+    
+    async def get_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """
         Get customer by ID.
         
@@ -77,9 +233,15 @@ class CustomerRepository:
         Returns:
             Customer if found, None otherwise
         """
-        return self._customers_by_id.get(customer_id)
+        customer = self._customers_by_id.get(customer_id)
+        if customer is None:
+            # May have been written by another instance sharing the storage
+            customer = await self._storage.get(customer_id)
+            if customer is not None:
+                self._cache(customer)
+        return customer
     
-    def get_by_email(self, email: str) -> Optional[Customer]:
+    async def get_by_email(self, email: str) -> Optional[Customer]:
         """
         Get customer by email (for login).
         
@@ -89,12 +251,21 @@ class CustomerRepository:
         Returns:
             Customer if found, None otherwise
         """
-        return self._customers_by_email.get(email)
+        email = email.lower()
+        customer = self._customers_by_email.get(email)
+        if customer is None:
+            customer = await self._storage.get_by_email(email)
+            if customer is not None:
+                self._cache(customer)
+        return customer
     
-    def update(self, customer: Customer) -> Customer:
+    async def update(self, customer: Customer) -> Customer:
         """
         Update existing customer.
         
+        Customers are immutable; pass a copy made with `dataclasses.replace`.
+        The stored snapshot is what gets diffed, so indexes can't drift.
+        
         Args:
             customer: Customer with updated fields
             
@@ -102,24 +273,27 @@ class CustomerRepository:
             Updated customer
             
         Raises:
-            ValueError: If customer doesn't exist
+            ValueError: If customer doesn't exist or the new email is taken
         """
-        if customer.id not in self._customers_by_id:
+        old_customer = self._customers_by_id.get(customer.id)
+        if old_customer is None:
             raise ValueError(f"Customer {customer.id} not found")
         
-        # Update both indexes
-        old_customer = self._customers_by_id[customer.id]
+        if customer.email != customer.email.lower():
+            customer = replace(customer, email=customer.email.lower())
         
-        # If email changed, update email index
-        if old_customer.email != customer.email:
-            del self._customers_by_email[old_customer.email]
-            self._customers_by_email[customer.email] = customer
+        owner = self._customers_by_email.get(customer.email)
+        if owner is not None and owner.id != customer.id:
+            raise ValueError(f"Customer with email {customer.email} already exists")
         
-        self._customers_by_id[customer.id] = customer
+        # Storage rejects an email owned by a customer not yet cached here;
+        # write it first so a rejected update leaves the indexes untouched
+        await self._storage.set(customer)
+        self._cache(customer)
         
         return customer
     
-    def delete(self, customer_id: UUID) -> bool:
+    async def delete(self, customer_id: UUID) -> bool:
         """
         Delete customer (soft delete - sets status to CANCELLED).
         
@@ -129,18 +303,47 @@ class CustomerRepository:
         Returns:
             True if deleted, False if not found
         """
-        customer = self.get_by_id(customer_id)
+        customer = await self.get_by_id(customer_id)
         if not customer:
             return False
         
         # Soft delete - keep data but mark as cancelled
-        customer.status = CustomerStatus.CANCELLED
-        customer.cancelled_at = datetime.utcnow()
-        self.update(customer)
+        await self.update(replace(
+            customer,
+            status=CustomerStatus.CANCELLED,
+            cancelled_at=datetime.utcnow(),
+        ))
         
         return True
     
-    def list_all(
+    async def query(
+        self,
+        status: Optional[CustomerStatus] = None,
+        plan_tier: Optional[PlanTier] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[Customer], int]:
+        """
+        Fetch one page of customers and the total match count together.
+        
+        Dashboards need both; this walks the matching index once instead
+        of once per call. Pages are ordered like `list_all()`.
+        
+        Args:
+            status: Filter by status (optional)
+            plan_tier: Filter by plan tier (optional)
+            limit: Maximum number of results
+            offset: Number of results to skip
+            
+        Returns:
+            (customers on the page, number of customers matching filters)
+        """
+        keys = self._filtered_keys(status, plan_tier)
+        if not isinstance(keys, Sized):
+            keys = list(keys)
+        return self._page(keys, limit, offset), len(keys)
+    
+    async def list_all(
         self,
         status: Optional[CustomerStatus] = None,
         plan_tier: Optional[PlanTier] = None,
@@ -150,6 +353,10 @@ class CustomerRepository:
         """
         List customers with optional filters.
         
+        Customers are ordered by creation time (oldest first), so offsets
+        stay stable when customers are updated. Prefer `query()` when the
+        total count is also needed.
+        
         Args:
             status: Filter by status (optional)
             plan_tier: Filter by plan tier (optional)
@@ -159,19 +366,9 @@ class CustomerRepository:
         Returns:
             List of customers
         """
-        customers = list(self._customers_by_id.values())
-        
-        # Apply filters
-        if status:
-            customers = [c for c in customers if c.status == status]
-        
-        if plan_tier:
-            customers = [c for c in customers if c.plan_tier == plan_tier]
-        
-        # Apply pagination
-        return customers[offset:offset + limit]
+        return self._page(self._filtered_keys(status, plan_tier), limit, offset)
     
-    def count(
+    async def count(
         self,
         status: Optional[CustomerStatus] = None,
         plan_tier: Optional[PlanTier] = None,
@@ -179,6 +376,8 @@ class CustomerRepository:
         """
         Count customers with optional filters.
         
+        Prefer `query()` when a page of results is also needed.
+        
         Args:
             status: Filter by status (optional)
             plan_tier: Filter by plan tier (optional)
@@ -186,17 +385,12 @@ class CustomerRepository:
         Returns:
             Number of customers matching filters
         """
-        customers = list(self._customers_by_id.values())
-        
-        if status:
-            customers = [c for c in customers if c.status == status]
-        
-        if plan_tier:
-            customers = [c for c in customers if c.plan_tier == plan_tier]
-        
-        return len(customers)
+        keys = self._filtered_keys(status, plan_tier)
+        if isinstance(keys, Sized):
+            return len(keys)
+        return sum(1 for _ in keys)
     
-    def upgrade_plan(
+    async def upgrade_plan(
         self,
         customer_id: UUID,
         new_plan: PlanTier,
@@ -218,22 +412,19 @@ class CustomerRepository:
         Raises:
             ValueError: If customer not found
         """
-        customer = self.get_by_id(customer_id)
+        customer = await self.get_by_id(customer_id)
         if not customer:
             raise ValueError(f"Customer {customer_id} not found")
         
-        customer.plan_tier = new_plan
-        customer.subscription_status = SubscriptionStatus.ACTIVE
-        
-        if stripe_customer_id:
-            customer.stripe_customer_id = stripe_customer_id
-        
-        if stripe_subscription_id:
-            customer.stripe_subscription_id = stripe_subscription_id
-        
-        return self.update(customer)
+        return await self.update(replace(
+            customer,
+            plan_tier=new_plan,
+            subscription_status=SubscriptionStatus.ACTIVE,
+            stripe_customer_id=stripe_customer_id or customer.stripe_customer_id,
+            stripe_subscription_id=stripe_subscription_id or customer.stripe_subscription_id,
+        ))
     
-    def suspend(self, customer_id: UUID, reason: Optional[str] = None) -> Customer:
+    async def suspend(self, customer_id: UUID, reason: Optional[str] = None) -> Customer:
         """
         Suspend customer account.
         
@@ -247,15 +438,13 @@ class CustomerRepository:
         Raises:
             ValueError: If customer not found
         """
-        customer = self.get_by_id(customer_id)
+        customer = await self.get_by_id(customer_id)
         if not customer:
             raise ValueError(f"Customer {customer_id} not found")
         
-        customer.status = CustomerStatus.SUSPENDED
-        
-        return self.update(customer)
+        return await self.update(replace(customer, status=CustomerStatus.SUSPENDED))
     
-    def reactivate(self, customer_id: UUID) -> Customer:
+    async def reactivate(self, customer_id: UUID) -> Customer:
         """
         Reactivate suspended customer.
         
@@ -268,15 +457,13 @@ class CustomerRepository:
         Raises:
             ValueError: If customer not found
         """
-        customer = self.get_by_id(customer_id)
+        customer = await self.get_by_id(customer_id)
         if not customer:
             raise ValueError(f"Customer {customer_id} not found")
         
-        customer.status = CustomerStatus.ACTIVE
-        
-        return self.update(customer)
+        return await self.update(replace(customer, status=CustomerStatus.ACTIVE))
     
-    def get_trial_expiring_soon(self, days: int = 3) -> List[Customer]:
+    async def get_trial_expiring_soon(self, days: int = 3) -> List[Customer]:
         """
         Get customers whose trial is expiring soon.
         
@@ -288,52 +475,84 @@ class CustomerRepository:
         Returns:
             List of customers with trials expiring soon
         """
-        cutoff = datetime.utcnow() + timedelta(days=days)
-        
-        expiring = []
-        for customer in self._customers_by_id.values():
-            if (customer.is_on_trial() and 
-                customer.trial_ends_at and 
-                customer.trial_ends_at <= cutoff):
-                expiring.append(customer)
-        
-        return expiring
+        now = datetime.utcnow()
+        cutoff = now + timedelta(days=days)
+        
+        # Still on trial (ends after now) and ending on or before the cutoff
+        expiring = self._trial_index.irange(
+            (now, _MAX_UUID),
+            (cutoff, _MAX_UUID),
+            inclusive=(False, True),
+        )
+        return [self._customers_by_id[cid] for _, cid in expiring]
     
-    def get_payment_failed(self) -> List[Customer]:
+    async def get_payment_failed(self) -> List[Customer]:
         """
         Get customers with failed payments.
         
         Returns:
             List of customers with payment issues
         """
-        return [
-            c for c in self._customers_by_id.values()
-            if c.subscription_status == SubscriptionStatus.PAST_DUE
-        ]
+        past_due = self._by_sub_status.get(SubscriptionStatus.PAST_DUE, _EMPTY)
+        return [self._customers_by_id[cid] for _, cid in past_due]
     
-    def bulk_create(self, customers: List[dict]) -> List[Customer]:
+    async def bulk_create(self, customers: List[dict]) -> List[Customer]:
         """
         Bulk create customers (for testing/seeding).
         
+        Password hashing is CPU-bound and dominates seeding time, so hashes
+        are computed in parallel worker processes, and only for rows whose
+        email isn't already taken. Inserts stay sequential because the
+        in-memory indexes aren't safe for concurrent writes.
+        
         Args:
             customers: List of customer dictionaries
             
         Returns:
             List of created customers
         """
-        created = []
+        from src.api.auth import hash_password
+        
+        # Drop known duplicates (existing or repeated in the batch) before
+        # paying for their password hashes
+        seen: set[str] = set()
+        new_customers = []
         for customer_data in customers:
+            email = customer_data['email'].lower()
+            if email in seen or await self._email_taken(email):
+                continue
+            seen.add(email)
+            new_customers.append(customer_data)
+        customers = new_customers
+        
+        passwords = [customer_data['password'] for customer_data in customers]
+        if len(passwords) > 1:
+            loop = asyncio.get_running_loop()
+            executor = self._get_hash_pool()
+            password_hashes = await asyncio.gather(*(
+                loop.run_in_executor(executor, hash_password, password)
+                for password in passwords
+            ))
+        else:
+            password_hashes = [
+                await asyncio.to_thread(hash_password, password) for password in passwords
+            ]
+        
+        created = []
+        for customer_data, password_hash in zip(customers, password_hashes):
+            customer = Customer.create(
+                email=customer_data['email'],
+                password_hash=password_hash,
+                name=customer_data.get('name'),
+                plan_tier=customer_data.get('plan_tier', PlanTier.FREE),
+            )
             try:
-                customer = self.create(
-                    email=customer_data['email'],
-                    password=customer_data['password'],
-                    name=customer_data.get('name'),
-                    plan_tier=customer_data.get('plan_tier', PlanTier.FREE),
-                )
-                created.append(customer)
-            except ValueError:
-                # Skip duplicates
+                await self._storage.set(customer)
+            except DuplicateEmailError:
+                # Another create() claimed the email while hashes were computed
                 continue
+            self._cache(customer)
+            created.append(customer)
         
         return created
 
@@ -0,0 +1,306 @@
+"""
+Customer Storage - Pluggable persistence backends for customer records.
+
+CustomerRepository keeps its lookup indexes in memory and writes through
+to one of these backends so customers survive process restarts:
+- InMemoryCustomerStorage: no persistence (development/tests)
+- SqliteCustomerStorage: single-instance deployments (requires aiosqlite)
+- RedisCustomerStorage: multi-instance deployments (requires redis)
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID
+import json
+
+from src.domain.customer import Customer, PlanTier, CustomerStatus, SubscriptionStatus
+
+_DATETIME_FIELDS = (
+    "created_at", "updated_at", "last_login_at", "cancelled_at", "trial_ends_at",
+)
+
+
+class DuplicateEmailError(ValueError):
+    """Raised when a customer is stored with an email another customer owns."""
+    pass
+
+
+def customer_to_json(customer: Customer) -> str:
+    """Serialize a customer to a JSON document."""
+    data: Dict[str, Any] = asdict(customer)
+    data["id"] = str(customer.id)
+    data["plan_tier"] = customer.plan_tier.value
+    data["status"] = customer.status.value
+    data["subscription_status"] = (
+        customer.subscription_status.value if customer.subscription_status else None
+    )
+    for name in _DATETIME_FIELDS:
+        value = data[name]
+        data[name] = value.isoformat() if value else None
+    return json.dumps(data)
+
+
+def customer_from_json(raw: str) -> Customer:
+    """Rebuild a customer from a JSON document written by `customer_to_json`."""
+    data = json.loads(raw)
+    data["id"] = UUID(data["id"])
+    data["plan_tier"] = PlanTier(data["plan_tier"])
+    data["status"] = CustomerStatus(data["status"])
+    if data.get("subscription_status"):
+        data["subscription_status"] = SubscriptionStatus(data["subscription_status"])
+    for name in _DATETIME_FIELDS:
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    return Customer(**data)
+
+
+class CustomerStorage(ABC):
+    """Persistence backend for customer records."""
+
+    @abstractmethod
+    async def get(self, customer_id: UUID) -> Optional[Customer]:
+        """Load a customer by ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[Customer]:
+        """Load a customer by email."""
+        pass
+
+    @abstractmethod
+    async def set(self, customer: Customer) -> None:
+        """
+        Insert or update a customer.
+
+        Raises:
+            DuplicateEmailError: If another customer already owns the email
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, customer_id: UUID) -> None:
+        """Remove a customer record."""
+        pass
+
+    @abstractmethod
+    def scan(self) -> AsyncIterator[Customer]:
+        """Iterate over all stored customers."""
+        pass
+
+    async def close(self) -> None:
+        """Release connections held by the backend (no-op by default)."""
+        pass
+
+
+class InMemoryCustomerStorage(CustomerStorage):
+    """Process-local storage. Data is lost on restart."""
+
+    def __init__(self) -> None:
+        self._customers: Dict[UUID, Customer] = {}
+        self._ids_by_email: Dict[str, UUID] = {}
+
+    async def get(self, customer_id: UUID) -> Optional[Customer]:
+        return self._customers.get(customer_id)
+
+    async def get_by_email(self, email: str) -> Optional[Customer]:
+        customer_id = self._ids_by_email.get(email)
+        return self._customers.get(customer_id) if customer_id else None
+
+    async def set(self, customer: Customer) -> None:
+        owner = self._ids_by_email.get(customer.email)
+        if owner is not None and owner != customer.id:
+            raise DuplicateEmailError(f"Customer with email {customer.email} already exists")
+        previous = self._customers.get(customer.id)
+        if previous is not None:
+            self._ids_by_email.pop(previous.email, None)
+        self._customers[customer.id] = customer
+        self._ids_by_email[customer.email] = customer.id
+
+    async def delete(self, customer_id: UUID) -> None:
+        customer = self._customers.pop(customer_id, None)
+        if customer is not None:
+            self._ids_by_email.pop(customer.email, None)
+
+    async def scan(self) -> AsyncIterator[Customer]:
+        for customer in list(self._customers.values()):
+            yield customer
+
+
+class SqliteCustomerStorage(CustomerStorage):
+    """
+    SQLite-backed storage for single-instance deployments.
+
+    Status and plan tier are stored in their own columns so they can be
+    queried directly; the full record lives in `data_json`.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS customers (
+        id TEXT PRIMARY KEY,
+        email TEXT UNIQUE NOT NULL,
+        status TEXT NOT NULL,
+        plan_tier TEXT NOT NULL,
+        data_json TEXT NOT NULL
+    )
+    """
+
+    def __init__(self, path: str = "customers.db"):
+        """
+        Initialize SQLite storage.
+
+        Args:
+            path: Database file path
+        """
+        try:
+            import aiosqlite
+        except ImportError:
+            raise ImportError(
+                "aiosqlite not installed. Install with: pip install aiosqlite"
+            )
+
+        self._aiosqlite = aiosqlite
+        self.path = path
+        self._conn: Optional[Any] = None
+
+    async def _get_conn(self) -> Any:
+        """Open the connection and create the schema on first use."""
+        if self._conn is None:
+            self._conn = await self._aiosqlite.connect(self.path)
+            await self._conn.execute(self._SCHEMA)
+            await self._conn.commit()
+        return self._conn
+
+    async def _fetch_one(self, sql: str, param: str) -> Optional[Customer]:
+        conn = await self._get_conn()
+        async with conn.execute(sql, (param,)) as cursor:
+            row = await cursor.fetchone()
+        return customer_from_json(row[0]) if row else None
+
+    async def get(self, customer_id: UUID) -> Optional[Customer]:
+        return await self._fetch_one(
+            "SELECT data_json FROM customers WHERE id = ?", str(customer_id)
+        )
+
+    async def get_by_email(self, email: str) -> Optional[Customer]:
+        return await self._fetch_one(
+            "SELECT data_json FROM customers WHERE email = ?", email
+        )
+
+    async def set(self, customer: Customer) -> None:
+        conn = await self._get_conn()
+        # Upsert on id only: a clash on the unique email column must fail
+        # rather than silently delete the other customer's row
+        try:
+            await conn.execute(
+                "INSERT INTO customers (id, email, status, plan_tier, data_json) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET email = excluded.email, "
+                "status = excluded.status, plan_tier = excluded.plan_tier, "
+                "data_json = excluded.data_json",
+                (
+                    str(customer.id),
+                    customer.email,
+                    customer.status.value,
+                    customer.plan_tier.value,
+                    customer_to_json(customer),
+                ),
+            )
+        except self._aiosqlite.IntegrityError as e:
+            await conn.rollback()
+            raise DuplicateEmailError(
+                f"Customer with email {customer.email} already exists"
+            ) from e
+        await conn.commit()
+
+    async def delete(self, customer_id: UUID) -> None:
+        conn = await self._get_conn()
+        await conn.execute("DELETE FROM customers WHERE id = ?", (str(customer_id),))
+        await conn.commit()
+
+    async def scan(self) -> AsyncIterator[Customer]:
+        conn = await self._get_conn()
+        async with conn.execute("SELECT data_json FROM customers") as cursor:
+            async for row in cursor:
+                yield customer_from_json(row[0])
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+class RedisCustomerStorage(CustomerStorage):
+    """
+    Redis-backed storage shared by multiple API instances.
+
+    Layout:
+    - customer:{id} -> customer JSON
+    - customer:email:{email} -> id
+    - customers -> set of all ids (for scan)
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0"):
+        """
+        Initialize Redis storage.
+
+        Args:
+            url: Redis connection URL
+        """
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise ImportError(
+                "Redis package not installed. Install with: pip install redis"
+            )
+
+        self.redis: Any = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, customer_id: UUID) -> Optional[Customer]:
+        raw = await self.redis.get(f"customer:{customer_id}")
+        return customer_from_json(raw) if raw else None
+
+    async def get_by_email(self, email: str) -> Optional[Customer]:
+        customer_id = await self.redis.get(f"customer:email:{email}")
+        return await self.get(UUID(customer_id)) if customer_id else None
+
+    async def set(self, customer: Customer) -> None:
+        key = f"customer:{customer.id}"
+        email_key = f"customer:email:{customer.email}"
+        customer_id = str(customer.id)
+        # Claim the email first; NX fails if any customer already holds it
+        claimed = await self.redis.set(email_key, customer_id, nx=True)
+        if not claimed and await self.redis.get(email_key) != customer_id:
+            raise DuplicateEmailError(f"Customer with email {customer.email} already exists")
+
+        previous = await self.redis.get(key)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if previous:
+                old_email = json.loads(previous)["email"]
+                if old_email != customer.email:
+                    pipe.delete(f"customer:email:{old_email}")
+            pipe.set(key, customer_to_json(customer))
+            pipe.sadd("customers", customer_id)
+            await pipe.execute()
+
+    async def delete(self, customer_id: UUID) -> None:
+        customer = await self.get(customer_id)
+        if not customer:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(f"customer:{customer_id}")
+            pipe.delete(f"customer:email:{customer.email}")
+            pipe.srem("customers", str(customer_id))
+            await pipe.execute()
+
+    async def scan(self) -> AsyncIterator[Customer]:
+        async for customer_id in self.redis.sscan_iter("customers"):
+            customer = await self.get(UUID(customer_id))
+            if customer:
+                yield customer
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
@@ -5,12 +5,21 @@ Provides clean interface to Gmail API, returning domain entities
 instead of raw API responses. Implements IGmailClient interface.
 """
 
-from typing import List, Dict, Any, Optional, cast
+from types import MappingProxyType
+from typing import List, Dict, Any, AsyncIterator, Iterator, Mapping, Optional, Tuple, cast
 from datetime import datetime
+from email.parser import BytesParser
+import asyncio
 import contextlib
+import functools
 import importlib.util
+import json
 import os.path
 import pickle
+import time
+import uuid
+
+import httpx
 
 from src.domain.email_thread import (
     EmailMessage,
@@ -19,7 +28,8 @@ from src.domain.email_thread import (
     EmailCategory,
     EmailImportance,
 )
-from src.domain.gmail_interfaces import IGmailClient
+from src.domain.exceptions import GmailAPIError
+from src.domain.gmail_interfaces import BatchResult, IGmailClient
 
 
 def _google_packages_available() -> bool:
@@ -49,6 +59,22 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
 ]
 
+GMAIL_API_HOST = 'https://gmail.googleapis.com'
+GMAIL_API_ROOT = '/gmail/v1/'
+GMAIL_BATCH_URL = f'{GMAIL_API_HOST}/batch/gmail/v1'
+GMAIL_MAX_CONNECTIONS = 20
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+LABELS_CACHE_TTL_SECONDS = 300.0
+PROFILE_CACHE_TTL_SECONDS = 60.0
+GMAIL_BATCH_LIMIT = 100  # sub-requests per /batch call
+GMAIL_BATCH_MODIFY_LIMIT = 1000  # ids per messages.batchModify call
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class GmailClient(IGmailClient):
     """
@@ -79,8 +105,73 @@ class GmailClient(IGmailClient):
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.service: Any = None
+        self._credentials: Any = None
+        self._http: Optional[httpx.AsyncClient] = None
+        # (fetched_at, value...) tuples; label mutations clear _labels_cache
+        self._labels_cache: Optional[
+            Tuple[float, List[Dict[str, Any]], Mapping[str, str]]
+        ] = None
+        self._profile_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self._authenticate()
 
+    async def __aenter__(self) -> 'GmailClient':
+        """Open the pooled HTTP client used by batch operations."""
+        self._get_http()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Close the pooled HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if it was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+        
+        HTTP/2 is used when the `h2` package is installed so concurrent
+        batch requests multiplex over a single TLS connection.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=GMAIL_API_HOST,
+                http2=_HTTP2_AVAILABLE,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=GMAIL_MAX_CONNECTIONS,
+                    max_keepalive_connections=GMAIL_MAX_CONNECTIONS,
+                ),
+            )
+        return self._http
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Bearer token header, refreshing expired credentials first."""
+        creds = self._credentials
+        if not creds.valid:
+            await asyncio.to_thread(creds.refresh, Request())
+        return {'Authorization': f'Bearer {creds.token}'}
+
+    @functools.cached_property
+    def project_id(self) -> str:
+        """
+        Google Cloud project owning the OAuth client.
+        
+        API quota is enforced per project, so this keys shared rate limiting.
+        Falls back to the credentials path when the file can't be read.
+        Read from the credentials file once and cached on the client.
+        """
+        with contextlib.suppress(OSError, ValueError):
+            with open(self.credentials_path) as f:
+                client_config = json.load(f)
+            for section in client_config.values():
+                if isinstance(section, dict) and section.get('project_id'):
+                    return str(section['project_id'])
+        return self.credentials_path
+
     def _ensure_service(self) -> None:
         """Ensure the Gmail `service` is available and authenticated."""
         if self.service is None:
@@ -134,6 +225,7 @@ class GmailClient(IGmailClient):
             with open(self.token_path, 'wb') as token:
                 pickle.dump(creds, token)
         
+        self._credentials = creds
         self.service = build('gmail', 'v1', credentials=creds)
     
     def _parse_email_address(self, raw: str) -> EmailAddress:
@@ -372,7 +464,7 @@ class GmailClient(IGmailClient):
         
         Args:
             query: Gmail search query
-            max_results: Maximum threads to return
+            max_results: Maximum threads to return (0 for no limit)
             
         Returns:
             List of EmailThread domain entities
@@ -409,6 +501,95 @@ class GmailClient(IGmailClient):
         except Exception as e:
             raise Exception(f"Failed to list threads: {str(e)}")
     
+    async def iter_threads(
+        self,
+        query: str = '',
+        label_ids: Optional[List[str]] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[EmailThread]:
+        """
+        Stream threads matching query.
+        
+        The next page is requested before the current one is yielded, so
+        pagination overlaps with whatever the caller does per thread.
+        
+        Args:
+            query: Gmail search query
+            label_ids: Filter by label IDs
+            page_size: Threads per page (max 100, one batch request each)
+            
+        Yields:
+            EmailThread domain entities
+        """
+        page_size = min(page_size, GMAIL_BATCH_LIMIT)
+        next_page: Optional[asyncio.Task] = asyncio.create_task(
+            self._fetch_thread_page(query, label_ids, page_size, None)
+        )
+        try:
+            while next_page is not None:
+                threads, page_token = await next_page
+                next_page = (
+                    asyncio.create_task(
+                        self._fetch_thread_page(query, label_ids, page_size, page_token)
+                    )
+                    if page_token
+                    else None
+                )
+                for thread in threads:
+                    yield thread
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _fetch_thread_page(
+        self,
+        query: str,
+        label_ids: Optional[List[str]],
+        page_size: int,
+        page_token: Optional[str],
+    ) -> Tuple[List[EmailThread], Optional[str]]:
+        """
+        Fetch one page of thread ids, then the full threads in one batch.
+        
+        Returns:
+            Threads on the page and the token for the next page
+        """
+        params: Dict[str, Any] = {'q': query, 'maxResults': page_size}
+        if label_ids:
+            params['labelIds'] = label_ids
+        if page_token:
+            params['pageToken'] = page_token
+
+        try:
+            response = await self._get_http().get(
+                f'{GMAIL_API_ROOT}users/me/threads',
+                params=params,
+                headers=await self._auth_headers(),
+            )
+            response.raise_for_status()
+        except Exception as e:
+            raise Exception(f"Failed to list threads: {str(e)}")
+
+        results = response.json()
+        thread_ids = [ref['id'] for ref in results.get('threads', [])]
+        if not thread_ids:
+            return [], None
+
+        thread_data = await self.batch_execute(
+            [('GET', f'users/me/threads/{tid}?format=full', None) for tid in thread_ids]
+        )
+
+        threads: List[EmailThread] = []
+        for thread_id, data in zip(thread_ids, thread_data):
+            if 'error' in data:
+                raise Exception(f"Failed to get thread {thread_id}: {data['error']}")
+            threads.append(EmailThread(
+                id=thread_id,
+                messages=[self._message_to_domain(msg) for msg in data.get('messages', [])],
+            ))
+
+        return threads, results.get('nextPageToken')
+
     def trash_message(self, message_id: str) -> bool:
         """
         Move message to trash.
@@ -524,16 +705,169 @@ class GmailClient(IGmailClient):
         """Unstar message."""
         self.modify_labels(message_id, remove_labels=['STARRED'])
     
-    def batch_modify_messages(
+    async def batch_execute(
+        self,
+        requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Send up to 100 API calls as one multipart/mixed request.
+        
+        Args:
+            requests: (method, path, body) per sub-request, path relative
+                to the API root
+            
+        Returns:
+            Parsed response body per sub-request, in request order. Failed
+            sub-requests carry an 'error' key.
+            
+        Raises:
+            ValueError: If more than 100 requests are given
+            GmailAPIError: If the batch request itself fails
+        """
+        if not requests:
+            return []
+        if len(requests) > GMAIL_BATCH_LIMIT:
+            raise ValueError(
+                f"Gmail batch requests are limited to {GMAIL_BATCH_LIMIT} calls, "
+                f"got {len(requests)}"
+            )
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for index, (method, path, body) in enumerate(requests):
+            payload = json.dumps(body) if body is not None else ''
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item-{index}>\r\n\r\n"
+                f"{method} {GMAIL_API_ROOT}{path.lstrip('/')} HTTP/1.1\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{payload}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+
+        try:
+            headers = await self._auth_headers()
+            headers['Content-Type'] = f'multipart/mixed; boundary={boundary}'
+            response = await self._get_http().post(
+                GMAIL_BATCH_URL,
+                content=''.join(parts).encode('utf-8'),
+                headers=headers,
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise GmailAPIError(
+                "batch request", str(e), e.response.status_code
+            ) from e
+        except Exception as e:
+            raise GmailAPIError("batch request", str(e)) from e
+
+        return self._parse_batch_response(
+            response.headers.get('Content-Type', ''),
+            response.content,
+            len(requests),
+        )
+
+    def _parse_batch_response(
+        self,
+        content_type: str,
+        content: bytes,
+        expected: int,
+    ) -> List[Dict[str, Any]]:
+        """Split a multipart/mixed batch response into per-request bodies."""
+        missing = {'error': {'code': 0, 'message': 'No response for batch item'}}
+        results: List[Dict[str, Any]] = [dict(missing) for _ in range(expected)]
+
+        envelope = BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode('utf-8') + content
+        )
+        if not envelope.is_multipart():
+            return results
+
+        for position, part in enumerate(cast(List[Any], envelope.get_payload())):
+            content_id = part.get('Content-ID', '')
+            index = position
+            if '-item-' in content_id:
+                with contextlib.suppress(ValueError):
+                    index = int(content_id.rsplit('-', 1)[1].rstrip('>'))
+            if not 0 <= index < expected:
+                continue
+
+            raw = part.get_payload(decode=True) or b''
+            head, _, body = raw.partition(b'\r\n\r\n')
+            status_line = head.split(b'\r\n', 1)[0].decode('utf-8', 'replace')
+            try:
+                status = int(status_line.split()[1])
+            except (IndexError, ValueError):
+                status = 0
+
+            try:
+                parsed = json.loads(body) if body.strip() else {}
+            except ValueError:
+                parsed = {}
+            if status >= 400 or status == 0:
+                parsed.setdefault('error', {'code': status, 'message': status_line})
+            results[index] = parsed
+
+        return results
+
+    async def _batch_run(
+        self,
+        message_ids: List[str],
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> BatchResult:
+        """
+        Apply the same call to every message, 100 messages per round trip.
+        
+        Chunks are submitted concurrently; the connection pool limit caps
+        how many are in flight.
+        
+        Args:
+            message_ids: Messages to act on
+            method: HTTP method
+            path: Path template containing `{id}`
+            body: Request body shared by every sub-request
+            
+        Returns:
+            Dict with 'success' and 'failed' counts
+        """
+        chunks = list(_chunks(message_ids, GMAIL_BATCH_LIMIT))
+        responses = await asyncio.gather(
+            *(
+                self.batch_execute(
+                    [(method, path.format(id=msg_id), body) for msg_id in chunk]
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        results: BatchResult = {'success': 0, 'failed': 0}
+        for chunk, chunk_responses in zip(chunks, responses):
+            if isinstance(chunk_responses, BaseException):
+                results['failed'] += len(chunk)
+                continue
+            for response in chunk_responses:
+                if 'error' in response:
+                    results['failed'] += 1
+                else:
+                    results['success'] += 1
+
+        return results
+
+    async def batch_modify_messages(
         self,
         message_ids: List[str],
         add_labels: Optional[List[str]] = None,
         remove_labels: Optional[List[str]] = None,
-    ) -> Dict[str, int]:
+    ) -> BatchResult:
         """
         Batch modify multiple messages.
         
-        Uses Gmail API batch request for efficiency.
+        Uses messages.batchModify (1000 ids per call), submitting chunks
+        concurrently.
         
         Args:
             message_ids: List of message IDs
@@ -543,31 +877,45 @@ class GmailClient(IGmailClient):
         Returns:
             Dict with 'success' and 'failed' counts
         """
-        results = {'success': 0, 'failed': 0}
-        
-        # Gmail API supports batch requests via batchModify
-        try:
-            self.service.users().messages().batchModify(
-                userId='me',
-                body={
-                    'ids': message_ids,
-                    'addLabelIds': add_labels or [],
-                    'removeLabelIds': remove_labels or [],
-                },
-            ).execute()
-            results['success'] = len(message_ids)
-        except Exception as e:
-            # Fall back to individual modifications if batch fails
-            for msg_id in message_ids:
-                try:
-                    self.modify_labels(msg_id, add_labels, remove_labels)
-                    results['success'] += 1
-                except Exception:
-                    results['failed'] += 1
+        body = {
+            'addLabelIds': add_labels or [],
+            'removeLabelIds': remove_labels or [],
+        }
+        chunk_results = await asyncio.gather(
+            *(
+                self._batch_modify_chunk(chunk, body)
+                for chunk in _chunks(message_ids, GMAIL_BATCH_MODIFY_LIMIT)
+            )
+        )
         
+        results: BatchResult = {'success': 0, 'failed': 0}
+        for chunk_result in chunk_results:
+            results['success'] += chunk_result['success']
+            results['failed'] += chunk_result['failed']
         return results
+
+    async def _batch_modify_chunk(
+        self,
+        message_ids: List[str],
+        body: Dict[str, Any],
+    ) -> BatchResult:
+        """Modify up to 1000 messages with one batchModify call."""
+        try:
+            headers = await self._auth_headers()
+            response = await self._get_http().post(
+                f'{GMAIL_API_ROOT}users/me/messages/batchModify',
+                json={'ids': message_ids, **body},
+                headers=headers,
+            )
+            response.raise_for_status()
+            return BatchResult(success=len(message_ids), failed=0)
+        except Exception:
+            # Fall back to per-message modify calls, batched 100 per request
+            return await self._batch_run(
+                message_ids, 'POST', 'users/me/messages/{id}/modify', body
+            )
     
-    def batch_archive_messages(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_archive_messages(self, message_ids: List[str]) -> BatchResult:
         """
         Archive multiple messages in batch.
         
@@ -577,14 +925,14 @@ class GmailClient(IGmailClient):
         Returns:
             Dict with 'success' and 'failed' counts
         """
-        return self.batch_modify_messages(message_ids, remove_labels=['INBOX'])
+        return await self.batch_modify_messages(message_ids, remove_labels=['INBOX'])
     
-    def batch_trash_messages(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_trash_messages(self, message_ids: List[str]) -> BatchResult:
         """
         Trash multiple messages in batch.
         
-        Note: Gmail API doesn't have batch trash, so this falls back
-        to individual trash operations with progress tracking.
+        Gmail API has no batchTrash call, so individual trash calls are
+        sent through the /batch endpoint, 100 per round trip.
         
         Args:
             message_ids: List of message IDs
@@ -592,23 +940,14 @@ class GmailClient(IGmailClient):
         Returns:
             Dict with 'success' and 'failed' counts
         """
-        results = {'success': 0, 'failed': 0}
-        
-        for msg_id in message_ids:
-            try:
-                self.trash_message(msg_id)
-                results['success'] += 1
-            except Exception:
-                results['failed'] += 1
-        
-        return results
+        return await self._batch_run(message_ids, 'POST', 'users/me/messages/{id}/trash')
 
-    def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
+    async def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
         """Alias to `batch_trash_messages` to satisfy domain interface."""
-        results = self.batch_trash_messages(message_ids)
+        results = await self.batch_trash_messages(message_ids)
         return cast(Dict[str, Any], results)
     
-    def batch_mark_read(self, message_ids: List[str]) -> Dict[str, int]:
+    async def batch_mark_read(self, message_ids: List[str]) -> BatchResult:
         """
         Mark multiple messages as read in batch.
         
@@ -618,15 +957,30 @@ class GmailClient(IGmailClient):
         Returns:
             Dict with 'success' and 'failed' counts
         """
-        return self.batch_modify_messages(message_ids, remove_labels=['UNREAD'])
+        return await self.batch_modify_messages(message_ids, remove_labels=['UNREAD'])
 
     def get_labels(self) -> List[Dict[str, Any]]:
-        """Return list of labels available in the user's mailbox."""
+        """Return list of labels available in the user's mailbox (cached for 5 minutes)."""
+        return self._get_labels_cached()[1]
+
+    def get_label_map(self) -> Mapping[str, str]:
+        """Return label name -> id, built once per labels cache refresh."""
+        return self._get_labels_cached()[2]
+
+    def _get_labels_cached(
+        self,
+    ) -> Tuple[float, List[Dict[str, Any]], Mapping[str, str]]:
+        """Return the labels cache entry, refreshing it once the TTL expires."""
+        if self._labels_cache is not None:
+            if time.monotonic() - self._labels_cache[0] < LABELS_CACHE_TTL_SECONDS:
+                return self._labels_cache
         try:
             self._ensure_service()
             results = cast(Any, self.service).users().labels().list(userId='me').execute()
             labels = cast(List[Dict[str, Any]], results.get('labels', []))
-            return labels
+            label_map = MappingProxyType({label['name']: label['id'] for label in labels})
+            self._labels_cache = (time.monotonic(), labels, label_map)
+            return self._labels_cache
         except Exception as e:
             raise Exception(f"Failed to get labels: {str(e)}")
 
@@ -637,15 +991,21 @@ class GmailClient(IGmailClient):
             body = {"name": name}
             res = cast(Any, self.service).users().labels().create(userId='me', body=body).execute()
             label_id = cast(str, res.get('id', ''))
+            self._labels_cache = None
             return label_id
         except Exception as e:
             raise Exception(f"Failed to create label '{name}': {str(e)}")
 
     def get_profile(self) -> Dict[str, Any]:
-        """Return the user's Gmail profile information."""
+        """Return the user's Gmail profile information (cached for 60 seconds)."""
+        if self._profile_cache is not None:
+            fetched_at, profile = self._profile_cache
+            if time.monotonic() - fetched_at < PROFILE_CACHE_TTL_SECONDS:
+                return profile
         try:
             self._ensure_service()
-            profile = cast(Any, self.service).users().getProfile(userId='me').execute()
-            return cast(Dict[str, Any], profile)
+            profile = cast(Dict[str, Any], cast(Any, self.service).users().getProfile(userId='me').execute())
+            self._profile_cache = (time.monotonic(), profile)
+            return profile
         except Exception as e:
             raise Exception(f"Failed to get profile: {str(e)}")
@@ -5,20 +5,203 @@ Integrates with existing observability infrastructure to track
 cleanup operations, performance, and outcomes. Implements IGmailObservability interface.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Final, List, Optional, Tuple
 from datetime import datetime
+from importlib import resources
+import asyncio
+import functools
+import itertools
+import json
+import time
 
 from src.infrastructure.observability import ObservabilityProvider
 from src.domain.metrics import CleanupRun, CleanupStatus
 from src.domain.gmail_interfaces import IGmailObservability
 
+# Log 1 in N successful Gmail API calls; failures and metrics are never sampled
+API_CALL_LOG_SAMPLE_RATE = 64
+
+# Mailbox gauges are written at most this often; Prometheus only reads the
+# latest value at each scrape, so faster updates are wasted work. Values
+# reported inside a window are held and the latest is written when it ends.
+GAUGE_MIN_INTERVAL_SECONDS = 10.0
+
+# Metric label values for booleans, avoiding str(b).lower() per call
+_BOOL_STR: Final[Dict[bool, str]] = {True: "true", False: "false"}
+
+# Unbounded identifiers: each distinct value creates a new Prometheus time
+# series. They belong in log fields, never in metric labels.
+_HIGH_CARDINALITY_LABELS = frozenset({"user_id", "run_id"})
+
+
+def _sanitize_labels(labels: Dict[str, str]) -> Dict[str, str]:
+    """Drop high-cardinality keys from a metric label set."""
+    if _HIGH_CARDINALITY_LABELS.isdisjoint(labels):
+        return labels
+    return {k: v for k, v in labels.items() if k not in _HIGH_CARDINALITY_LABELS}
+
+
+# Metric label keys, built once. Values are passed positionally and zipped
+# into a dict by the buffer's worker thread, off the caller's path.
+_NO_LABELS: Tuple[str, ...] = ()
+_POLICY_LABELS = ("policy_id",)
+_RUN_LABELS = ("policy_id", "status")
+_START_LABELS = ("policy_id", "dry_run")
+_ACTION_LABELS = ("action_type", "success")
+_ACTION_TYPE_LABELS = ("action_type",)
+_STATUS_LABELS = ("status",)
+_ERROR_TYPE_LABELS = ("error_type",)
+_METHOD_LABELS = ("method",)
+_API_CALL_LABELS = ("method", "success")
+
+# A metric sample: (name, value, label keys, label values)
+MetricSample = Tuple[str, float, Tuple[str, ...], Tuple[Any, ...]]
+
+# Events the buffer never drops, even when full
+_CRITICAL_LEVELS = frozenset({"warning", "error", "critical"})
+
+
+def _materialize(
+    samples: List[MetricSample],
+) -> List[Tuple[str, float, Optional[Dict[str, str]]]]:
+    """Build provider-ready label dicts, stripping high-cardinality keys."""
+    return [
+        (name, value, _sanitize_labels(dict(zip(keys, values))))
+        for name, value, keys, values in samples
+    ]
+
+
+class AsyncObservabilityBuffer:
+    """
+    Bounded queue between cleanup code and the observability provider.
+    
+    Callers enqueue events without blocking; a background task emits them
+    in batches from a worker thread, so a slow log/metrics backend can't
+    stall the event loop. When the queue is full, debug/info logs and
+    metrics are dropped (counted in `dropped`); warnings and errors are
+    emitted inline instead. Outside a running event loop events are
+    emitted immediately.
+    """
+    
+    def __init__(
+        self,
+        provider: ObservabilityProvider,
+        maxsize: int = 8192,
+        batch_size: int = 256,
+    ):
+        """
+        Initialize buffer.
+        
+        Args:
+            provider: Observability provider that receives the events
+            maxsize: Maximum queued events
+            batch_size: Maximum events emitted per worker hand-off
+        """
+        self.provider = provider
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    def put(self, event: Tuple[Any, ...]) -> None:
+        """
+        Enqueue an event.
+        
+        Args:
+            event: ("log", level, message, fields), ("metric", sample) or
+                ("metrics", samples)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._emit(event)
+            return
+        
+        if self._loop is not loop:
+            # The queue and drain task belong to one loop; a new loop (e.g.
+            # a short-lived asyncio.run) gets its own, after emitting
+            # anything stranded on the old one
+            self._emit_stranded()
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._loop = loop
+            self._drain_task = None
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if event[0] == "log" and event[1] in _CRITICAL_LEVELS:
+                self._emit(event)
+            else:
+                self.dropped += 1
+            return
+        
+        # The drain task exits once the queue is empty; restart it on demand
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+    
+    async def flush(self) -> None:
+        """Wait until every queued event has been emitted."""
+        if self._loop is not asyncio.get_running_loop():
+            self._emit_stranded()
+        elif self._queue is not None:
+            await self._queue.join()
+    
+    def _emit_stranded(self) -> None:
+        """Synchronously emit events left queued when their loop went away."""
+        if self._queue is None:
+            return
+        stranded = []
+        while not self._queue.empty():
+            stranded.append(self._queue.get_nowait())
+        if stranded:
+            self._emit_batch(stranded)
+    
+    async def _drain(self) -> None:
+        """Emit queued events in batches until the queue is empty."""
+        queue = self._queue
+        assert queue is not None
+        while not queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._emit_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    def _emit_batch(self, batch: List[Tuple[Any, ...]]) -> None:
+        """Emit a batch of events, folding standalone metrics into one call."""
+        samples: List[MetricSample] = []
+        for event in batch:
+            if event[0] == "metric":
+                samples.append(event[1])
+            elif event[0] == "metrics":
+                samples.extend(event[1])
+            else:
+                self._emit(event)
+        if samples:
+            self.provider.record_metrics(_materialize(samples))
+    
+    def _emit(self, event: Tuple[Any, ...]) -> None:
+        """Send a single event to the provider."""
+        kind = event[0]
+        if kind == "log":
+            self.provider.log(event[1], event[2], event[3])
+        elif kind == "metric":
+            self.provider.record_metrics(_materialize([event[1]]))
+        else:
+            self.provider.record_metrics(_materialize(event[1]))
+
 
 class GmailCleanupObservability(IGmailObservability):
     """
     Observability wrapper for Gmail cleanup operations.
     
     Integrates with existing observability provider to emit
-    metrics and structured logs.
+    metrics and structured logs. Events go through an
+    `AsyncObservabilityBuffer`; call `flush()` before shutdown.
     """
     
     def __init__(self, observability: ObservabilityProvider):
@@ -29,6 +212,39 @@ class GmailCleanupObservability(IGmailObservability):
             observability: Existing observability provider
         """
         self.observability = observability
+        self._buffer = AsyncObservabilityBuffer(observability)
+        self._api_log_sampler = itertools.cycle(range(API_CALL_LOG_SAMPLE_RATE))
+        self._gauges_written_at: Optional[float] = None
+        # Latest (health_score, total_threads) not yet written as gauges
+        self._pending_gauges: Optional[Tuple[float, int]] = None
+        self._gauge_timer: Optional[asyncio.TimerHandle] = None
+    
+    async def flush(self) -> None:
+        """Write held mailbox gauges and wait for all buffered logs and metrics."""
+        self._write_gauges()
+        await self._buffer.flush()
+    
+    def _log(self, level: str, event: str, fields: Dict[str, Any]) -> None:
+        """Queue a structured log entry."""
+        self._buffer.put(("log", level, event, fields))
+    
+    def level_enabled(self, level: str) -> bool:
+        """Return True if the underlying provider would emit ``level`` logs."""
+        return self.observability.level_enabled(level)
+    
+    def _record_metric(
+        self,
+        name: str,
+        value: float,
+        label_keys: Tuple[str, ...] = _NO_LABELS,
+        label_values: Tuple[Any, ...] = (),
+    ) -> None:
+        """Queue a metric; labels are materialized (and sanitized) on emit."""
+        self._buffer.put(("metric", (name, value, label_keys, label_values)))
+    
+    def _record_metrics(self, samples: List[MetricSample]) -> None:
+        """Queue several metrics to be emitted as one provider call."""
+        self._buffer.put(("metrics", samples))
     
     def log_cleanup_started(
         self,
@@ -39,7 +255,7 @@ class GmailCleanupObservability(IGmailObservability):
         policy_name: str = "",
     ) -> None:
         """Log cleanup operation start."""
-        self.observability.log(
+        self._log(
             "info",
             "gmail_cleanup_started",
             {
@@ -51,14 +267,11 @@ class GmailCleanupObservability(IGmailObservability):
             }
         )
         
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_cleanup_starts_total",
             1.0,
-            {
-                "user_id": user_id,
-                "policy_id": policy_id,
-                "dry_run": str(dry_run).lower(),
-            }
+            _START_LABELS,
+            (policy_id, _BOOL_STR[dry_run]),
         )
     
     def log_cleanup_completed(
@@ -74,7 +287,7 @@ class GmailCleanupObservability(IGmailObservability):
             # Full detailed logging with CleanupRun
             summary = run.get_summary()
             
-            self.observability.log(
+            self._log(
                 "info",
                 "gmail_cleanup_completed",
                 {
@@ -91,66 +304,27 @@ class GmailCleanupObservability(IGmailObservability):
                 }
             )
             
-            # Record metrics
-            self.observability.record_metric(
-                "gmail_cleanup_runs_total",
-                1.0,
-                {
-                    "user_id": run.user_id,
-                    "policy_id": run.policy_id,
-                    "status": run.status.value,
-                }
-            )
-            
+            # Record metrics. Per-email counts come from gmail_actions_total
+            # (see log_action_executed), not from per-run totals here.
+            policy = (run.policy_id,)
+            samples: List[MetricSample] = [
+                ("gmail_cleanup_runs_total", 1.0, _RUN_LABELS, (run.policy_id, run.status.value)),
+            ]
             if run.duration_seconds:
-                self.observability.record_metric(
-                    "gmail_cleanup_duration_seconds",
-                    run.duration_seconds,
-                    {
-                        "user_id": run.user_id,
-                        "policy_id": run.policy_id,
-                    }
+                samples.append(
+                    ("gmail_cleanup_duration_seconds", run.duration_seconds, _POLICY_LABELS, policy)
                 )
-            
-            self.observability.record_metric(
-                "gmail_emails_processed_total",
-                float(len(run.actions)),
-                {
-                    "user_id": run.user_id,
-                    "policy_id": run.policy_id,
-                }
-            )
-            
-            self.observability.record_metric(
-                "gmail_emails_deleted_total",
-                float(run.emails_deleted),
-                {
-                    "user_id": run.user_id,
-                    "policy_id": run.policy_id,
-                }
-            )
-            
-            self.observability.record_metric(
-                "gmail_emails_archived_total",
-                float(run.emails_archived),
-                {
-                    "user_id": run.user_id,
-                    "policy_id": run.policy_id,
-                }
-            )
-            
             if run.storage_freed_mb:
-                self.observability.record_metric(
+                samples.append((
                     "gmail_storage_freed_bytes",
                     run.storage_freed_mb * 1024 * 1024,
-                    {
-                        "user_id": run.user_id,
-                        "policy_id": run.policy_id,
-                    }
-                )
+                    _POLICY_LABELS,
+                    policy,
+                ))
+            self._record_metrics(samples)
         else:
             # Simple interface implementation
-            self.observability.log(
+            self._log(
                 "info",
                 "gmail_cleanup_completed",
                 {
@@ -161,11 +335,7 @@ class GmailCleanupObservability(IGmailObservability):
                 }
             )
             
-            self.observability.record_metric(
-                "gmail_cleanup_runs_total",
-                1.0,
-                {"run_id": run_id}
-            )
+            self._record_metric("gmail_cleanup_runs_total", 1.0)
     
     def log_cleanup_error(
         self,
@@ -174,7 +344,7 @@ class GmailCleanupObservability(IGmailObservability):
         error_message: str,
     ) -> None:
         """Log cleanup operation error."""
-        self.observability.log(
+        self._log(
             "error",
             "gmail_cleanup_error",
             {
@@ -184,10 +354,11 @@ class GmailCleanupObservability(IGmailObservability):
             }
         )
         
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_cleanup_errors_total",
             1.0,
-            {"error_type": error_type}
+            _ERROR_TYPE_LABELS,
+            (error_type,),
         )
     
     def record_emails_processed(
@@ -197,13 +368,11 @@ class GmailCleanupObservability(IGmailObservability):
         action_type: str,
     ) -> None:
         """Record number of emails processed."""
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_emails_processed_total",
             float(count),
-            {
-                "user_id": user_id,
-                "action_type": action_type,
-            }
+            _ACTION_TYPE_LABELS,
+            (action_type,),
         )
     
     def record_cleanup_duration(
@@ -213,13 +382,11 @@ class GmailCleanupObservability(IGmailObservability):
         status: str,
     ) -> None:
         """Record cleanup operation duration."""
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_cleanup_duration_seconds",
             duration_seconds,
-            {
-                "user_id": user_id,
-                "status": status,
-            }
+            _STATUS_LABELS,
+            (status,),
         )
     
     def increment_error_count(
@@ -228,13 +395,11 @@ class GmailCleanupObservability(IGmailObservability):
         user_id: str,
     ) -> None:
         """Increment error counter."""
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_cleanup_errors_total",
             1.0,
-            {
-                "error_type": error_type,
-                "user_id": user_id,
-            }
+            _ERROR_TYPE_LABELS,
+            (error_type,),
         )
     
     def log_cleanup_failed(
@@ -245,7 +410,7 @@ class GmailCleanupObservability(IGmailObservability):
         duration_seconds: Optional[float] = None,
     ) -> None:
         """Log cleanup operation failure."""
-        self.observability.log(
+        self._log(
             "error",
             "gmail_cleanup_failed",
             {
@@ -256,13 +421,11 @@ class GmailCleanupObservability(IGmailObservability):
             }
         )
         
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_cleanup_errors_total",
             1.0,
-            {
-                "user_id": user_id,
-                "policy_id": policy_id,
-            }
+            _POLICY_LABELS,
+            (policy_id,),
         )
     
     def log_action_executed(
@@ -272,28 +435,31 @@ class GmailCleanupObservability(IGmailObservability):
         success: bool,
         error: Optional[str] = None,
     ) -> None:
-        """Log individual action execution."""
+        """
+        Log individual action execution.
+        
+        The level is checked per call so filtered-out success logs aren't
+        built; the action counter is always recorded.
+        """
         level = "info" if success else "warning"
         
-        self.observability.log(
-            level,
-            "gmail_action_executed",
-            {
-                "user_id": user_id,
-                "action_type": action_type,
-                "success": success,
-                "error": error,
-            }
-        )
+        if self.level_enabled(level):
+            self._log(
+                level,
+                "gmail_action_executed",
+                {
+                    "user_id": user_id,
+                    "action_type": action_type,
+                    "success": success,
+                    "error": error,
+                }
+            )
         
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_actions_total",
             1.0,
-            {
-                "user_id": user_id,
-                "action_type": action_type,
-                "success": str(success).lower(),
-            }
+            _ACTION_LABELS,
+            (action_type, _BOOL_STR[success]),
         )
     
     def log_analysis_completed(
@@ -303,8 +469,14 @@ class GmailCleanupObservability(IGmailObservability):
         total_actions: int,
         health_score: float,
     ) -> None:
-        """Log inbox analysis completion."""
-        self.observability.log(
+        """
+        Log inbox analysis completion.
+        
+        The log is emitted every time; mailbox gauges are updated at most
+        once per GAUGE_MIN_INTERVAL_SECONDS. Within a window the latest
+        values are held and written when the window ends (or on `flush()`).
+        """
+        self._log(
             "info",
             "gmail_analysis_completed",
             {
@@ -315,17 +487,39 @@ class GmailCleanupObservability(IGmailObservability):
             }
         )
         
-        self.observability.record_metric(
-            "gmail_mailbox_health_score",
-            health_score,
-            {"user_id": user_id}
-        )
+        self._pending_gauges = (health_score, total_threads)
+        if self._gauges_written_at is None:
+            self._write_gauges()
+            return
         
-        self.observability.record_metric(
-            "gmail_mailbox_threads",
-            float(total_threads),
-            {"user_id": user_id}
-        )
+        elapsed = time.monotonic() - self._gauges_written_at
+        if elapsed >= GAUGE_MIN_INTERVAL_SECONDS:
+            self._write_gauges()
+        elif self._gauge_timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to wake us; the next call or flush() writes it
+                return
+            self._gauge_timer = loop.call_later(
+                GAUGE_MIN_INTERVAL_SECONDS - elapsed, self._write_gauges
+            )
+    
+    def _write_gauges(self) -> None:
+        """Write the held mailbox gauges, if any, and start a new window."""
+        if self._gauge_timer is not None:
+            self._gauge_timer.cancel()
+            self._gauge_timer = None
+        if self._pending_gauges is None:
+            return
+        health_score, total_threads = self._pending_gauges
+        self._pending_gauges = None
+        self._gauges_written_at = time.monotonic()
+        
+        self._record_metrics([
+            ("gmail_mailbox_health_score", health_score, _NO_LABELS, ()),
+            ("gmail_mailbox_threads", float(total_threads), _NO_LABELS, ()),
+        ])
     
     def log_gmail_api_call(
         self,
@@ -334,47 +528,47 @@ class GmailCleanupObservability(IGmailObservability):
         success: bool,
         error: Optional[str] = None,
     ) -> None:
-        """Log Gmail API call."""
-        level = "debug" if success else "warning"
+        """
+        Log Gmail API call.
         
-        self.observability.log(
-            level,
-            "gmail_api_call",
-            {
-                "method": method,
-                "duration_seconds": duration_seconds,
-                "success": success,
-                "error": error,
-            }
-        )
+        Successful calls are logged 1 in API_CALL_LOG_SAMPLE_RATE (skipped
+        ones are counted in gmail_api_call_logs_sampled_total); failures
+        are always logged. Metrics are recorded for every call.
+        """
+        samples: List[MetricSample] = [
+            ("gmail_api_calls_total", 1.0, _API_CALL_LABELS, (method, _BOOL_STR[success])),
+            ("gmail_api_duration_seconds", duration_seconds, _METHOD_LABELS, (method,)),
+        ]
         
-        self.observability.record_metric(
-            "gmail_api_calls_total",
-            1.0,
-            {
-                "method": method,
-                "success": str(success).lower(),
-            }
-        )
+        if success and next(self._api_log_sampler) != 0:
+            samples.append(("gmail_api_call_logs_sampled_total", 1.0, _METHOD_LABELS, (method,)))
+        else:
+            self._log(
+                "debug" if success else "warning",
+                "gmail_api_call",
+                {
+                    "method": method,
+                    "duration_seconds": duration_seconds,
+                    "success": success,
+                    "error": error,
+                }
+            )
         
-        self.observability.record_metric(
-            "gmail_api_duration_seconds",
-            duration_seconds,
-            {"method": method}
-        )
+        self._record_metrics(samples)
     
     def log_rate_limit_hit(self, method: str) -> None:
         """Log when Gmail API rate limit is hit."""
-        self.observability.log(
+        self._log(
             "warning",
             "gmail_rate_limit_hit",
             {"method": method}
         )
         
-        self.observability.record_metric(
+        self._record_metric(
             "gmail_rate_limit_hits_total",
             1.0,
-            {"method": method}
+            _METHOD_LABELS,
+            (method,),
         )
 
 
@@ -383,58 +577,48 @@ GMAIL_CLEANUP_METRICS = {
     "gmail_cleanup_starts_total": {
         "type": "counter",
         "description": "Total number of cleanup operations started",
-        "labels": ["user_id", "policy_id", "dry_run"],
+        "labels": ["policy_id", "dry_run"],
     },
     "gmail_cleanup_runs_total": {
         "type": "counter",
         "description": "Total number of cleanup operations completed",
-        "labels": ["user_id", "policy_id", "status"],
+        "labels": ["policy_id", "status"],
     },
     "gmail_cleanup_errors_total": {
         "type": "counter",
         "description": "Total number of cleanup operation failures",
-        "labels": ["user_id", "policy_id"],
+        "labels": ["policy_id"],
     },
     "gmail_cleanup_duration_seconds": {
         "type": "histogram",
         "description": "Cleanup operation duration in seconds",
-        "labels": ["user_id", "policy_id"],
+        "labels": ["policy_id"],
         "buckets": [1, 5, 10, 30, 60, 120, 300],
     },
     "gmail_emails_processed_total": {
         "type": "counter",
-        "description": "Total number of emails processed",
-        "labels": ["user_id", "policy_id"],
-    },
-    "gmail_emails_deleted_total": {
-        "type": "counter",
-        "description": "Total number of emails deleted",
-        "labels": ["user_id", "policy_id"],
-    },
-    "gmail_emails_archived_total": {
-        "type": "counter",
-        "description": "Total number of emails archived",
-        "labels": ["user_id", "policy_id"],
+        "description": "Emails processed in bulk (record_emails_processed)",
+        "labels": ["action_type"],
     },
     "gmail_storage_freed_bytes": {
         "type": "counter",
         "description": "Total storage freed in bytes",
-        "labels": ["user_id", "policy_id"],
+        "labels": ["policy_id"],
     },
     "gmail_actions_total": {
         "type": "counter",
         "description": "Total number of actions executed",
-        "labels": ["user_id", "action_type", "success"],
+        "labels": ["action_type", "success"],
     },
     "gmail_mailbox_health_score": {
         "type": "gauge",
         "description": "Mailbox health score (0-100)",
-        "labels": ["user_id"],
+        "labels": [],
     },
     "gmail_mailbox_threads": {
         "type": "gauge",
         "description": "Total threads in mailbox",
-        "labels": ["user_id"],
+        "labels": [],
     },
     "gmail_api_calls_total": {
         "type": "counter",
@@ -447,6 +631,11 @@ GMAIL_CLEANUP_METRICS = {
         "labels": ["method"],
         "buckets": [0.1, 0.5, 1, 2, 5, 10],
     },
+    "gmail_api_call_logs_sampled_total": {
+        "type": "counter",
+        "description": "Successful Gmail API call logs skipped by sampling",
+        "labels": ["method"],
+    },
     "gmail_rate_limit_hits_total": {
         "type": "counter",
         "description": "Total rate limit hits",
@@ -455,103 +644,32 @@ GMAIL_CLEANUP_METRICS = {
 }
 
 
-# Alert rules for Prometheus (example configuration)
-GMAIL_CLEANUP_ALERTS = """
-groups:
-  - name: gmail_cleanup
-    interval: 1m
-    rules:
-      # High failure rate
-      - alert: GmailCleanupHighFailureRate
-        expr: |
-          rate(gmail_cleanup_errors_total[5m]) > 0.1
-        for: 5m
-        labels:
-          severity: warning
-        annotations:
-          summary: "High Gmail cleanup failure rate"
-          description: "Gmail cleanup is failing at {{ $value }} errors/sec for user {{ $labels.user_id }}"
-      
-      # Slow cleanup operations
-      - alert: GmailCleanupSlow
-        expr: |
-          histogram_quantile(0.95, rate(gmail_cleanup_duration_seconds_bucket[5m])) > 120
-        for: 10m
-        labels:
-          severity: warning
-        annotations:
-          summary: "Gmail cleanup operations are slow"
-          description: "95th percentile cleanup duration is {{ $value }}s"
-      
-      # Rate limit issues
-      - alert: GmailRateLimitHit
-        expr: |
-          rate(gmail_rate_limit_hits_total[5m]) > 0.01
-        for: 5m
-        labels:
-          severity: warning
-        annotations:
-          summary: "Gmail API rate limit being hit"
-          description: "Rate limit hits detected for {{ $labels.method }}"
-      
-      # Low mailbox health
-      - alert: GmailLowMailboxHealth
-        expr: |
-          gmail_mailbox_health_score < 50
-        for: 1h
-        labels:
-          severity: info
-        annotations:
-          summary: "Low mailbox health score"
-          description: "Mailbox health for {{ $labels.user_id }} is {{ $value }}/100"
-"""
+@functools.cache
+def get_alert_rules() -> Dict[str, Any]:
+    """
+    Prometheus alert rules for Gmail cleanup (example configuration).
+    
+    Parsed from the packaged gmail_cleanup_alerts.yaml on first call and
+    cached afterwards; treat the result as read-only.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "PyYAML not installed. Install with: pip install pyyaml"
+        )
+    
+    text = resources.files(__package__).joinpath("gmail_cleanup_alerts.yaml").read_text()
+    return yaml.safe_load(text)
 
 
-# Grafana dashboard configuration (example JSON)
-GRAFANA_DASHBOARD_CONFIG = """
-{
-  "dashboard": {
-    "title": "Gmail Cleanup Monitoring",
-    "panels": [
-      {
-        "title": "Cleanup Operations",
-        "targets": [
-          {"expr": "rate(gmail_cleanup_runs_total[5m])"}
-        ]
-      },
-      {
-        "title": "Success Rate",
-        "targets": [
-          {"expr": "rate(gmail_cleanup_runs_total{status='completed'}[5m]) / rate(gmail_cleanup_runs_total[5m])"}
-        ]
-      },
-      {
-        "title": "Emails Processed",
-        "targets": [
-          {"expr": "rate(gmail_emails_processed_total[5m])"},
-          {"expr": "rate(gmail_emails_deleted_total[5m])"},
-          {"expr": "rate(gmail_emails_archived_total[5m])"}
-        ]
-      },
-      {
-        "title": "Cleanup Duration (p95)",
-        "targets": [
-          {"expr": "histogram_quantile(0.95, rate(gmail_cleanup_duration_seconds_bucket[5m]))"}
-        ]
-      },
-      {
-        "title": "Storage Freed",
-        "targets": [
-          {"expr": "rate(gmail_storage_freed_bytes[5m]) / 1024 / 1024"}
-        ]
-      },
-      {
-        "title": "Mailbox Health Score",
-        "targets": [
-          {"expr": "gmail_mailbox_health_score"}
-        ]
-      }
-    ]
-  }
-}
-"""
+@functools.cache
+def get_dashboard_config() -> Dict[str, Any]:
+    """
+    Grafana dashboard for Gmail cleanup (example JSON).
+    
+    Parsed from the packaged gmail_cleanup_dashboard.json on first call and
+    cached afterwards; treat the result as read-only.
+    """
+    text = resources.files(__package__).joinpath("gmail_cleanup_dashboard.json").read_text()
+    return json.loads(text)
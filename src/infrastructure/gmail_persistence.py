@@ -4,12 +4,18 @@ Persistence Layer for Gmail Cleanup - Database storage.
 Stores cleanup policies, runs, and audit trails.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+import functools
+import itertools
 import json
 import asyncio
 import uuid
 
+from sortedcontainers import SortedKeyList
+
 try:
     import asyncpg
     ASYNCPG_AVAILABLE = True
@@ -17,6 +23,20 @@ except ImportError:
     ASYNCPG_AVAILABLE = False
     asyncpg = None  # type: ignore
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 from src.domain.cleanup_policy import (
     CleanupPolicy,
     CleanupRule,
@@ -26,6 +46,216 @@ from src.domain.cleanup_policy import (
     LabelingRule,
 )
 from src.domain.metrics import CleanupRun, CleanupStatus, CleanupAction as MetricAction, ActionStatus
+from src.domain.email_thread import (
+    EmailAddress,
+    EmailCategory,
+    EmailImportance,
+    EmailMessage,
+    EmailThread,
+    MailboxSnapshot,
+)
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder fallback for datetimes and enums in stored documents."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode a document as UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        # orjson handles datetimes and enums natively (same ISO format)
+        return orjson.dumps(value, default=_json_default)
+    return json.dumps(value, default=_json_default).encode()
+
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+# JSONB binary wire format: a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_VERSION + _json_dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return _json_loads(data[1:])
+
+
+async def _init_connection(conn: Any) -> None:
+    """
+    Per-connection setup: exchange JSONB in binary as Python objects.
+    
+    Query parameters and COPY records pass dicts/lists straight through and
+    rows come back decoded, with no intermediate str.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+# Enum lookups for stored policies; unknown values fall back to defaults
+_COND_BY_VALUE = {c.value: c for c in RuleCondition}
+_ACTION_BY_VALUE = {a.value: a for a in CleanupAction}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_datetime(val: Any) -> datetime:
+    """Parse a stored policy timestamp, defaulting to now when missing/invalid."""
+    if isinstance(val, datetime):
+        return val
+    if isinstance(val, str):
+        parsed = _parse_iso(val)
+        if parsed is not None:
+            return parsed
+    return datetime.utcnow()
+
+
+def _parse_dt(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp written by `_json_default`."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _snapshot_summary(snapshot: MailboxSnapshot) -> Dict[str, Any]:
+    """Queryable top-level snapshot fields, without the per-thread payload."""
+    return {
+        "user_id": snapshot.user_id,
+        "captured_at": snapshot.captured_at,
+        "total_messages": snapshot.total_messages,
+        "total_threads": snapshot.total_threads,
+        "metadata": snapshot.metadata,
+    }
+
+
+def _encode_snapshots(
+    run: CleanupRun,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[bytes]]:
+    """
+    Encode run snapshots as (before JSONB, after JSONB, compressed blob).
+    
+    With zstandard installed the full snapshots (threads included) go into
+    a single zstd-compressed blob and the JSONB columns keep only summary
+    fields; otherwise the full snapshots are stored as JSONB.
+    """
+    before, after = run.before_snapshot, run.after_snapshot
+    if not ZSTD_AVAILABLE:
+        return (
+            asdict(before) if before else None,
+            asdict(after) if after else None,
+            None,
+        )
+    
+    payload = {
+        "before": asdict(before) if before else None,
+        "after": asdict(after) if after else None,
+    }
+    blob = zstandard.ZstdCompressor(level=3).compress(_json_dumps(payload))
+    return (
+        _snapshot_summary(before) if before else None,
+        _snapshot_summary(after) if after else None,
+        blob,
+    )
+
+
+def _decode_snapshots(
+    row: Any,
+) -> Tuple[Optional[MailboxSnapshot], Optional[MailboxSnapshot]]:
+    """Rebuild (before, after) snapshots from a gmail_cleanup_runs row."""
+    blob = row["snapshot_blob"]
+    if blob is not None:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(
+                "Run snapshots are zstd-compressed. Install with: pip install zstandard"
+            )
+        payload = _json_loads(zstandard.ZstdDecompressor().decompress(blob))
+        before, after = payload["before"], payload["after"]
+    else:
+        before, after = row["before_snapshot"], row["after_snapshot"]
+    return (
+        _snapshot_from_dict(before) if before else None,
+        _snapshot_from_dict(after) if after else None,
+    )
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Naive-UTC (or aware) datetime to integer microseconds since the epoch."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime:
+    """Inverse of `_to_epoch_us`, returning a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _address_from_dict(data: Dict[str, Any]) -> EmailAddress:
+    return EmailAddress(address=data["address"], name=data.get("name"))
+
+
+def _snapshot_from_dict(data: Dict[str, Any]) -> MailboxSnapshot:
+    """Rebuild a MailboxSnapshot from `asdict(snapshot)` output."""
+    threads = [
+        EmailThread(
+            id=thread["id"],
+            messages=[
+                EmailMessage(
+                    id=msg["id"],
+                    thread_id=msg["thread_id"],
+                    subject=msg["subject"],
+                    from_address=_address_from_dict(msg["from_address"]),
+                    to_addresses=[_address_from_dict(a) for a in msg["to_addresses"]],
+                    cc_addresses=[_address_from_dict(a) for a in msg.get("cc_addresses", [])],
+                    date=_parse_dt(msg["date"]) or datetime.utcnow(),
+                    snippet=msg.get("snippet", ""),
+                    labels=msg.get("labels", []),
+                    size_bytes=msg.get("size_bytes", 0),
+                    has_attachments=msg.get("has_attachments", False),
+                    is_unread=msg.get("is_unread", False),
+                    is_starred=msg.get("is_starred", False),
+                    category=EmailCategory(msg.get("category", EmailCategory.UNKNOWN.value)),
+                    importance=EmailImportance(msg.get("importance", EmailImportance.MEDIUM.value)),
+                )
+                for msg in thread["messages"]
+            ],
+            snippet=thread.get("snippet", ""),
+            labels=thread.get("labels", []),
+        )
+        for thread in data.get("threads", [])
+    ]
+    return MailboxSnapshot(
+        user_id=data["user_id"],
+        captured_at=_parse_dt(data["captured_at"]) or datetime.utcnow(),
+        threads=threads,
+        total_messages=data.get("total_messages", 0),
+        total_threads=data.get("total_threads", 0),
+        metadata=data.get("metadata", {}),
+    )
+
+
+# Keyset pagination cursor: (started_at, run_id) of the last run on a page
+RunCursor = Tuple[datetime, str]
 
 
 class GmailCleanupRepository:
@@ -40,12 +270,17 @@ class GmailCleanupRepository:
         """Save or update cleanup policy."""
         raise NotImplementedError
     
+    async def save_policies(self, policies: List[CleanupPolicy]) -> None:
+        """Save or update several cleanup policies."""
+        for policy in policies:
+            await self.save_policy(policy)
+    
     async def get_policy(self, user_id: str, policy_id: str) -> Optional[CleanupPolicy]:
         """Retrieve cleanup policy."""
         raise NotImplementedError
     
-    async def list_policies(self, user_id: str) -> List[CleanupPolicy]:
-        """List all policies for a user."""
+    async def list_policies(self, user_id: str) -> Sequence[CleanupPolicy]:
+        """List all policies for a user (treat the result as read-only)."""
         raise NotImplementedError
     
     async def delete_policy(self, user_id: str, policy_id: str) -> None:
@@ -66,7 +301,38 @@ class GmailCleanupRepository:
         limit: int = 10,
         offset: int = 0,
     ) -> List[CleanupRun]:
-        """List cleanup runs for a user."""
+        """
+        List cleanup runs for a user, most recent first.
+        
+        Backends may return summary runs without snapshots or actions;
+        use get_run to load a run in full. OFFSET cost grows with the
+        offset; prefer list_runs_page for deep pagination.
+        """
+        raise NotImplementedError
+    
+    async def list_runs_page(
+        self,
+        user_id: str,
+        limit: int = 10,
+        cursor: Optional[RunCursor] = None,
+    ) -> Tuple[List[CleanupRun], Optional[RunCursor]]:
+        """
+        List cleanup runs with keyset pagination, most recent first.
+        
+        Runs are ordered by (started_at, run id) descending; the run id
+        breaks ties so runs sharing a start time are never skipped at a
+        page boundary.
+        
+        Args:
+            user_id: User whose runs to list
+            limit: Page size
+            cursor: `next_cursor` from the previous page (None for the first)
+            
+        Returns:
+            (runs ordered after `cursor`, next_cursor). next_cursor is a
+            (started_at, run_id) pair, or None once the last page has been
+            returned.
+        """
         raise NotImplementedError
     
     async def get_run_count(self, user_id: str) -> int:
@@ -74,16 +340,41 @@ class GmailCleanupRepository:
         raise NotImplementedError
 
 
+def _next_cursor(runs: List[CleanupRun], limit: int) -> Optional[RunCursor]:
+    """Keyset cursor for the page after `runs` (None when it was the last)."""
+    if runs and len(runs) == limit:
+        return runs[-1].started_at, runs[-1].id
+    return None
+
+
+def _run_key(run: CleanupRun) -> Tuple[int, str]:
+    """Sort key (started_at_us, run_id), matching the Postgres keyset order."""
+    return _to_epoch_us(run.started_at), run.id
+
+
 class InMemoryGmailCleanupRepository(GmailCleanupRepository):
     """
     In-memory implementation for testing and development.
     
-    Data is lost when process restarts.
+    Data is lost when process restarts. Run history is capped at
+    `max_runs_per_user` per user; saving past the cap evicts the oldest run.
     """
     
-    def __init__(self) -> None:
+    def __init__(self, max_runs_per_user: int = 10_000) -> None:
+        """
+        Initialize in-memory repository.
+        
+        Args:
+            max_runs_per_user: Most runs kept per user before the oldest is evicted
+        """
+        self.max_runs_per_user = max_runs_per_user
         self._policies: Dict[str, Dict[str, CleanupPolicy]] = {}  # {user_id: {policy_id: CleanupPolicy}}
-        self._runs: Dict[str, List[CleanupRun]] = {}  # {user_id: [CleanupRun]}
+        self._runs: Dict[str, SortedKeyList] = {}  # {user_id: [CleanupRun]}, oldest first
+        self._runs_by_id: Dict[str, CleanupRun] = {}  # {run_id: CleanupRun}
+        # {run_id: sort key it was stored under}; runs may be mutated after saving
+        self._run_keys: Dict[str, Tuple[int, str]] = {}
+        # {user_id: policies}; rebuilt on the next read after a write
+        self._policies_snapshot: Dict[str, Tuple[CleanupPolicy, ...]] = {}
     
     async def save_policy(self, policy: CleanupPolicy) -> None:
         """Save or update cleanup policy."""
@@ -92,39 +383,60 @@ class InMemoryGmailCleanupRepository(GmailCleanupRepository):
         
         policy.updated_at = datetime.utcnow()
         self._policies[policy.user_id][policy.id] = policy
+        self._policies_snapshot.pop(policy.user_id, None)
     
     async def get_policy(self, user_id: str, policy_id: str) -> Optional[CleanupPolicy]:
         """Retrieve cleanup policy."""
         user_policies = self._policies.get(user_id, {})
         return user_policies.get(policy_id)
     
-    async def list_policies(self, user_id: str) -> List[CleanupPolicy]:
+    async def list_policies(self, user_id: str) -> Sequence[CleanupPolicy]:
         """List all policies for a user."""
-        user_policies = self._policies.get(user_id, {})
-        return list(user_policies.values())
+        snapshot = self._policies_snapshot.get(user_id)
+        if snapshot is None:
+            snapshot = tuple(self._policies.get(user_id, {}).values())
+            self._policies_snapshot[user_id] = snapshot
+        return snapshot
     
     async def delete_policy(self, user_id: str, policy_id: str) -> None:
         """Delete cleanup policy."""
         if user_id in self._policies and policy_id in self._policies[user_id]:
             del self._policies[user_id][policy_id]
+            self._policies_snapshot.pop(user_id, None)
     
     async def save_run(self, run: CleanupRun) -> None:
-        """Save cleanup run."""
+        """Save cleanup run, replacing any earlier save of the same run."""
+        previous = self._runs_by_id.get(run.id)
+        if previous is not None:
+            self._discard_run(previous)
+        
         if run.user_id not in self._runs:
-            self._runs[run.user_id] = []
+            self._runs[run.user_id] = SortedKeyList(key=_run_key)
         
-        self._runs[run.user_id].append(run)
+        # O(log N) insert keeps runs ordered by (started_at, id); reads
+        # walk the list in reverse for most recent first
+        user_runs = self._runs[run.user_id]
+        user_runs.add(run)
+        self._runs_by_id[run.id] = run
+        self._run_keys[run.id] = _run_key(run)
         
-        # Sort by started_at (most recent first)
-        self._runs[run.user_id].sort(key=lambda r: r.started_at, reverse=True)
+        if len(user_runs) > self.max_runs_per_user:
+            self._discard_run(user_runs[0])
+    
+    def _discard_run(self, run: CleanupRun) -> None:
+        """Remove a stored run, locating it by the key it was saved under."""
+        user_runs = self._runs[run.user_id]
+        index = user_runs.bisect_key_left(self._run_keys.pop(run.id))
+        while user_runs[index] is not run:
+            index += 1
+        del user_runs[index]
+        del self._runs_by_id[run.id]
     
     async def get_run(self, user_id: str, run_id: str) -> Optional[CleanupRun]:
         """Retrieve cleanup run."""
-        user_runs = self._runs.get(user_id, [])
-        for run in user_runs:
-            if run.id == run_id:
-                return run
-        return None
+        run = self._runs_by_id.get(run_id)
+        # Check ownership so one user can never read another user's run
+        return run if run and run.user_id == user_id else None
     
     async def list_runs(
         self,
@@ -133,14 +445,116 @@ class InMemoryGmailCleanupRepository(GmailCleanupRepository):
         offset: int = 0,
     ) -> List[CleanupRun]:
         """List cleanup runs for a user."""
-        user_runs = self._runs.get(user_id, [])
-        return user_runs[offset:offset + limit]
+        user_runs = self._runs.get(user_id)
+        if user_runs is None:
+            return []
+        stop = len(user_runs) - offset
+        if stop <= 0 or limit <= 0:
+            return []
+        return list(user_runs.islice(max(stop - limit, 0), stop, reverse=True))
+    
+    async def list_runs_page(
+        self,
+        user_id: str,
+        limit: int = 10,
+        cursor: Optional[RunCursor] = None,
+    ) -> Tuple[List[CleanupRun], Optional[RunCursor]]:
+        """List cleanup runs with keyset pagination."""
+        user_runs = self._runs.get(user_id)
+        if user_runs is None:
+            return [], None
+        max_key = None if cursor is None else (_to_epoch_us(cursor[0]), cursor[1])
+        older = user_runs.irange_key(max_key=max_key, inclusive=(True, False), reverse=True)
+        runs = list(itertools.islice(older, limit))
+        return runs, _next_cursor(runs, limit)
     
     async def get_run_count(self, user_id: str) -> int:
         """Get total run count for user."""
         return len(self._runs.get(user_id, []))
 
 
+# updated_at is set by the database (UTC, like the rest of the schema);
+# reads take it from the column rather than the stored config
+_UPSERT_POLICY_SQL = """
+    INSERT INTO gmail_cleanup_policies (
+        user_id, policy_id, name, description, config, enabled, created_at, updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, NOW() AT TIME ZONE 'UTC')
+    ON CONFLICT (user_id, policy_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        config = EXCLUDED.config,
+        enabled = EXCLUDED.enabled,
+        updated_at = NOW() AT TIME ZONE 'UTC'
+"""
+
+# gmail_cleanup_runs columns read by list views; all live in idx_runs_started
+_RUN_SUMMARY_COLUMNS = (
+    "run_id, user_id, policy_id, policy_name, dry_run, status, started_at_us, completed_at"
+)
+
+# gmail_cleanup_actions columns written by save_run, in record order
+_ACTION_COLUMNS = [
+    "run_id", "action_id", "thread_id", "message_id", "action_type",
+    "action_params", "status", "error_message", "executed_at",
+    "message_subject", "message_from", "message_date",
+]
+_INSERT_ACTION_SQL = (
+    f"INSERT INTO gmail_cleanup_actions ({', '.join(_ACTION_COLUMNS)}) "
+    f"VALUES ({', '.join(f'${i}' for i in range(1, len(_ACTION_COLUMNS) + 1))})"
+)
+
+# Runs with at least this many actions are written with COPY
+COPY_MIN_ACTIONS = 100
+
+# Most runs the background writer commits in one transaction
+SAVE_RUN_BATCH_SIZE = 50
+
+_UPSERT_RUN_SQL = """
+    INSERT INTO gmail_cleanup_runs (
+        run_id, user_id, policy_id, policy_name, dry_run, status,
+        error_message, started_at_us, completed_at, duration_seconds,
+        before_snapshot, after_snapshot, snapshot_blob,
+        agent_session_id, agent_model, agent_prompts
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+    ON CONFLICT (run_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        error_message = EXCLUDED.error_message,
+        completed_at = EXCLUDED.completed_at,
+        duration_seconds = EXCLUDED.duration_seconds,
+        before_snapshot = EXCLUDED.before_snapshot,
+        after_snapshot = EXCLUDED.after_snapshot,
+        snapshot_blob = EXCLUDED.snapshot_blob,
+        agent_session_id = EXCLUDED.agent_session_id,
+        agent_model = EXCLUDED.agent_model,
+        agent_prompts = EXCLUDED.agent_prompts
+"""
+
+
+def _run_to_record(run: CleanupRun) -> Tuple[Any, ...]:
+    """Build the _UPSERT_RUN_SQL parameters for a run."""
+    before_json, after_json, snapshot_blob = _encode_snapshots(run)
+    return (
+        run.id,
+        run.user_id,
+        run.policy_id,
+        run.policy_name,
+        run.dry_run,
+        run.status.value,
+        run.error_message,
+        _to_epoch_us(run.started_at),
+        run.completed_at,
+        run.duration_seconds,
+        before_json,
+        after_json,
+        snapshot_blob,
+        run.agent_session_id,
+        run.agent_model,
+        run.agent_prompts,
+    )
+
+
 class PostgresGmailCleanupRepository(GmailCleanupRepository):
     """
     PostgreSQL implementation with asyncpg.
@@ -151,35 +565,66 @@ class PostgresGmailCleanupRepository(GmailCleanupRepository):
     - cleanup_actions: Stores individual actions (audit trail)
     """
     
-    def __init__(self, connection_string: str):
+    def __init__(
+        self,
+        connection_string: str,
+        pool_min_size: int = 10,
+        pool_max_size: int = 50,
+        max_inactive_connection_lifetime: float = 300.0,
+        max_queries: int = 50_000,
+    ):
         """
         Initialize Postgres repository.
         
         Args:
             connection_string: PostgreSQL connection string
+            pool_min_size: Connections opened up front (steady-state concurrency)
+            pool_max_size: Upper bound on pooled connections (peak concurrency)
+            max_inactive_connection_lifetime: Seconds before an idle connection is closed
+            max_queries: Queries served by a connection before it is replaced
         """
         if not ASYNCPG_AVAILABLE:
             raise RuntimeError("asyncpg not installed. Install with: pip install asyncpg")
         
         self.connection_string = connection_string
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.max_queries = max_queries
         self._pool: Optional[Any] = None  # asyncpg.Pool when available
         self._pool_lock = asyncio.Lock()
+        # (run, future) pairs waiting for the background writer
+        self._save_run_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def _get_pool(self) -> Any:  # Returns asyncpg.Pool
         """Get or create connection pool."""
         if self._pool is None:
             async with self._pool_lock:
                 if self._pool is None:
+                    # asyncpg prepares every statement it runs and keeps it
+                    # in a per-connection LRU, so repeated queries skip
+                    # parse/plan after the first call on each connection.
                     self._pool = await asyncpg.create_pool(
                         self.connection_string,
-                        min_size=2,
-                        max_size=10,
+                        min_size=self.pool_min_size,
+                        max_size=self.pool_max_size,
+                        max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                        max_queries=self.max_queries,
                         command_timeout=60,
+                        statement_cache_size=1024,
+                        max_cached_statement_lifetime=0,
+                        init=_init_connection,
                     )
         return self._pool
     
     async def close(self) -> None:
-        """Close connection pool."""
+        """Flush queued runs and close connection pool."""
+        if self._writer_task is not None:
+            if not self._writer_task.done():
+                await self._save_run_queue.join()
+            self._writer_task.cancel()
+            self._writer_task = None
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -240,28 +685,10 @@ class PostgresGmailCleanupRepository(GmailCleanupRepository):
     
     def _dict_to_policy(self, data: Dict[str, Any]) -> CleanupPolicy:
         """Convert dict from storage to policy."""
-        def _parse_datetime(val: Any) -> datetime:
-            if isinstance(val, datetime):
-                return val
-            if isinstance(val, str):
-                try:
-                    return datetime.fromisoformat(val)
-                except Exception:
-                    return datetime.utcnow()
-            return datetime.utcnow()
-
         rules: List[CleanupRule] = []
         for rule_data in data.get("cleanup_rules", []):
-            cond = rule_data.get("condition_type")
-            try:
-                cond_enum = RuleCondition(cond) if cond else RuleCondition.SENDER_MATCHES
-            except Exception:
-                cond_enum = RuleCondition.SENDER_MATCHES
-
-            try:
-                action_enum = CleanupAction(rule_data.get("action")) if rule_data.get("action") else CleanupAction.SKIP
-            except Exception:
-                action_enum = CleanupAction.SKIP
+            cond_enum = _COND_BY_VALUE.get(rule_data.get("condition_type"), RuleCondition.SENDER_MATCHES)
+            action_enum = _ACTION_BY_VALUE.get(rule_data.get("action"), CleanupAction.SKIP)
 
             rules.append(CleanupRule(
                 id=rule_data.get("id", str(uuid.uuid4())),
@@ -307,63 +734,185 @@ class PostgresGmailCleanupRepository(GmailCleanupRepository):
     
     async def save_policy(self, policy: CleanupPolicy) -> None:
         """Save or update cleanup policy."""
+        await self.save_policies([policy])
+    
+    async def save_policies(self, policies: List[CleanupPolicy]) -> None:
+        """Save or update several cleanup policies in one round-trip."""
+        if not policies:
+            return
         pool = await self._get_pool()
-        policy_dict = self._policy_to_dict(policy)
-        
         async with pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO cleanup_policies (
-                    id, user_id, name, rules, retention, dry_run, created_at, updated_at
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                ON CONFLICT (id) DO UPDATE SET
-                    name = EXCLUDED.name,
-                    rules = EXCLUDED.rules,
-                    retention = EXCLUDED.retention,
-                    dry_run = EXCLUDED.dry_run,
-                    updated_at = EXCLUDED.updated_at
-            """,
-                policy_dict["id"],
-                policy_dict["user_id"],
-                policy_dict["name"],
-                json.dumps(policy_dict["rules"]),
-                json.dumps(policy_dict["retention"]) if policy_dict["retention"] else None,
-                policy_dict["dry_run"],
-                policy_dict["created_at"],
-                policy_dict["updated_at"] or datetime.utcnow(),
+            # executemany binds every row against one prepared statement
+            await conn.executemany(
+                _UPSERT_POLICY_SQL,
+                [self._policy_to_record(policy) for policy in policies],
             )
     
+    def _row_to_policy(self, row: Any) -> CleanupPolicy:
+        """Build a policy from a (config, updated_at) row."""
+        policy = self._dict_to_policy(row["config"])
+        policy.updated_at = row["updated_at"]
+        return policy
+    
+    def _policy_to_record(self, policy: CleanupPolicy) -> Tuple[Any, ...]:
+        """Convert a policy to `_UPSERT_POLICY_SQL` arguments."""
+        policy_dict = self._policy_to_dict(policy)
+        return (
+            policy.user_id,
+            policy.id,
+            policy.name,
+            policy_dict["description"],
+            policy_dict,
+            policy_dict["enabled"],
+            policy.created_at,
+        )
+    
     async def get_policy(self, user_id: str, policy_id: str) -> Optional[CleanupPolicy]:
         """Retrieve cleanup policy."""
-        # TODO: Implement Postgres get
-        # SELECT * FROM gmail_cleanup_policies WHERE user_id = ? AND policy_id = ?
-        raise NotImplementedError("Postgres implementation pending")
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT config, updated_at FROM gmail_cleanup_policies "
+                "WHERE user_id = $1 AND policy_id = $2",
+                user_id,
+                policy_id,
+            )
+        return self._row_to_policy(row) if row else None
     
     async def list_policies(self, user_id: str) -> List[CleanupPolicy]:
         """List all policies for a user."""
-        # TODO: Implement Postgres list
-        # SELECT * FROM gmail_cleanup_policies WHERE user_id = ?
-        raise NotImplementedError("Postgres implementation pending")
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT config, updated_at FROM gmail_cleanup_policies "
+                "WHERE user_id = $1 ORDER BY created_at",
+                user_id,
+            )
+        return [self._row_to_policy(row) for row in rows]
     
     async def delete_policy(self, user_id: str, policy_id: str) -> None:
         """Delete cleanup policy."""
-        # TODO: Implement Postgres delete
-        # DELETE FROM gmail_cleanup_policies WHERE user_id = ? AND policy_id = ?
-        raise NotImplementedError("Postgres implementation pending")
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "DELETE FROM gmail_cleanup_policies WHERE user_id = $1 AND policy_id = $2",
+                user_id,
+                policy_id,
+            )
     
     async def save_run(self, run: CleanupRun) -> None:
-        """Save cleanup run."""
-        # TODO: Implement Postgres save
-        # INSERT INTO gmail_cleanup_runs (run_id, user_id, policy_id, ...)
-        # INSERT INTO gmail_cleanup_actions (run_id, message_id, action_type, ...)
-        raise NotImplementedError("Postgres implementation pending")
+        """
+        Save cleanup run and its actions.
+        
+        Runs are handed to a background writer that commits everything
+        queued at that moment in one transaction, so concurrent saves share
+        a round trip and a commit. Returns once the run is durable. Saving
+        the same run again replaces its actions, so callers may persist
+        progress incrementally.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            # Queue and task belong to the running loop
+            self._save_run_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._run_writer())
+        future = asyncio.get_running_loop().create_future()
+        self._save_run_queue.put_nowait((run, future))
+        await future
+    
+    async def _run_writer(self) -> None:
+        """Drain the save queue in batches of up to SAVE_RUN_BATCH_SIZE runs."""
+        queue = self._save_run_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < SAVE_RUN_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # e.g. the pool could not be opened; fail the waiting callers
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _write_batch(self, batch: List[Tuple[CleanupRun, asyncio.Future]]) -> None:
+        """Write a batch and resolve its futures."""
+        # Keep only the latest save of a run queued more than once
+        runs = list({run.id: run for run, _ in batch}.values())
+        pool = await self._get_pool()
+        try:
+            async with pool.acquire() as conn:
+                await self._write_runs(conn, runs)
+        except Exception as batch_error:
+            if len(runs) == 1:
+                failed = {runs[0].id: batch_error}
+            else:
+                # Retry one by one so a single bad run does not fail the batch
+                failed = {}
+                async with pool.acquire() as conn:
+                    for run in runs:
+                        try:
+                            await self._write_runs(conn, [run])
+                        except Exception as e:
+                            failed[run.id] = e
+        else:
+            failed = {}
+        
+        for run, future in batch:
+            if future.done():  # caller was cancelled
+                continue
+            if run.id in failed:
+                future.set_exception(failed[run.id])
+            else:
+                future.set_result(None)
+    
+    async def _write_runs(self, conn: Any, runs: List[CleanupRun]) -> None:
+        """Upsert runs and replace their actions in one transaction."""
+        async with conn.transaction():
+            await conn.executemany(_UPSERT_RUN_SQL, [_run_to_record(run) for run in runs])
+            await conn.execute(
+                "DELETE FROM gmail_cleanup_actions WHERE run_id = ANY($1::varchar[])",
+                [run.id for run in runs],
+            )
+            records = [
+                self._action_to_record(run.id, action)
+                for run in runs
+                for action in run.actions
+            ]
+            if len(records) >= COPY_MIN_ACTIONS:
+                # COPY streams every action row in one buffered write
+                await conn.copy_records_to_table(
+                    "gmail_cleanup_actions",
+                    records=records,
+                    columns=_ACTION_COLUMNS,
+                )
+            elif records:
+                # Small batches: COPY setup costs more than a batched INSERT
+                await conn.executemany(_INSERT_ACTION_SQL, records)
     
     async def get_run(self, user_id: str, run_id: str) -> Optional[CleanupRun]:
         """Retrieve cleanup run."""
-        # TODO: Implement Postgres get
-        # SELECT * FROM gmail_cleanup_runs WHERE user_id = ? AND run_id = ?
-        # SELECT * FROM gmail_cleanup_actions WHERE run_id = ?
-        raise NotImplementedError("Postgres implementation pending")
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            # Run and actions in one round trip; actions arrive as a JSONB array
+            row = await conn.fetchrow("""
+                SELECT r.*,
+                       COALESCE(
+                           jsonb_agg(a ORDER BY a.id) FILTER (WHERE a.id IS NOT NULL),
+                           '[]'::jsonb
+                       ) AS actions
+                FROM gmail_cleanup_runs r
+                LEFT JOIN gmail_cleanup_actions a ON a.run_id = r.run_id
+                WHERE r.user_id = $1 AND r.run_id = $2
+                GROUP BY r.run_id
+            """,
+                user_id,
+                run_id,
+            )
+        if row is None:
+            return None
+        return self._row_to_run(row, row["actions"])
     
     async def list_runs(
         self,
@@ -371,17 +920,121 @@ class PostgresGmailCleanupRepository(GmailCleanupRepository):
         limit: int = 10,
         offset: int = 0,
     ) -> List[CleanupRun]:
-        """List cleanup runs for a user."""
-        # TODO: Implement Postgres list
-        # SELECT * FROM gmail_cleanup_runs WHERE user_id = ?
-        # ORDER BY started_at DESC LIMIT ? OFFSET ?
-        raise NotImplementedError("Postgres implementation pending")
+        """
+        List cleanup runs for a user.
+        
+        Returns summary runs without snapshots, actions or agent context;
+        the projection matches the covering idx_runs_started index, so the
+        query is an index-only scan. Use get_run for full details.
+        """
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(f"""
+                SELECT {_RUN_SUMMARY_COLUMNS} FROM gmail_cleanup_runs WHERE user_id = $1
+                ORDER BY started_at_us DESC, run_id DESC LIMIT $2 OFFSET $3
+            """, user_id, limit, offset)
+        return [self._summary_row_to_run(row) for row in rows]
+    
+    async def list_runs_page(
+        self,
+        user_id: str,
+        limit: int = 10,
+        cursor: Optional[RunCursor] = None,
+    ) -> Tuple[List[CleanupRun], Optional[RunCursor]]:
+        """
+        List cleanup runs with keyset pagination.
+        
+        Seeks straight to `cursor` in idx_runs_started with a row
+        comparison on (started_at_us, run_id), so every page costs the
+        same regardless of depth.
+        """
+        cursor_us, cursor_id = (_to_epoch_us(cursor[0]), cursor[1]) if cursor else (None, None)
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(f"""
+                SELECT {_RUN_SUMMARY_COLUMNS} FROM gmail_cleanup_runs
+                WHERE user_id = $1
+                  AND ($2::bigint IS NULL OR (started_at_us, run_id) < ($2, $3::varchar))
+                ORDER BY started_at_us DESC, run_id DESC LIMIT $4
+            """, user_id, cursor_us, cursor_id, limit)
+        runs = [self._summary_row_to_run(row) for row in rows]
+        return runs, _next_cursor(runs, limit)
     
     async def get_run_count(self, user_id: str) -> int:
         """Get total run count for user."""
-        # TODO: Implement Postgres count
-        # SELECT COUNT(*) FROM gmail_cleanup_runs WHERE user_id = ?
-        raise NotImplementedError("Postgres implementation pending")
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            # Maintained by the bump_run_count trigger; O(1) instead of COUNT(*)
+            count = await conn.fetchval(
+                "SELECT run_count FROM gmail_user_run_counts WHERE user_id = $1", user_id
+            )
+        return count or 0
+    
+    def _action_to_record(self, run_id: str, action: MetricAction) -> Tuple[Any, ...]:
+        """Convert an action to a gmail_cleanup_actions row in `_ACTION_COLUMNS` order."""
+        return (
+            run_id,
+            action.id,
+            action.thread_id,
+            action.message_id,
+            action.action_type,
+            action.action_params,
+            action.status.value,
+            action.error_message,
+            action.executed_at,
+            action.message_subject,
+            action.message_from,
+            action.message_date,
+        )
+    
+    def _summary_row_to_run(self, row: Any) -> CleanupRun:
+        """Convert a `_RUN_SUMMARY_COLUMNS` row to a CleanupRun."""
+        return CleanupRun(
+            id=row["run_id"],
+            user_id=row["user_id"],
+            status=CleanupStatus(row["status"]),
+            policy_id=row["policy_id"],
+            policy_name=row["policy_name"],
+            dry_run=row["dry_run"],
+            started_at=_from_epoch_us(row["started_at_us"]),
+            completed_at=row["completed_at"],
+        )
+    
+    def _row_to_run(self, row: Any, action_rows: List[Dict[str, Any]]) -> CleanupRun:
+        """Convert a gmail_cleanup_runs row and its jsonb_agg'd actions to a CleanupRun."""
+        before, after = _decode_snapshots(row)
+        return CleanupRun(
+            id=row["run_id"],
+            user_id=row["user_id"],
+            status=CleanupStatus(row["status"]),
+            policy_id=row["policy_id"],
+            policy_name=row["policy_name"],
+            dry_run=row["dry_run"],
+            before_snapshot=before,
+            after_snapshot=after,
+            actions=[
+                MetricAction(
+                    id=a["action_id"],
+                    thread_id=a["thread_id"],
+                    message_id=a["message_id"],
+                    action_type=a["action_type"],
+                    action_params=a["action_params"] or {},
+                    status=ActionStatus(a["status"]),
+                    error_message=a["error_message"],
+                    executed_at=_parse_dt(a["executed_at"]),
+                    message_subject=a["message_subject"],
+                    message_from=a["message_from"],
+                    message_date=_parse_dt(a["message_date"]),
+                )
+                for a in action_rows
+            ],
+            started_at=_from_epoch_us(row["started_at_us"]),
+            completed_at=row["completed_at"],
+            error_message=row["error_message"],
+            agent_session_id=row["agent_session_id"],
+            agent_model=row["agent_model"],
+            agent_prompts=row["agent_prompts"] or [],
+        )
 
 
 # SQL Schema for Postgres
@@ -404,50 +1057,65 @@ CREATE TABLE IF NOT EXISTS gmail_cleanup_policies (
     PRIMARY KEY (user_id, policy_id)
 );
 
-CREATE INDEX idx_policies_user ON gmail_cleanup_policies(user_id);
 CREATE INDEX idx_policies_enabled ON gmail_cleanup_policies(user_id, enabled);
 
 -- Cleanup runs table
 CREATE TABLE IF NOT EXISTS gmail_cleanup_runs (
     run_id VARCHAR(255) PRIMARY KEY,
     user_id VARCHAR(255) NOT NULL,
-    policy_id VARCHAR(255) NOT NULL,
+    policy_id VARCHAR(255),
     policy_name VARCHAR(255) NOT NULL,
+    dry_run BOOLEAN NOT NULL DEFAULT FALSE,
     
     -- Status tracking
     status VARCHAR(50) NOT NULL,
     error_message TEXT,
     
     -- Timing
-    started_at TIMESTAMP NOT NULL,
+    -- Microseconds since the epoch (UTC): integer compare/encode on the
+    -- hot list path. started_at is derived for SQL-level reporting.
+    started_at_us BIGINT NOT NULL,
+    started_at TIMESTAMP GENERATED ALWAYS AS (
+        to_timestamp(started_at_us / 1000000.0) AT TIME ZONE 'UTC'
+    ) STORED,
     completed_at TIMESTAMP,
     duration_seconds FLOAT,
     
-    -- Snapshots (stored as JSONB)
-    before_snapshot JSONB,
-    after_snapshot JSONB,
+    -- Snapshots: summary fields as JSONB, full snapshots zstd-compressed
+    -- in snapshot_blob (JSONB holds everything when zstandard is absent)
+    before_snapshot JSONB COMPRESSION lz4,
+    after_snapshot JSONB COMPRESSION lz4,
+    snapshot_blob BYTEA,
     
     -- Agent context
     agent_session_id VARCHAR(255),
     agent_model VARCHAR(100),
-    agent_prompts JSONB,
+    agent_prompts JSONB COMPRESSION lz4,
     
     -- Indexes
     created_at TIMESTAMP NOT NULL DEFAULT NOW()
 );
 
-CREATE INDEX idx_runs_user ON gmail_cleanup_runs(user_id);
+-- snapshot_blob is already compressed; skip TOAST's second pass
+ALTER TABLE gmail_cleanup_runs ALTER COLUMN snapshot_blob SET STORAGE EXTERNAL;
+
 CREATE INDEX idx_runs_status ON gmail_cleanup_runs(user_id, status);
-CREATE INDEX idx_runs_started ON gmail_cleanup_runs(user_id, started_at DESC);
+-- Covering index: list_runs is served by an index-only scan, and run_id
+-- as a key column makes (started_at_us, run_id) a seekable keyset
+CREATE INDEX idx_runs_started ON gmail_cleanup_runs(user_id, started_at_us DESC, run_id DESC)
+    INCLUDE (policy_id, policy_name, dry_run, status, completed_at);
 CREATE INDEX idx_runs_policy ON gmail_cleanup_runs(user_id, policy_id);
 
--- Cleanup actions table (audit trail)
+-- Cleanup actions table (audit trail), hash-partitioned by run_id so each
+-- partition's indexes stay small. The primary key must include run_id.
 CREATE TABLE IF NOT EXISTS gmail_cleanup_actions (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     run_id VARCHAR(255) NOT NULL REFERENCES gmail_cleanup_runs(run_id) ON DELETE CASCADE,
     
     -- Action details
-    message_id VARCHAR(255) NOT NULL,
+    action_id VARCHAR(255),
+    thread_id VARCHAR(255),
+    message_id VARCHAR(255),
     action_type VARCHAR(50) NOT NULL,
     action_params JSONB,
     
@@ -462,10 +1130,24 @@ CREATE TABLE IF NOT EXISTS gmail_cleanup_actions (
     message_date TIMESTAMP,
     
     -- Index
-    created_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    
+    PRIMARY KEY (run_id, id)
+) PARTITION BY HASH (run_id);
+
+DO $$
+BEGIN
+    FOR i IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS gmail_cleanup_actions_p%s PARTITION OF gmail_cleanup_actions '
+            'FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            i, i
+        );
+    END LOOP;
+END $$;
 
-CREATE INDEX idx_actions_run ON gmail_cleanup_actions(run_id);
+-- Indexes on the parent are created on every partition. Lookups by run_id
+-- alone use the (run_id, id) primary key.
 CREATE INDEX idx_actions_message ON gmail_cleanup_actions(message_id);
 CREATE INDEX idx_actions_type ON gmail_cleanup_actions(run_id, action_type);
 CREATE INDEX idx_actions_status ON gmail_cleanup_actions(run_id, status);
@@ -487,13 +1169,40 @@ GROUP BY user_id;
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = NOW();
+    NEW.updated_at = NOW() AT TIME ZONE 'UTC';
     RETURN NEW;
 END;
 $$ language 'plpgsql';
 
 CREATE TRIGGER update_policies_updated_at BEFORE UPDATE ON gmail_cleanup_policies
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Per-user run counters, kept in step with gmail_cleanup_runs by trigger
+CREATE TABLE IF NOT EXISTS gmail_user_run_counts (
+    user_id VARCHAR(255) PRIMARY KEY,
+    run_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_run_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO gmail_user_run_counts (user_id, run_count)
+        VALUES (NEW.user_id, 1)
+        ON CONFLICT (user_id) DO UPDATE
+            SET run_count = gmail_user_run_counts.run_count + 1;
+        RETURN NEW;
+    ELSE
+        UPDATE gmail_user_run_counts
+        SET run_count = run_count - 1
+        WHERE user_id = OLD.user_id;
+        RETURN OLD;
+    END IF;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER bump_run_count AFTER INSERT OR DELETE ON gmail_cleanup_runs
+    FOR EACH ROW EXECUTE FUNCTION bump_run_count();
 """
 
 
@@ -503,7 +1212,8 @@ def get_repository(backend: str = "memory", **kwargs) -> GmailCleanupRepository:
     
     Args:
         backend: Repository backend ('memory', 'postgres')
-        **kwargs: Backend-specific configuration
+        **kwargs: Backend-specific configuration (postgres: connection_string
+            plus PostgresGmailCleanupRepository pool options)
         
     Returns:
         Repository implementation
@@ -511,9 +1221,9 @@ def get_repository(backend: str = "memory", **kwargs) -> GmailCleanupRepository:
     if backend == "memory":
         return InMemoryGmailCleanupRepository()
     elif backend == "postgres":
-        connection_string = kwargs.get("connection_string")
+        connection_string = kwargs.pop("connection_string", None)
         if not connection_string:
             raise ValueError("Postgres backend requires connection_string")
-        return PostgresGmailCleanupRepository(connection_string)
+        return PostgresGmailCleanupRepository(connection_string, **kwargs)
     else:
         raise ValueError(f"Unknown backend: {backend}")
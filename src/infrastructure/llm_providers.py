@@ -5,7 +5,9 @@ Adapter for OpenAI's API (GPT-4, GPT-3.5, embeddings).
 Implements retry logic, error handling, and rate limiting.
 """
 
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
 
 from tenacity import (
     retry,
@@ -31,7 +33,7 @@ class LLMProviderInterface(Protocol):
 
 # Backwards-compatible alias to the domain interface as well
 LLMProviderInterface = LLMProviderInterface
-from src.domain.models import Message, MessageRole
+from src.domain.models import CompletionRequest, Message, MessageRole
 
 
 class OpenAIProvider(ILLMProvider):
@@ -45,6 +47,8 @@ class OpenAIProvider(ILLMProvider):
     TODO: Add request/response caching for identical prompts
     """
 
+    BATCH_POLL_INTERVAL_SECONDS = 30.0
+
     def __init__(
         self,
         api_key: str,
@@ -92,23 +96,9 @@ class OpenAIProvider(ILLMProvider):
         Automatically retries on transient failures with exponential backoff.
         """
         try:
-            # Convert domain messages to OpenAI format
-            openai_messages = self._convert_messages_to_openai(messages)
-            
-            # Build request parameters
-            kwargs: Dict[str, Any] = {
-                "model": model,
-                "messages": openai_messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
-            
-            # Add tools if provided
-            if tools:
-                kwargs["tools"] = [
-                    {"type": "function", "function": tool} for tool in tools
-                ]
-                kwargs["tool_choice"] = "auto"
+            kwargs = self._build_completion_kwargs(
+                messages, model, temperature, max_tokens, tools
+            )
             
             # Make API call
             response = await self.client.chat.completions.create(**kwargs)
@@ -156,6 +146,81 @@ class OpenAIProvider(ILLMProvider):
             else:
                 raise LLMProviderError(f"OpenAI API error: {error_msg}") from e
 
+    async def batch_completions(
+        self,
+        requests: List[CompletionRequest],
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[Tuple[int, Message]]:
+        """
+        Run completions through the OpenAI Batch API.
+        
+        Batch jobs are billed at roughly half the synchronous price and
+        don't count against per-minute rate limits, but OpenAI only
+        guarantees completion within 24 hours. Use `generate_completion`
+        for anything interactive.
+        
+        `max_concurrency` is unused; OpenAI schedules the batch.
+        """
+        if not requests:
+            return
+
+        lines = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_completion_kwargs(
+                    request.messages,
+                    request.model,
+                    request.temperature,
+                    request.max_tokens,
+                    request.tools,
+                ),
+            })
+            for index, request in enumerate(requests)
+        ]
+
+        try:
+            input_file = await self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(self.BATCH_POLL_INTERVAL_SECONDS)
+                batch = await self.client.batches.retrieve(batch.id)
+        except Exception as e:
+            raise LLMProviderError(f"OpenAI batch error: {str(e)}") from e
+
+        if not batch.output_file_id:
+            raise LLMProviderError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        output = await self.client.files.content(batch.output_file_id)
+        pending = set(range(len(requests)))
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                continue
+            index = int(result["custom_id"])
+            pending.discard(index)
+            yield index, self._message_from_response_body(
+                response["body"], requests[index].model
+            )
+
+        # Failed and expired requests are absent from the output file or errored
+        if pending:
+            raise LLMProviderError(
+                f"OpenAI batch {batch.id}: {len(pending)} of {len(requests)} requests "
+                f"failed (indexes {sorted(pending)[:20]})"
+            )
+
     async def stream_completion(
         self,
         messages: List[Message],
@@ -235,6 +300,49 @@ class OpenAIProvider(ILLMProvider):
         
         return len(self._token_encoder.encode(text))
 
+    def _build_completion_kwargs(
+        self,
+        messages: List[Message],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Build Chat Completions request parameters."""
+        kwargs: Dict[str, Any] = {
+            "model": model,
+            "messages": self._convert_messages_to_openai(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        
+        # Add tools if provided
+        if tools:
+            kwargs["tools"] = [
+                {"type": "function", "function": tool} for tool in tools
+            ]
+            kwargs["tool_choice"] = "auto"
+        
+        return kwargs
+
+    def _message_from_response_body(self, body: Dict[str, Any], model: str) -> Message:
+        """Convert a raw Chat Completions JSON response to a domain message."""
+        choice = body["choices"][0]
+        assistant_message = choice["message"]
+        usage = body.get("usage", {})
+        return Message(
+            role=MessageRole.ASSISTANT,
+            content=assistant_message.get("content") or "[Tool call]",
+            tool_calls=assistant_message.get("tool_calls"),
+            metadata={
+                "model": model,
+                "finish_reason": choice.get("finish_reason"),
+                "prompt_tokens": usage.get("prompt_tokens"),
+                "completion_tokens": usage.get("completion_tokens"),
+                "total_tokens": usage.get("total_tokens"),
+            },
+        )
+
     def _convert_messages_to_openai(
         self,
         messages: List[Message],
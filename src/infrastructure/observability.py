@@ -7,7 +7,7 @@ Provides production-ready observability with:
 - Metrics (Prometheus)
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import structlog
 from contextlib import contextmanager
 
@@ -48,6 +48,7 @@ class StructuredLogger(IObservabilityService):
         Args:
             log_level: Minimum log level (DEBUG, INFO, WARNING, ERROR)
         """
+        self._min_level = self._parse_log_level(log_level)
         structlog.configure(
             processors=[
                 structlog.contextvars.merge_contextvars,
@@ -57,9 +58,7 @@ class StructuredLogger(IObservabilityService):
                 structlog.processors.format_exc_info,
                 structlog.processors.JSONRenderer(),
             ],
-            wrapper_class=structlog.make_filtering_bound_logger(
-                self._parse_log_level(log_level)
-            ),
+            wrapper_class=structlog.make_filtering_bound_logger(self._min_level),
             context_class=dict,
             logger_factory=structlog.PrintLoggerFactory(),
             cache_logger_on_first_use=True,
@@ -88,6 +87,10 @@ class StructuredLogger(IObservabilityService):
         else:
             log_func(message)
 
+    def level_enabled(self, level: str) -> bool:
+        """Return True if messages at ``level`` pass the configured minimum level."""
+        return self._parse_log_level(level) >= self._min_level
+
     def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
         """
         Start a trace span (no-op in basic implementation).
@@ -113,6 +116,24 @@ class StructuredLogger(IObservabilityService):
             {"metric_name": name, "metric_value": value, "labels": labels},
         )
 
+    def record_metrics(
+        self,
+        samples: List[Tuple[str, float, Optional[Dict[str, str]]]],
+    ) -> None:
+        """Record several metrics as a single structured log entry."""
+        if not samples:
+            return
+        self.log(
+            "info",
+            "metrics",
+            {
+                "metrics": [
+                    {"metric_name": name, "metric_value": value, "labels": labels}
+                    for name, value, labels in samples
+                ]
+            },
+        )
+
     async def health_check(self) -> Dict[str, Any]:
         """Health check for logging system."""
         return {"status": "healthy", "service": "structured_logger"}
@@ -193,6 +214,10 @@ class OpenTelemetryObservability(IObservabilityService):
         """Log with tracing context."""
         self.logger.log(level, message, context)
 
+    def level_enabled(self, level: str) -> bool:
+        """Delegate level filtering to the structured logger."""
+        return self.logger.level_enabled(level)
+
     def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
         """
         Start a distributed trace span.
@@ -218,6 +243,13 @@ class OpenTelemetryObservability(IObservabilityService):
         """Record metric via logging."""
         self.logger.record_metric(name, value, labels)
 
+    def record_metrics(
+        self,
+        samples: List[Tuple[str, float, Optional[Dict[str, str]]]],
+    ) -> None:
+        """Record several metrics via logging."""
+        self.logger.record_metrics(samples)
+
     async def health_check(self) -> Dict[str, Any]:
         """Health check for observability system."""
         return {
@@ -310,8 +342,22 @@ class PrometheusObservability(StructuredLogger):
         Maps metric names to Prometheus collectors.
         """
         labels = labels or {}
+        self._observe(name, value, labels)
         
-        # Route to appropriate metric
+        # Also log
+        super().record_metric(name, value, labels)
+
+    def record_metrics(
+        self,
+        samples: List[Tuple[str, float, Optional[Dict[str, str]]]],
+    ) -> None:
+        """Record several metrics to Prometheus, logging them as one entry."""
+        for name, value, labels in samples:
+            self._observe(name, value, labels or {})
+        super().record_metrics(samples)
+
+    def _observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        """Route a metric to its Prometheus collector, if one is defined."""
         if name == "agent_execution_duration":
             self.execution_duration.labels(**labels).observe(value)
         elif name == "agent_execution":
@@ -322,9 +368,6 @@ class PrometheusObservability(StructuredLogger):
             self.cost_usd.labels(**labels).inc(value)
         elif name == "tool_invocation":
             self.tool_invocations.labels(**labels).inc()
-        
-        # Also log
-        super().record_metric(name, value, labels)
 
     async def health_check(self) -> Dict[str, Any]:
         """Health check for Prometheus metrics."""
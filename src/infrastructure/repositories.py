@@ -5,8 +5,9 @@ Simple in-memory implementations for development and testing.
 For production, replace with database-backed repositories (PostgreSQL, MongoDB).
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from uuid import UUID
+import asyncio
 
 from src.domain.exceptions import AgentNotFoundError
 from src.domain.interfaces import IAgentRepository, IToolRegistry
@@ -86,6 +87,8 @@ class InMemoryToolRegistry(IToolRegistry):
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
         self._capability_index: Dict[str, List[str]] = {}
+        # (handler_module, handler_function) -> (resolved handler, is_async)
+        self._handler_cache: Dict[Tuple[str, str], Tuple[Callable[..., Any], bool]] = {}
 
     def register_tool(self, tool: Tool) -> None:
         """Register a tool."""
@@ -119,9 +122,8 @@ class InMemoryToolRegistry(IToolRegistry):
         """
         Invoke a tool with parameters.
 
-        Dynamically imports and calls the tool's handler function.
-
-        RISK: Dynamic imports can be slow. Consider caching handlers.
+        Dynamically imports the tool's handler function on first use and
+        caches it for later calls.
         """
         from src.domain.exceptions import ToolExecutionError, ToolNotFoundError
         import importlib
@@ -131,22 +133,23 @@ class InMemoryToolRegistry(IToolRegistry):
             raise ToolNotFoundError(tool_name)
 
         try:
-            # Import handler module
-            module = importlib.import_module(tool.handler_module)
-            handler_func = getattr(module, tool.handler_function)
+            key = (tool.handler_module, tool.handler_function)
+            cached = self._handler_cache.get(key)
+            if cached is None:
+                module = importlib.import_module(tool.handler_module)
+                handler_func = getattr(module, tool.handler_function)
+                # Sync vs async is static, so decide it once per handler
+                cached = (handler_func, asyncio.iscoroutinefunction(handler_func))
+                self._handler_cache[key] = cached
+            handler_func, is_async = cached
 
             # Invoke handler
-            result = handler_func(**parameters)
-
-            # Handle async handlers
-            if asyncio.iscoroutine(result):
-                result = await result
+            if is_async:
+                result = await handler_func(**parameters)
+            else:
+                result = handler_func(**parameters)
 
             return {"success": True, "result": result}
 
         except Exception as e:
             raise ToolExecutionError(tool_name, str(e)) from e
-
-
-# Import asyncio for async handler support
-import asyncio
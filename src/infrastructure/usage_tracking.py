@@ -5,19 +5,41 @@ Tracks email processing usage per customer and enforces plan limits.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, DefaultDict, Dict, Any, Mapping, Set, Tuple
 from uuid import UUID
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+import time
 
 from src.domain.customer import Customer, UsageStats, PlanQuota
 
 
+# Shared stand-in for a customer with no entries, so misses allocate nothing
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Current period strings by strftime format: {fmt: (unix_second, formatted)}
+_period_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def _now_period(fmt: str) -> str:
+    """Format the current UTC time, reformatting at most once per second."""
+    now = time.time()
+    second = int(now)
+    cached = _period_cache.get(fmt)
+    if cached is not None and cached[0] == second:
+        return cached[1]
+    formatted = datetime.utcfromtimestamp(now).strftime(fmt)
+    _period_cache[fmt] = (second, formatted)
+    return formatted
+
+
 class QuotaExceededError(Exception):
     """Raised when usage tracking detects quota exceeded"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageRecord:
     """A single usage record"""
     customer_id: UUID
@@ -36,10 +58,14 @@ class UsageTrackingService:
     """
     
     def __init__(self):
-        # In-memory storage: {(customer_id, period): usage_record}
-        self._usage_db: Dict[tuple, UsageRecord] = {}
-        # Daily cleanup counter: {(customer_id, date): count}
-        self._daily_cleanups: Dict[tuple, int] = {}
+        # Outer keys are customer_id.int: a plain int hashes without going
+        # through the Python-level UUID.__hash__.
+        # In-memory storage: {customer_id.int: {period: usage_record}}
+        self._usage_db: DefaultDict[int, Dict[str, UsageRecord]] = defaultdict(dict)
+        # Daily cleanup counter: {customer_id.int: {date: count}}
+        self._daily_cleanups: DefaultDict[int, Counter] = defaultdict(Counter)
+        # Customers with a record per period: {period: {customer_id.int}}
+        self._by_period: Dict[str, Set[int]] = defaultdict(set)
     
     def record_emails_processed(
         self,
@@ -59,24 +85,26 @@ class UsageTrackingService:
             Updated usage record
         """
         if period is None:
-            period = datetime.utcnow().strftime("%Y-%m")
+            period = _now_period("%Y-%m")
         
-        key = (customer_id, period)
+        customer_usage = self._usage_db[customer_id.int]
+        record = customer_usage.get(period)
         
-        if key in self._usage_db:
-            record = self._usage_db[key]
+        if record is not None:
             record.emails_processed += emails_count
             record.updated_at = datetime.utcnow()
         else:
+            now = datetime.utcnow()
             record = UsageRecord(
                 customer_id=customer_id,
                 period=period,
                 emails_processed=emails_count,
                 cleanups_executed=0,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
-            self._usage_db[key] = record
+            customer_usage[period] = record
+            self._by_period[period].add(customer_id.int)
         
         return record
     
@@ -98,31 +126,32 @@ class UsageTrackingService:
             Updated usage record
         """
         if period is None:
-            period = datetime.utcnow().strftime("%Y-%m")
+            period = _now_period("%Y-%m")
         
         # Update monthly usage
-        key = (customer_id, period)
+        customer_usage = self._usage_db[customer_id.int]
+        record = customer_usage.get(period)
         
-        if key in self._usage_db:
-            record = self._usage_db[key]
+        if record is not None:
             record.cleanups_executed += 1
             record.emails_processed += emails_count
             record.updated_at = datetime.utcnow()
         else:
+            now = datetime.utcnow()
             record = UsageRecord(
                 customer_id=customer_id,
                 period=period,
                 emails_processed=emails_count,
                 cleanups_executed=1,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
-            self._usage_db[key] = record
+            customer_usage[period] = record
+            self._by_period[period].add(customer_id.int)
         
         # Update daily cleanup counter
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        daily_key = (customer_id, today)
-        self._daily_cleanups[daily_key] = self._daily_cleanups.get(daily_key, 0) + 1
+        today = _now_period("%Y-%m-%d")
+        self._daily_cleanups[customer_id.int][today] += 1
         
         return record
     
@@ -142,21 +171,21 @@ class UsageTrackingService:
             Usage record (may be empty if no usage yet)
         """
         if period is None:
-            period = datetime.utcnow().strftime("%Y-%m")
-        
-        key = (customer_id, period)
+            period = _now_period("%Y-%m")
         
-        if key in self._usage_db:
-            return self._usage_db[key]
+        record = self._usage_db.get(customer_id.int, _EMPTY).get(period)
+        if record is not None:
+            return record
         
         # Return empty record if no usage yet
+        now = datetime.utcnow()
         return UsageRecord(
             customer_id=customer_id,
             period=period,
             emails_processed=0,
             cleanups_executed=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
     
     def get_daily_cleanup_count(
@@ -175,10 +204,9 @@ class UsageTrackingService:
             Number of cleanups executed today
         """
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = _now_period("%Y-%m-%d")
         
-        key = (customer_id, date)
-        return self._daily_cleanups.get(key, 0)
+        return self._daily_cleanups.get(customer_id.int, _EMPTY).get(date, 0)
     
     def get_usage_stats(
         self,
@@ -196,7 +224,7 @@ class UsageTrackingService:
             UsageStats with quota information
         """
         if period is None:
-            period = datetime.utcnow().strftime("%Y-%m")
+            period = _now_period("%Y-%m")
         
         usage_record = self.get_usage(customer.id, period)
         quota = customer.get_quota()
@@ -225,20 +253,30 @@ class UsageTrackingService:
             Tuple of (can_execute, error_message)
         """
         quota = customer.get_quota()
-        
+        error = self._limit_error(customer.id, quota, _now_period("%Y-%m"))
+        return error is None, error
+    
+    def _emails_processed(self, customer_id: UUID, period: str) -> int:
+        """Emails processed in a period, without building an empty UsageRecord."""
+        record = self._usage_db.get(customer_id.int, _EMPTY).get(period)
+        return record.emails_processed if record else 0
+    
+    def _limit_error(
+        self,
+        customer_id: UUID,
+        quota: PlanQuota,
+        period: str,
+    ) -> Optional[str]:
+        """Return why a cleanup is blocked right now, or None if it may run."""
         # Check daily cleanup limit
-        today_count = self.get_daily_cleanup_count(customer.id)
-        if today_count >= quota.cleanups_per_day:
-            return False, f"Daily cleanup limit reached ({quota.cleanups_per_day}). Try again tomorrow."
+        if self.get_daily_cleanup_count(customer_id) >= quota.cleanups_per_day:
+            return f"Daily cleanup limit reached ({quota.cleanups_per_day}). Try again tomorrow."
         
         # Check monthly email quota
-        current_period = datetime.utcnow().strftime("%Y-%m")
-        usage = self.get_usage(customer.id, current_period)
+        if self._emails_processed(customer_id, period) >= quota.emails_per_month:
+            return f"Monthly email quota exceeded ({quota.emails_per_month}). Please upgrade your plan."
         
-        if usage.emails_processed >= quota.emails_per_month:
-            return False, f"Monthly email quota exceeded ({quota.emails_per_month}). Please upgrade your plan."
-        
-        return True, None
+        return None
     
     def enforce_quota(
         self,
@@ -257,18 +295,18 @@ class UsageTrackingService:
         Raises:
             QuotaExceededError: If quota would be exceeded
         """
-        can_execute, error_msg = self.check_can_execute_cleanup(customer)
+        # Resolve quota and period once for both checks
+        quota = customer.get_quota()
+        current_period = _now_period("%Y-%m")
         
-        if not can_execute:
+        error_msg = self._limit_error(customer.id, quota, current_period)
+        if error_msg is not None:
             raise QuotaExceededError(error_msg)
         
         # Check if processing these emails would exceed monthly quota
-        quota = customer.get_quota()
-        current_period = datetime.utcnow().strftime("%Y-%m")
-        usage = self.get_usage(customer.id, current_period)
-        
-        if usage.emails_processed + emails_to_process > quota.emails_per_month:
-            remaining = quota.emails_per_month - usage.emails_processed
+        emails_processed = self._emails_processed(customer.id, current_period)
+        if emails_processed + emails_to_process > quota.emails_per_month:
+            remaining = quota.emails_per_month - emails_processed
             raise QuotaExceededError(
                 f"Processing {emails_to_process} emails would exceed monthly quota. "
                 f"Only {remaining} emails remaining in your plan."
@@ -288,7 +326,7 @@ class UsageTrackingService:
             Dictionary with all quota information
         """
         quota = customer.get_quota()
-        current_period = datetime.utcnow().strftime("%Y-%m")
+        current_period = _now_period("%Y-%m")
         usage = self.get_usage(customer.id, current_period)
         today_count = self.get_daily_cleanup_count(customer.id)
         
@@ -336,17 +374,38 @@ class UsageTrackingService:
             period: Period to reset (defaults to current month)
         """
         if period is None:
-            period = datetime.utcnow().strftime("%Y-%m")
+            period = _now_period("%Y-%m")
         
-        key = (customer_id, period)
-        if key in self._usage_db:
-            del self._usage_db[key]
+        self._discard_record(customer_id.int, period)
+        customers = self._by_period.get(period)
+        if customers is not None:
+            customers.discard(customer_id.int)
+            if not customers:
+                del self._by_period[period]
         
         # Also reset daily cleanup counter for today
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        daily_key = (customer_id, today)
-        if daily_key in self._daily_cleanups:
-            del self._daily_cleanups[daily_key]
+        daily = self._daily_cleanups.get(customer_id.int)
+        if daily is not None:
+            daily.pop(_now_period("%Y-%m-%d"), None)
+            if not daily:
+                del self._daily_cleanups[customer_id.int]
+    
+    def _discard_record(self, customer_int: int, period: str) -> bool:
+        """
+        Remove one usage record, dropping the customer's entry once empty.
+        
+        Uses .get() so a miss doesn't create an entry in the defaultdict.
+        
+        Returns:
+            True if a record was removed
+        """
+        customer_usage = self._usage_db.get(customer_int)
+        if customer_usage is None:
+            return False
+        removed = customer_usage.pop(period, None) is not None
+        if not customer_usage:
+            del self._usage_db[customer_int]
+        return removed
     
     def cleanup_old_records(
         self,
@@ -365,15 +424,13 @@ class UsageTrackingService:
         cutoff_period = cutoff_date.strftime("%Y-%m")
         
         deleted = 0
-        keys_to_delete = []
-        
-        for key, record in self._usage_db.items():
-            if record.period < cutoff_period:
-                keys_to_delete.append(key)
         
-        for key in keys_to_delete:
-            del self._usage_db[key]
-            deleted += 1
+        # Visit only expired periods and the customers that have them
+        expired = [period for period in self._by_period if period < cutoff_period]
+        for period in expired:
+            for customer_int in self._by_period.pop(period):
+                if self._discard_record(customer_int, period):
+                    deleted += 1
         
         return deleted
 
@@ -5,12 +5,58 @@ Adapters for vector databases (Qdrant, ChromaDB).
 Provides semantic search capabilities for RAG.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import uuid4
+import functools
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from src.domain.exceptions import CollectionNotFoundError, VectorStoreError
 from src.domain.interfaces import IVectorStore
 
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+
+# A batch of embeddings: nested lists or a 2-D [N, D] numpy array
+Vectors = Union[List[List[float]], "np.ndarray"]
+
+# HTTP statuses worth retrying: rate limiting and server-side hiccups
+TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# gRPC status names worth retrying (grpc.StatusCode members)
+TRANSIENT_GRPC_CODES = frozenset({"UNAVAILABLE", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED"})
+
+
+@functools.lru_cache(maxsize=256)
+def _build_qdrant_filter(items: FrozenSet[Tuple[str, Any]]) -> Any:
+    """Build a Qdrant equality Filter; cached since agents reuse the same filters."""
+    from qdrant_client.models import Filter, FieldCondition, MatchValue
+
+    return Filter(must=[
+        FieldCondition(key=key, match=MatchValue(value=value))
+        for key, value in sorted(items)
+    ])
+
 
 class QdrantVectorStore(IVectorStore):
     """
@@ -21,11 +67,12 @@ class QdrantVectorStore(IVectorStore):
     - Rich filtering capabilities
     - Distributed deployment support
     
+    Uses the async client, so requests never block the event loop and
+    share one pooled HTTP connection set. Transient failures (connection
+    errors, 429/5xx) are retried with exponential backoff.
+    
     RISK: Qdrant instance must be properly sized for workload.
     Monitor memory usage and query latency.
-    
-    TODO: Add connection pooling
-    TODO: Add automatic retry on transient failures
     """
 
     def __init__(
@@ -35,6 +82,10 @@ class QdrantVectorStore(IVectorStore):
         api_key: Optional[str] = None,
         https: bool = False,
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
     ):
         """
         Initialize Qdrant client.
@@ -45,41 +96,136 @@ class QdrantVectorStore(IVectorStore):
             api_key: Optional API key for authentication
             https: Use HTTPS connection
             timeout: Request timeout in seconds
+            max_connections: Upper bound on pooled HTTP connections
+            max_keepalive_connections: Idle connections kept open for reuse
+            prefer_grpc: Use gRPC (binary framing, multiplexed streams) for
+                data operations; the server must expose grpc_port
+            grpc_port: Qdrant gRPC port
         """
         try:
-            from qdrant_client import QdrantClient
+            import httpx
+            from qdrant_client import AsyncQdrantClient
+            from qdrant_client.http.exceptions import (
+                ResponseHandlingException,
+                UnexpectedResponse,
+            )
             from qdrant_client.models import Distance, VectorParams
         except ImportError:
             raise ImportError(
                 "Qdrant client not installed. Install with: pip install qdrant-client"
             )
 
-        self.client = QdrantClient(
+        self.client = AsyncQdrantClient(
             host=host,
             port=port,
             api_key=api_key,
             https=https,
             timeout=timeout,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
         )
         self._VectorParams = VectorParams
         self._Distance = Distance
+        self._connection_errors = (ResponseHandlingException, httpx.TransportError)
+        self._UnexpectedResponse = UnexpectedResponse
+        self._RpcError: Optional[type] = None
+        if prefer_grpc:
+            import grpc
+
+            self._RpcError = grpc.aio.AioRpcError
+
+    @staticmethod
+    def _quantization_config(quantization: Optional[str]) -> Any:
+        """Qdrant quantization config for create_collection (None if off)."""
+        if quantization is None:
+            return None
+
+        from qdrant_client import models
+
+        if quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            )
+        if quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        raise ValueError(f"Unknown quantization: {quantization}")
+
+    @staticmethod
+    def _search_params(oversampling: Optional[float]) -> Any:
+        """Search params that rescore quantized hits (None to use defaults)."""
+        if oversampling is None:
+            return None
+
+        from qdrant_client import models
+
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=oversampling,
+            )
+        )
+
+    def _is_transient(self, error: BaseException) -> bool:
+        """Whether a failed request is worth retrying."""
+        if isinstance(error, self._UnexpectedResponse):
+            return error.status_code in TRANSIENT_STATUS_CODES
+        if self._RpcError is not None and isinstance(error, self._RpcError):
+            return error.code().name in TRANSIENT_GRPC_CODES
+        return isinstance(error, self._connection_errors)
+
+    async def _with_retry(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a client call, retrying transient failures up to 3 attempts."""
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(self._is_transient),
+            stop=stop_after_attempt(3),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            reraise=True,
+        ):
+            with attempt:
+                return await call()
+        raise AssertionError("unreachable")  # AsyncRetrying always returns or raises
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self.client.close()
 
     async def create_collection(
         self,
         name: str,
         dimension: int,
         metadata: Optional[Dict[str, Any]] = None,
+        quantization: Optional[Literal["scalar", "binary"]] = None,
     ) -> None:
-        """Create a new collection with specified dimension."""
+        """
+        Create a new collection with specified dimension.
+        
+        Args:
+            name: Collection name
+            dimension: Vector dimension
+            metadata: Unused by Qdrant (kept for interface compatibility)
+            quantization: Keep a compressed in-RAM copy of the vectors:
+                "scalar" (int8, ~4x smaller) or "binary" (1 bit, ~32x
+                smaller). Searches scan the compressed copy and rescore
+                the shortlist against the original float32 vectors.
+        """
         try:
-            from qdrant_client.models import Distance, VectorParams
-
-            self.client.create_collection(
+            await self.client.create_collection(
                 collection_name=name,
-                vectors_config=VectorParams(
+                vectors_config=self._VectorParams(
                     size=dimension,
-                    distance=Distance.COSINE,  # Cosine similarity is standard
+                    distance=self._Distance.COSINE,  # Cosine similarity is standard
                 ),
+                quantization_config=self._quantization_config(quantization),
             )
         except Exception as e:
             raise VectorStoreError(f"Failed to create collection {name}: {str(e)}") from e
@@ -87,30 +233,34 @@ class QdrantVectorStore(IVectorStore):
     async def insert_vectors(
         self,
         collection: str,
-        vectors: List[List[float]],
+        vectors: Vectors,
         payloads: List[Dict[str, Any]],
         ids: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Insert vectors with metadata.
         
-        Uses batch upsert for efficiency.
+        Uses a column-oriented batch upsert: one Batch of ids/vectors/payloads
+        instead of a PointStruct per vector. Embedders can pass their [N, D]
+        numpy output directly; it is narrowed to float32 (Qdrant's storage
+        type) and converted in a single call.
         """
         try:
-            from qdrant_client.models import PointStruct
+            from qdrant_client.models import Batch
 
             # Generate IDs if not provided
             if ids is None:
-                ids = [str(uuid4()) for _ in vectors]
+                ids = [str(uuid4()) for _ in range(len(vectors))]
 
-            # Create points
-            points = [
-                PointStruct(id=id_, vector=vector, payload=payload)
-                for id_, vector, payload in zip(ids, vectors, payloads)
-            ]
+            if hasattr(vectors, "astype"):  # numpy array
+                vectors = vectors.astype("float32", copy=False).tolist()
 
-            # Batch upsert
-            self.client.upsert(collection_name=collection, points=points)
+            batch = Batch(ids=ids, vectors=vectors, payloads=payloads)
+
+            # Batch upsert; safe to retry since points carry their IDs
+            await self._with_retry(
+                lambda: self.client.upsert(collection_name=collection, points=batch)
+            )
 
             return ids
 
@@ -123,51 +273,119 @@ class QdrantVectorStore(IVectorStore):
         query_vector: List[float],
         limit: int = 10,
         filter: Optional[Dict[str, Any]] = None,
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False,
+        oversampling: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantic search using vector similarity.
         
         Returns top-k most similar vectors with scores and payloads.
+        Pass with_payload=False (or a list of payload keys) when only IDs
+        and scores are needed, to keep large payloads off the wire.
+        On quantized collections, oversampling (e.g. 2.0) fetches that many
+        times `limit` candidates from the compressed vectors and rescores
+        them with the originals.
         """
         try:
-            # Convert filter to Qdrant format if provided
-            qdrant_filter = None
-            if filter:
-                from qdrant_client.models import Filter, FieldCondition, MatchValue
-
-                conditions = [
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                    for key, value in filter.items()
-                ]
-                qdrant_filter = Filter(must=conditions)
+            qdrant_filter = self._to_qdrant_filter(filter)
 
             # Perform search
-            results = self.client.search(
-                collection_name=collection,
-                query_vector=query_vector,
-                limit=limit,
-                query_filter=qdrant_filter,
+            results = await self._with_retry(
+                lambda: self.client.search(
+                    collection_name=collection,
+                    query_vector=query_vector,
+                    limit=limit,
+                    query_filter=qdrant_filter,
+                    search_params=self._search_params(oversampling),
+                    with_payload=with_payload,
+                    with_vectors=with_vectors,
+                )
             )
 
-            # Format results
-            return [
-                {
-                    "id": str(result.id),
-                    "score": result.score,
-                    "payload": result.payload,
-                }
-                for result in results
-            ]
+            return self._format_results(results)
 
         except Exception as e:
             if "not found" in str(e).lower():
                 raise CollectionNotFoundError(collection)
             raise VectorStoreError(f"Search failed: {str(e)}") from e
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False,
+        oversampling: Optional[float] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Semantic search for several query vectors in one request.
+        
+        Uses Qdrant's batch search endpoint, so N queries cost one round trip.
+        """
+        try:
+            from qdrant_client.models import SearchRequest
+
+            qdrant_filter = self._to_qdrant_filter(filter)
+            search_params = self._search_params(oversampling)
+            requests = [
+                SearchRequest(
+                    vector=vector,
+                    limit=limit,
+                    filter=qdrant_filter,
+                    params=search_params,
+                    with_payload=with_payload,
+                    with_vector=with_vectors,
+                )
+                for vector in query_vectors
+            ]
+
+            batches = await self._with_retry(
+                lambda: self.client.search_batch(
+                    collection_name=collection,
+                    requests=requests,
+                )
+            )
+
+            return [self._format_results(results) for results in batches]
+
+        except Exception as e:
+            if "not found" in str(e).lower():
+                raise CollectionNotFoundError(collection)
+            raise VectorStoreError(f"Batch search failed: {str(e)}") from e
+
+    @staticmethod
+    def _to_qdrant_filter(filter: Optional[Dict[str, Any]]) -> Any:
+        """Convert an equality filter dict to a Qdrant Filter (None if empty)."""
+        if not filter:
+            return None
+        try:
+            return _build_qdrant_filter(frozenset(filter.items()))
+        except TypeError:
+            # Unhashable filter values (e.g. lists) skip the cache
+            return _build_qdrant_filter.__wrapped__(filter.items())
+
+    @staticmethod
+    def _format_results(results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert scored points to result dicts (with "vector" if requested)."""
+        formatted = []
+        for result in results:
+            hit = {
+                "id": str(result.id),
+                "score": result.score,
+                "payload": result.payload,
+            }
+            if result.vector is not None:
+                hit["vector"] = result.vector
+            formatted.append(hit)
+        return formatted
+
     async def delete_collection(self, name: str) -> None:
         """Delete a collection."""
         try:
-            self.client.delete_collection(collection_name=name)
+            await self.client.delete_collection(collection_name=name)
         except Exception as e:
             raise VectorStoreError(f"Failed to delete collection {name}: {str(e)}") from e
 
@@ -214,6 +432,17 @@ class ChromaVectorStore(IVectorStore):
                 settings.is_persistent = True
             self.client = chromadb.Client(settings)
 
+        # Resolved collection handles by name, so vector ops skip get_collection
+        self._collections: Dict[str, Any] = {}
+
+    def _get_collection(self, name: str) -> Any:
+        """Return a cached collection handle, resolving it on first use."""
+        coll = self._collections.get(name)
+        if coll is None:
+            coll = self.client.get_collection(name=name)
+            self._collections[name] = coll
+        return coll
+
     async def create_collection(
         self,
         name: str,
@@ -222,7 +451,7 @@ class ChromaVectorStore(IVectorStore):
     ) -> None:
         """Create a new collection."""
         try:
-            self.client.create_collection(
+            self._collections[name] = self.client.create_collection(
                 name=name,
                 metadata=metadata or {},
             )
@@ -232,16 +461,16 @@ class ChromaVectorStore(IVectorStore):
     async def insert_vectors(
         self,
         collection: str,
-        vectors: List[List[float]],
+        vectors: Vectors,
         payloads: List[Dict[str, Any]],
         ids: Optional[List[str]] = None,
     ) -> List[str]:
-        """Insert vectors with metadata."""
+        """Insert vectors with metadata. numpy arrays are passed through as-is."""
         try:
-            coll = self.client.get_collection(name=collection)
+            coll = self._get_collection(collection)
 
             if ids is None:
-                ids = [str(uuid4()) for _ in vectors]
+                ids = [str(uuid4()) for _ in range(len(vectors))]
 
             coll.add(
                 ids=ids,
@@ -263,7 +492,7 @@ class ChromaVectorStore(IVectorStore):
     ) -> List[Dict[str, Any]]:
         """Semantic search."""
         try:
-            coll = self.client.get_collection(name=collection)
+            coll = self._get_collection(collection)
 
             results = coll.query(
                 query_embeddings=[query_vector],
@@ -271,25 +500,59 @@ class ChromaVectorStore(IVectorStore):
                 where=filter,
             )
 
-            # Format results
-            formatted = []
-            for i in range(len(results["ids"][0])):
-                formatted.append({
-                    "id": results["ids"][0][i],
-                    "score": 1.0 - results["distances"][0][i],  # Convert distance to similarity
-                    "payload": results["metadatas"][0][i],
-                })
-
-            return formatted
+            return self._format_results(results, 0)
 
         except Exception as e:
             if "does not exist" in str(e).lower():
+                self._collections.pop(collection, None)  # deleted elsewhere
                 raise CollectionNotFoundError(collection)
             raise VectorStoreError(f"Search failed: {str(e)}") from e
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Semantic search for several query vectors in one query call."""
+        try:
+            coll = self._get_collection(collection)
+
+            results = coll.query(
+                query_embeddings=query_vectors,
+                n_results=limit,
+                where=filter,
+            )
+
+            return [self._format_results(results, q) for q in range(len(query_vectors))]
+
+        except Exception as e:
+            if "does not exist" in str(e).lower():
+                self._collections.pop(collection, None)  # deleted elsewhere
+                raise CollectionNotFoundError(collection)
+            raise VectorStoreError(f"Batch search failed: {str(e)}") from e
+
+    @staticmethod
+    def _format_results(results: Dict[str, Any], query: int) -> List[Dict[str, Any]]:
+        """Format the hits for one query of a Chroma query result."""
+        return [
+            {
+                "id": id_,
+                "score": 1.0 - distance,  # Convert distance to similarity
+                "payload": metadata,
+            }
+            for id_, distance, metadata in zip(
+                results["ids"][query],
+                results["distances"][query],
+                results["metadatas"][query],
+            )
+        ]
+
     async def delete_collection(self, name: str) -> None:
         """Delete a collection."""
         try:
+            self._collections.pop(name, None)
             self.client.delete_collection(name=name)
         except Exception as e:
             raise VectorStoreError(f"Failed to delete collection {name}: {str(e)}") from e
@@ -6,6 +6,7 @@ safe operation of AI agents.
 """
 
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from dataclasses import dataclass, field
@@ -306,6 +307,36 @@ class RateLimiter:
         logger.info("Emergency stop deactivated")
 
 
+# Process-wide limiters keyed by API project, so every caller drawing on the
+# same upstream quota shares one set of counters.
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    project_id: str = "default",
+    config: Optional[RateLimitConfig] = None,
+) -> RateLimiter:
+    """
+    Get the shared rate limiter for an API project, creating it on first use.
+    
+    Args:
+        project_id: Quota owner (e.g. OAuth client project)
+        config: Configuration used only when the limiter is first created
+        
+    Returns:
+        RateLimiter shared by all callers using the same project_id
+    """
+    limiter = _limiters.get(project_id)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(project_id)
+            if limiter is None:
+                limiter = RateLimiter(config)
+                _limiters[project_id] = limiter
+    return limiter
+
+
 class RateLimitError(Exception):
     """Exception raised when rate limit is exceeded."""
     
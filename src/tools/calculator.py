@@ -4,10 +4,12 @@ Calculator Tool - Safe mathematical expression evaluation.
 Provides calculator capabilities to agents without using eval().
 """
 
+import ast
+import functools
 import operator
 import math
 import re
-from typing import Dict, Any, Union
+from typing import Callable, Dict, Any, Union
 
 
 # Safe operations mapping
@@ -40,7 +42,148 @@ FUNCTIONS = {
     'ceil': math.ceil,
 }
 
+# Conversion factors to base unit, built once at import
+CONVERSIONS = {
+    # Length (meters)
+    'm': 1.0,
+    'km': 1000.0,
+    'cm': 0.01,
+    'mm': 0.001,
+    'mi': 1609.34,
+    'ft': 0.3048,
+    'in': 0.0254,
+    # Weight (kilograms)
+    'kg': 1.0,
+    'g': 0.001,
+    'mg': 0.000001,
+    'lb': 0.453592,
+    'oz': 0.0283495,
+}
+
+TEMPERATURE_UNITS = frozenset({'c', 'f', 'k'})
+
+# Units that can be converted into each other
+UNIT_DIMENSIONS = {
+    'length': ('m', 'km', 'cm', 'mm', 'mi', 'ft', 'in'),
+    'weight': ('kg', 'g', 'mg', 'lb', 'oz'),
+}
+
+# from -> to multiplier for every same-dimension pair, so a conversion is
+# one lookup and one multiply; cross-dimension pairs (m -> kg) are absent
+_RATIOS = {
+    (from_unit, to_unit): CONVERSIONS[from_unit] / CONVERSIONS[to_unit]
+    for units in UNIT_DIMENSIONS.values()
+    for from_unit in units
+    for to_unit in units
+}
+
+# Security: patterns never allowed in an expression
+_FORBIDDEN_RE = re.compile(r'__|import|exec|eval|open|file', re.IGNORECASE)
 
+# Safe constants mapping
+CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+# Python AST operator nodes for OPERATIONS
+_BINARY_OPS = {
+    ast.Add: OPERATIONS['+'],
+    ast.Sub: OPERATIONS['-'],
+    ast.Mult: OPERATIONS['*'],
+    ast.Div: OPERATIONS['/'],
+    ast.FloorDiv: OPERATIONS['//'],
+    ast.Mod: OPERATIONS['%'],
+    ast.Pow: OPERATIONS['**'],
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+Evaluator = Callable[[], Any]
+
+
+def _build(node: ast.AST) -> Evaluator:
+    """
+    Turn a whitelisted expression node into a zero-argument closure.
+    
+    Only numbers, the CONSTANTS, OPERATIONS, FUNCTIONS and list/tuple
+    arguments are accepted; anything else raises ValueError.
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Unsupported literal: {value!r}")
+        return lambda: value
+    
+    if isinstance(node, ast.Name):
+        if node.id not in CONSTANTS:
+            raise ValueError(f"Unknown name: {node.id}")
+        value = CONSTANTS[node.id]
+        return lambda: value
+    
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPS.get(type(node.op))
+        if op is None:
+            if isinstance(node.op, ast.BitXor):
+                raise ValueError("Unsupported operator: ^ (use ** for powers)")
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        left, right = _build(node.left), _build(node.right)
+        return lambda: op(left(), right())
+    
+    if isinstance(node, ast.UnaryOp):
+        unary = _UNARY_OPS.get(type(node.op))
+        if unary is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        operand = _build(node.operand)
+        return lambda: unary(operand())
+    
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ValueError(f"Unknown function: {ast.unparse(node.func)}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+        func = FUNCTIONS[node.func.id]
+        args = [_build(arg) for arg in node.args]
+        return lambda: func(*[arg() for arg in args])
+    
+    if isinstance(node, (ast.List, ast.Tuple)):
+        items = [_build(item) for item in node.elts]
+        return lambda: [item() for item in items]
+    
+    raise ValueError(f"Unsupported expression: {type(node).__name__}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str) -> Evaluator:
+    """Parse and build an expression once; agents often repeat the same ones."""
+    return _build(ast.parse(expression, mode='eval').body)
+
+
+def _memoize(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Cache a pure calculator function's result by its arguments.
+    
+    Results are cached as item tuples, so every caller gets its own dict.
+    Calls with unhashable arguments bypass the cache.
+    """
+    @functools.lru_cache(maxsize=2048, typed=True)
+    def cached(*args: Any, **kwargs: Any) -> tuple:
+        return tuple(func(*args, **kwargs).items())
+    
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            return dict(cached(*args, **kwargs))
+        except TypeError:
+            return func(*args, **kwargs)
+    
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@_memoize
 def calculate(expression: str) -> Dict[str, Any]:
     """
     Safely evaluate mathematical expressions.
@@ -68,30 +211,22 @@ def calculate(expression: str) -> Dict[str, Any]:
         expression = expression.replace(" ", "")
         
         # Security: Check for forbidden patterns
-        forbidden = ['__', 'import', 'exec', 'eval', 'open', 'file']
-        if any(pattern in expression.lower() for pattern in forbidden):
+        if _FORBIDDEN_RE.search(expression):
             return {
                 "success": False,
                 "error": "Expression contains forbidden operations",
                 "expression": expression,
             }
         
-        # Replace constants
-        expression = expression.replace("pi", str(math.pi))
-        expression = expression.replace("e", str(math.e))
-        
-        # Simple eval with restricted namespace (RISK: Still be cautious)
-        # In high-security environments, use a proper expression parser
-        namespace = {"__builtins__": {}}
-        namespace.update(FUNCTIONS)
-        
-        result = eval(expression, namespace)
+        result = _compile(expression)()
+        result_type = result.__class__
         
         return {
             "success": True,
-            "result": float(result),
+            # float results (the common case) need no conversion
+            "result": result if result_type is float else float(result),
             "expression": expression,
-            "type": type(result).__name__,
+            "type": result_type.__name__,
         }
         
     except ZeroDivisionError:
@@ -108,6 +243,7 @@ def calculate(expression: str) -> Dict[str, Any]:
         }
 
 
+@_memoize
 def calculate_percentage(value: float, percentage: float) -> Dict[str, Any]:
     """
     Calculate percentage of a value.
@@ -135,6 +271,7 @@ def calculate_percentage(value: float, percentage: float) -> Dict[str, Any]:
         }
 
 
+@_memoize
 def convert_units(value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
     """
     Convert between common units.
@@ -144,42 +281,23 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
     - Weight: kg, g, mg, lb, oz
     - Temperature: C, F, K
     """
-    # Conversion factors to base unit
-    CONVERSIONS = {
-        # Length (meters)
-        'm': 1.0,
-        'km': 1000.0,
-        'cm': 0.01,
-        'mm': 0.001,
-        'mi': 1609.34,
-        'ft': 0.3048,
-        'in': 0.0254,
-        # Weight (kilograms)
-        'kg': 1.0,
-        'g': 0.001,
-        'mg': 0.000001,
-        'lb': 0.453592,
-        'oz': 0.0283495,
-    }
-    
     try:
         from_unit = from_unit.lower()
         to_unit = to_unit.lower()
         
         # Temperature conversion (special case)
-        if from_unit in ['c', 'f', 'k'] or to_unit in ['c', 'f', 'k']:
+        if from_unit in TEMPERATURE_UNITS or to_unit in TEMPERATURE_UNITS:
             return _convert_temperature(value, from_unit, to_unit)
         
         # Standard unit conversion
-        if from_unit not in CONVERSIONS or to_unit not in CONVERSIONS:
+        ratio = _RATIOS.get((from_unit, to_unit))
+        if ratio is None:
             return {
                 "success": False,
                 "error": f"Unsupported units: {from_unit} to {to_unit}",
             }
         
-        # Convert to base unit, then to target unit
-        base_value = value * CONVERSIONS[from_unit]
-        result = base_value / CONVERSIONS[to_unit]
+        result = value * ratio
         
         return {
             "success": True,
@@ -6,24 +6,276 @@ Provides safe code execution capabilities for agents.
 
 import sys
 import io
-from typing import Dict, Any
+from types import CodeType, MappingProxyType
+from typing import Dict, Any, Optional, Set
 import ast
+import atexit
+import functools
+import marshal
+import multiprocessing
+import queue
+import reprlib
+import signal
+import threading
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, timeout is still enforced
+    resource = None  # type: ignore[assignment]
+
+
+# Sandbox limits for worker processes
+WORKER_PROCESSES = 2
+MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+# Exit code of a worker killed by SIGXCPU once its CPU budget runs out
+_CPU_LIMIT_EXITCODE = -signal.SIGXCPU if hasattr(signal, "SIGXCPU") else None
+
+# Idle workers; None marks a slot whose worker hasn't been started yet
+_idle: "queue.LifoQueue[Optional[_Worker]]" = queue.LifoQueue()
+for _ in range(WORKER_PROCESSES):
+    _idle.put(None)
+_workers: Set["_Worker"] = set()
+_workers_lock = threading.Lock()
+
+# Longest text returned per variable
+VARIABLE_PREVIEW_CHARS = 2048
+
+_VARIABLE_REPR = reprlib.Repr()
+_VARIABLE_REPR.maxlevel = 3
+_VARIABLE_REPR.maxlist = _VARIABLE_REPR.maxtuple = _VARIABLE_REPR.maxset = 100
+_VARIABLE_REPR.maxfrozenset = _VARIABLE_REPR.maxdeque = _VARIABLE_REPR.maxarray = 100
+_VARIABLE_REPR.maxdict = 50
+_VARIABLE_REPR.maxstring = _VARIABLE_REPR.maxlong = _VARIABLE_REPR.maxother = VARIABLE_PREVIEW_CHARS
+
+# Builtins visible to agent code. Read-only, since workers are reused and
+# one snippet must not be able to alter what the next one sees; each
+# execution gets its own dict copy (the import machinery needs a real dict).
+SAFE_BUILTINS = MappingProxyType({
+    'abs': abs,
+    'all': all,
+    'any': any,
+    'bool': bool,
+    'dict': dict,
+    'enumerate': enumerate,
+    'filter': filter,
+    'float': float,
+    'int': int,
+    'len': len,
+    'list': list,
+    'map': map,
+    'max': max,
+    'min': min,
+    'range': range,
+    'reversed': reversed,
+    'round': round,
+    'set': set,
+    'sorted': sorted,
+    'str': str,
+    'sum': sum,
+    'tuple': tuple,
+    'zip': zip,
+    'print': print,
+})
+
+
+# Names agent code may not reference
+FORBIDDEN_NAMES = frozenset({
+    'eval', 'exec', 'compile', '__import__', 'open', 'file',
+    'input', 'raw_input', 'execfile', 'reload', 'quit', 'exit',
+})
+
+
+class ForbiddenOperationError(ValueError):
+    """Raised when code uses a forbidden name or dunder attribute."""
+    pass
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_checked(code: str) -> CodeType:
+    """
+    Parse, validate and compile code once.
+    
+    Compiling the validated AST avoids a second parse inside exec(), and
+    the cache lets agents re-run the same snippet without either.
+    
+    Raises:
+        SyntaxError: If the code does not parse
+        ForbiddenOperationError: If the code uses a forbidden name or a
+            dunder attribute (e.g. ().__class__, a common sandbox escape)
+    """
+    tree = ast.parse(code)
+    
+    # One pass; stops at the first offending node
+    for node in ast.walk(tree):
+        node_type = type(node)
+        if node_type is ast.Name:
+            if node.id in FORBIDDEN_NAMES:
+                raise ForbiddenOperationError(f"Forbidden operation: {node.id}")
+        elif node_type is ast.Attribute:
+            attr = node.attr
+            if attr.startswith('__') and attr.endswith('__'):
+                raise ForbiddenOperationError(f"Forbidden operation: {attr}")
+    
+    return compile(tree, '<agent>', 'exec')
+
+
+def _preview(value: Any) -> str:
+    """
+    Bounded text form of a variable for the result.
+    
+    Containers are rendered with reprlib limits so a huge list never gets
+    fully stringified; the text is then capped at VARIABLE_PREVIEW_CHARS.
+    """
+    try:
+        text = value if isinstance(value, str) else _VARIABLE_REPR.repr(value)
+    except Exception as e:
+        return f"<unreprable: {e}>"
+    if len(text) > VARIABLE_PREVIEW_CHARS:
+        hidden = len(text) - VARIABLE_PREVIEW_CHARS
+        text = f"{text[:VARIABLE_PREVIEW_CHARS]}...<{hidden} more>"
+    return text
+
+
+def _init_worker() -> None:
+    """Apply process-wide sandbox limits once, when a worker starts."""
+    if resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT_BYTES, MEMORY_LIMIT_BYTES))
+        # No file writes (Python ignores SIGXFSZ, so writes fail with EFBIG)
+        resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+
+
+def _run(code_bytes: bytes, cpu_seconds: int) -> Dict[str, Any]:
+    """Execute marshalled code in a worker process and collect its output."""
+    if resource is not None:
+        # RLIMIT_CPU counts the worker's lifetime, so grant this call's
+        # budget on top of what it has used so far; SIGXCPU kills it
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds + 1, hard))
+    
+    try:
+        code_obj = marshal.loads(code_bytes)
+        
+        # Create restricted namespace
+        namespace = {'__builtins__': dict(SAFE_BUILTINS)}
+        
+        # Capture stdout and stderr
+        stdout_buffer = io.StringIO()
+        stderr_buffer = io.StringIO()
+        
+        # Execute code
+        with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+            exec(code_obj, namespace)
+        
+        # Get output
+        stdout_output = stdout_buffer.getvalue()
+        stderr_output = stderr_buffer.getvalue()
+        
+        # Extract variables (exclude builtins and private)
+        variables = {
+            k: _preview(v)
+            for k, v in namespace.items()
+            if not k.startswith('_')
+        }
+        
+        return {
+            "success": True,
+            "stdout": stdout_output,
+            "stderr": stderr_output,
+            "variables": variables,
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e) or type(e).__name__,  # e.g. MemoryError has no message
+            "traceback": traceback.format_exc(),
+        }
+
+
+def _worker_main(conn: Any) -> None:
+    """Worker process loop: run each snippet received on the pipe."""
+    _init_worker()
+    while True:
+        try:
+            code_bytes, cpu_seconds = conn.recv()
+        except EOFError:
+            return
+        conn.send(_run(code_bytes, cpu_seconds))
+
+
+class _Worker:
+    """
+    One sandbox process and the pipe used to talk to it.
+    
+    Workers are checked out to a single caller at a time, so a snippet
+    that overruns can be killed without touching anyone else's.
+    """
+    
+    def __init__(self) -> None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        ctx = multiprocessing.get_context(method)
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        with _workers_lock:
+            _workers.add(self)
+    
+    def kill(self) -> None:
+        """Stop the process and release the pipe."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        with _workers_lock:
+            _workers.discard(self)
+
+
+def _acquire_worker() -> _Worker:
+    """Check out an idle worker, starting one for an empty slot."""
+    worker = _idle.get()
+    try:
+        if worker is None or not worker.process.is_alive():
+            if worker is not None:
+                worker.kill()
+            worker = _Worker()
+    except BaseException:
+        _idle.put(None)  # keep the slot if the worker couldn't start
+        raise
+    return worker
+
+
+def _kill_workers() -> None:
+    """Kill every worker process at interpreter exit."""
+    with _workers_lock:
+        workers = list(_workers)
+    for worker in workers:
+        worker.kill()
+
+
+atexit.register(_kill_workers)
+
 
 def execute_python_code(code: str, timeout: int = 5) -> Dict[str, Any]:
     """
     Execute Python code in a restricted environment.
     
+    Code is validated and compiled here, then run in one of
+    WORKER_PROCESSES reusable worker processes with restricted builtins,
+    a MEMORY_LIMIT_BYTES address-space cap, no file writes and a CPU
+    budget. The call waits at most `timeout` seconds once it has a worker;
+    a worker that overruns is killed and replaced, and other executions
+    are unaffected.
+    
     WARNING: Code execution is inherently risky. This implementation provides
     basic sandboxing but should NOT be used in production without additional
     security measures:
     
     - Use Docker containers for isolation
-    - Implement proper resource limits (CPU, memory, disk)
     - Use libraries like RestrictedPython
-    - Run in separate processes with timeout enforcement
     - Implement network isolation
     
     Args:
@@ -34,96 +286,59 @@ def execute_python_code(code: str, timeout: int = 5) -> Dict[str, Any]:
         Dictionary with execution results
         
     TODO: Implement proper sandboxing with Docker/containers
-    TODO: Add resource limits (CPU, memory)
     TODO: Add network isolation
-    TODO: Implement timeout enforcement
     """
     try:
-        # Parse code to check for dangerous operations
+        # Parse code and check for dangerous operations (cached per source)
         try:
-            tree = ast.parse(code)
+            code_obj = _compile_checked(code)
         except SyntaxError as e:
             return {
                 "success": False,
                 "error": f"Syntax error: {str(e)}",
                 "code": code,
             }
+        except ForbiddenOperationError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "code": code,
+            }
         
-        # Check for forbidden operations
-        forbidden_names = {
-            'eval', 'exec', 'compile', '__import__', 'open', 'file',
-            'input', 'raw_input', 'execfile', 'reload', 'quit', 'exit',
-        }
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and node.id in forbidden_names:
-                return {
-                    "success": False,
-                    "error": f"Forbidden operation: {node.id}",
-                    "code": code,
-                }
-            if isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-                # In production, allow only specific safe modules
-                pass
-        
-        # Create restricted namespace
-        safe_builtins = {
-            'abs': abs,
-            'all': all,
-            'any': any,
-            'bool': bool,
-            'dict': dict,
-            'enumerate': enumerate,
-            'filter': filter,
-            'float': float,
-            'int': int,
-            'len': len,
-            'list': list,
-            'map': map,
-            'max': max,
-            'min': min,
-            'range': range,
-            'reversed': reversed,
-            'round': round,
-            'set': set,
-            'sorted': sorted,
-            'str': str,
-            'sum': sum,
-            'tuple': tuple,
-            'zip': zip,
-            'print': print,
-        }
-        
-        namespace = {
-            '__builtins__': safe_builtins,
-        }
-        
-        # Capture stdout and stderr
-        stdout_buffer = io.StringIO()
-        stderr_buffer = io.StringIO()
-        
-        # Execute code
-        with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-            exec(code, namespace)
-        
-        # Get output
-        stdout_output = stdout_buffer.getvalue()
-        stderr_output = stderr_buffer.getvalue()
+        # Code objects don't pickle; marshal is the native format for them
+        worker = _acquire_worker()
+        result = None
+        timed_out = False
+        try:
+            worker.conn.send((marshal.dumps(code_obj), timeout))
+            if worker.conn.poll(timeout + 1):
+                result = worker.conn.recv()
+            else:
+                timed_out = True
+        except (EOFError, OSError):
+            pass  # the worker died mid-run
+        finally:
+            if result is None:
+                # Only this caller's worker is killed; its slot restarts lazily
+                worker.kill()
+                _idle.put(None)
+            else:
+                _idle.put(worker)
         
-        # Extract variables (exclude builtins and private)
-        variables = {
-            k: str(v)
-            for k, v in namespace.items()
-            if not k.startswith('_') and k != '__builtins__'
-        }
+        if result is None:
+            exitcode = worker.process.exitcode
+            if timed_out or exitcode == _CPU_LIMIT_EXITCODE:
+                error = f"Execution timed out after {timeout} seconds"
+            else:
+                error = f"Execution terminated (worker exit code {exitcode})"
+            return {
+                "success": False,
+                "error": error,
+                "code": code,
+            }
         
-        return {
-            "success": True,
-            "stdout": stdout_output,
-            "stderr": stderr_output,
-            "variables": variables,
-            "code": code,
-        }
+        result["code"] = code
+        return result
         
     except Exception as e:
         return {
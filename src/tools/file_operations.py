@@ -4,9 +4,11 @@ File Operations Tool - Safe file system operations.
 Provides controlled file access with security constraints.
 """
 
+import fnmatch
+import functools
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import mimetypes
 
 
@@ -18,23 +20,31 @@ ALLOWED_DIRECTORIES = [
 ]
 
 
+@functools.lru_cache(maxsize=16)
+def _allowed_prefixes(cwd: str, allowed_dirs: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Resolved allowed directories, each ending in a separator.
+    
+    Keyed by working directory and whitelist, since relative entries
+    resolve against the cwd and ALLOWED_DIRECTORIES may be reassigned.
+    """
+    return tuple(
+        str(Path(cwd, allowed_dir).resolve()).rstrip(os.sep) + os.sep
+        for allowed_dir in allowed_dirs
+    )
+
+
 def _is_path_allowed(path: str) -> bool:
     """
     Check if path is within allowed directories.
     
-    Security measure to prevent directory traversal attacks.
+    Security measure to prevent directory traversal attacks. The requested
+    path is resolved on every call (never cached) so a symlink swapped in
+    after an earlier check cannot slip through.
     """
-    abs_path = Path(path).resolve()
-    
-    for allowed_dir in ALLOWED_DIRECTORIES:
-        allowed_abs = Path(allowed_dir).resolve()
-        try:
-            abs_path.relative_to(allowed_abs)
-            return True
-        except ValueError:
-            continue
-    
-    return False
+    abs_path = str(Path(path).resolve()) + os.sep
+    prefixes = _allowed_prefixes(os.getcwd(), tuple(ALLOWED_DIRECTORIES))
+    return abs_path.startswith(prefixes)
 
 
 def read_file(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
@@ -74,13 +84,18 @@ def read_file(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
                 "file_path": file_path,
             }
         
-        content = path.read_text(encoding=encoding)
+        # One read; size comes from the bytes instead of re-encoding
+        raw = path.read_bytes()
+        content = raw.decode(encoding)
+        if '\r' in content:
+            # Same universal-newline handling as read_text()
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         return {
             "success": True,
             "file_path": file_path,
             "content": content,
-            "size_bytes": len(content.encode(encoding)),
+            "size_bytes": len(raw),
             "line_count": content.count('\n') + 1,
         }
         
@@ -132,13 +147,14 @@ def write_file(
         # Create parent directories if needed
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file
-        path.write_text(content, encoding=encoding)
+        # Write file, encoding once
+        data = content.encode(encoding)
+        path.write_bytes(data)
         
         return {
             "success": True,
             "file_path": str(path),
-            "bytes_written": len(content.encode(encoding)),
+            "bytes_written": len(data),
             "line_count": content.count('\n') + 1,
         }
         
@@ -185,26 +201,44 @@ def list_directory(directory_path: str, pattern: Optional[str] = None) -> Dict[s
                 "directory_path": directory_path,
             }
         
-        # List files
-        if pattern:
-            items = list(path.glob(pattern))
-        else:
-            items = list(path.iterdir())
-        
         files = []
         directories = []
         
-        for item in sorted(items):
-            info = {
-                "name": item.name,
-                "path": str(item),
-                "size_bytes": item.stat().st_size if item.is_file() else 0,
-            }
+        if pattern and ('/' in pattern or os.sep in pattern or '**' in pattern):
+            # Patterns that reach into subdirectories need a real glob
+            for item in sorted(path.glob(pattern)):
+                info = {
+                    "name": item.name,
+                    "path": str(item),
+                    "size_bytes": item.stat().st_size if item.is_file() else 0,
+                }
+                
+                if item.is_file():
+                    files.append(info)
+                elif item.is_dir():
+                    directories.append(info)
+        else:
+            # scandir entries carry the file type from readdir and cache
+            # stat(), so each entry costs at most one stat call
+            with os.scandir(path) as it:
+                entries = list(it)
+            if pattern:
+                entries = [e for e in entries if fnmatch.fnmatch(e.name, pattern)]
+            entries.sort(key=lambda e: e.name)
             
-            if item.is_file():
-                files.append(info)
-            elif item.is_dir():
-                directories.append(info)
+            for entry in entries:
+                if entry.is_file():
+                    files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size_bytes": entry.stat().st_size,
+                    })
+                elif entry.is_dir():
+                    directories.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size_bytes": 0,
+                    })
         
         return {
             "success": True,
@@ -12,6 +12,7 @@ Provides tools for:
 from typing import List, Dict, Any, Optional, cast
 from src.domain.gmail_interfaces import IGmailClient
 from datetime import datetime, timedelta
+import asyncio
 import re
 import base64
 from email.mime.text import MIMEText
@@ -305,20 +306,30 @@ class GmailClient:
         except Exception as e:
             raise Exception(f"Failed to modify message {message_id}: {str(e)}")
 
-    def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
-        """Move multiple messages to trash (safer than permanent delete)."""
+    async def batch_delete(self, message_ids: List[str]) -> Dict[str, Any]:
+        """
+        Move multiple messages to trash (safer than permanent delete).
+
+        The Google API client is synchronous, so the per-message calls run
+        in a worker thread instead of blocking the event loop.
+        """
         try:
-            count = 0
-            for msg_id in message_ids:
-                try:
-                    self.trash_message(msg_id)
-                    count += 1
-                except Exception:
-                    pass  # Continue with other messages
+            count = await asyncio.to_thread(self._trash_messages, message_ids)
             return {"deleted": count}
         except Exception as e:
             raise Exception(f"Failed to trash messages: {str(e)}")
 
+    def _trash_messages(self, message_ids: List[str]) -> int:
+        """Trash messages one by one and return how many succeeded."""
+        count = 0
+        for msg_id in message_ids:
+            try:
+                self.trash_message(msg_id)
+                count += 1
+            except Exception:
+                pass  # Continue with other messages
+        return count
+
 
 # ============================================================================
 # Tool Handler Functions (module-level for registry)
@@ -391,7 +402,7 @@ async def delete_emails_by_sender(sender: str, max_delete: int = 500) -> str:
 
     count = len(messages)
     message_ids = [msg.id for msg in messages]
-    result = client.batch_trash_messages(message_ids)
+    result = await client.batch_trash_messages(message_ids)
 
     return f"Successfully moved {result.get('success', 0)} emails from {sender} to trash"
 
@@ -407,7 +418,7 @@ async def delete_old_emails(days: int = 30, max_delete: int = 1000) -> str:
 
     count = len(messages)
     message_ids = [msg.id for msg in messages]
-    result = client.batch_trash_messages(message_ids)
+    result = await client.batch_trash_messages(message_ids)
 
     return f"Successfully moved {result.get('success', 0)} emails older than {days} days to trash"
 
@@ -446,7 +457,7 @@ async def search_and_delete(search_term: str, confirm: bool, max_delete: int = 5
 
     count = len(messages)
     message_ids = [msg.id for msg in messages]
-    result = client.batch_trash_messages(message_ids)
+    result = await client.batch_trash_messages(message_ids)
 
     return f"Successfully moved {result.get('success', 0)} emails matching '{search_term}' to trash"
 
@@ -550,7 +561,7 @@ def create_gmail_tools(credentials_path: str = "credentials.json") -> List[Tool]
 
         # Delete in batches
         message_ids = [msg.id for msg in messages]
-        _gmail_client.batch_delete(message_ids)
+        await _gmail_client.batch_delete(message_ids)
 
         return f"Successfully deleted {count} emails from {sender}"
 
@@ -573,7 +584,7 @@ def create_gmail_tools(credentials_path: str = "credentials.json") -> List[Tool]
 
         count = len(messages)
         message_ids = [msg.id for msg in messages]
-        _gmail_client.batch_delete(message_ids)
+        await _gmail_client.batch_delete(message_ids)
 
         return f"Successfully deleted {count} emails older than {days} days"
 
@@ -632,7 +643,7 @@ def create_gmail_tools(credentials_path: str = "credentials.json") -> List[Tool]
 
         count = len(messages)
         message_ids = [msg.id for msg in messages]
-        _gmail_client.batch_delete(message_ids)
+        await _gmail_client.batch_delete(message_ids)
 
         return f"Successfully deleted {count} emails matching '{search_term}'"
 
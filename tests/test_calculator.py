@@ -0,0 +1,102 @@
+"""
+Unit tests for the calculator tool.
+
+Tests the whitelisted expression evaluator behind calculate().
+"""
+
+import math
+
+import pytest
+
+from src.tools.calculator import calculate
+
+
+@pytest.mark.unit
+class TestCalculate:
+    """Test calculate."""
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("2 + 3", 5.0),
+        ("10 - 4", 6.0),
+        ("6 * 7", 42.0),
+        ("7 / 2", 3.5),
+        ("7 // 2", 3.0),
+        ("7 % 4", 3.0),
+        ("2 ** 10", 1024.0),
+        ("-3 + +5", 2.0),
+        ("(1 + 2) * 3", 9.0),
+    ])
+    def test_operators(self, expression, expected):
+        """Test arithmetic operators and precedence."""
+        result = calculate(expression)
+
+        assert result["success"] is True
+        assert result["result"] == expected
+        assert isinstance(result["result"], float)
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("sqrt(16)", 4.0),
+        ("abs(-2.5)", 2.5),
+        ("max(1, 5, 3)", 5.0),
+        ("min(4, 2)", 2.0),
+        ("sum([1, 2, 3])", 6.0),
+        ("round(2.567, 2)", 2.57),
+        ("floor(2.7) + ceil(2.1)", 5.0),
+        ("exp(0)", 1.0),
+        ("log10(1000)", 3.0),
+    ])
+    def test_functions(self, expression, expected):
+        """Test whitelisted math functions."""
+        result = calculate(expression)
+
+        assert result["success"] is True
+        assert result["result"] == pytest.approx(expected)
+
+    def test_constants(self):
+        """Test that pi and e are available and the expression is echoed as given."""
+        result = calculate("2 * pi + e")
+
+        assert result["result"] == pytest.approx(2 * math.pi + math.e)
+        assert result["expression"] == "2*pi+e"
+
+    @pytest.mark.parametrize("expression", [
+        "x + 1",
+        "foo(1)",
+        "(1).real",
+        "[].append",
+        "'a' * 3",
+        "True + 1",
+        "lambda: 1",
+    ])
+    def test_rejects_unknown_names_and_attributes(self, expression):
+        """Test that anything outside the whitelist is an error, not evaluated."""
+        result = calculate(expression)
+
+        assert result["success"] is False
+        assert result["error"].startswith("Calculation error:")
+
+    @pytest.mark.parametrize("expression", ["__import__('os')", "open('x')", "exec('1')"])
+    def test_rejects_forbidden_patterns(self, expression):
+        """Test the forbidden-pattern check."""
+        result = calculate(expression)
+
+        assert result == {
+            "success": False,
+            "error": "Expression contains forbidden operations",
+            "expression": expression,
+        }
+
+    def test_caret_is_not_power(self):
+        """Test that ^ is rejected with a hint instead of computing XOR."""
+        result = calculate("2^3")
+
+        assert result["success"] is False
+        assert "use ** for powers" in result["error"]
+
+    @pytest.mark.parametrize("expression", ["1 / 0", "5 // 0", "5 % 0"])
+    def test_division_by_zero(self, expression):
+        """Test that division by zero is reported, not raised."""
+        result = calculate(expression)
+
+        assert result["success"] is False
+        assert result["error"] == "Division by zero"
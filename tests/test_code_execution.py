@@ -0,0 +1,49 @@
+"""
+Unit tests for the code execution tool.
+
+Tests the restricted builtins seen by agent code and worker timeouts.
+"""
+
+import threading
+
+import pytest
+
+from src.tools.code_execution import execute_python_code
+
+
+@pytest.mark.unit
+class TestExecutePythonCode:
+    """Test execute_python_code."""
+
+    def test_runs_code_with_safe_builtins(self):
+        """Test that whitelisted builtins are available."""
+        result = execute_python_code("total = sum(range(5))\nprint(total)")
+
+        assert result["success"] is True
+        assert result["stdout"] == "10\n"
+        assert result["variables"]["total"] == "10"
+
+    @pytest.mark.parametrize("code", ["import os", "from os import path"])
+    def test_import_fails_with_import_error(self, code):
+        """Test that imports fail cleanly instead of crashing the interpreter."""
+        result = execute_python_code(code)
+
+        assert result["success"] is False
+        assert "ImportError" in result["traceback"]
+        assert "SystemError" not in result["traceback"]
+
+    def test_timeout_does_not_affect_concurrent_execution(self):
+        """Test that killing an overrunning worker leaves other runs alone."""
+        results = {}
+        slow = threading.Thread(
+            target=lambda: results.update(slow=execute_python_code("while True: pass", timeout=1))
+        )
+        slow.start()
+
+        fast = execute_python_code("x = 1 + 1", timeout=5)
+        slow.join()
+
+        assert fast["success"] is True
+        assert results["slow"]["success"] is False
+        assert "timed out" in results["slow"]["error"]
+        assert execute_python_code("print('ok')")["stdout"] == "ok\n"
@@ -0,0 +1,290 @@
+"""
+Unit tests for the customer repository.
+
+Tests index maintenance and write-through to storage backends.
+"""
+
+import os
+from dataclasses import replace
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.domain.customer import Customer, CustomerStatus, PlanTier, SubscriptionStatus
+from src.infrastructure.customer_repository import CustomerRepository
+from src.infrastructure.customer_storage import (
+    DuplicateEmailError,
+    InMemoryCustomerStorage,
+    RedisCustomerStorage,
+    SqliteCustomerStorage,
+)
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+async def open_storage(request, tmp_path):
+    """
+    Open backends of each storage kind; Redis needs REDIS_URL.
+
+    Every call opens a new connection to the same SQLite file or Redis
+    database, like a restarted or second API instance. In-memory storage
+    can't be reopened, so calls share one instance.
+    """
+    if request.param == "redis" and not REDIS_URL:
+        pytest.skip("REDIS_URL not set")
+    opened = []
+    memory = InMemoryCustomerStorage()
+
+    def open_backend():
+        if request.param == "memory":
+            return memory
+        if request.param == "sqlite":
+            backend = SqliteCustomerStorage(str(tmp_path / "customers.db"))
+        else:
+            backend = RedisCustomerStorage(REDIS_URL)
+        opened.append(backend)
+        return backend
+
+    yield open_backend
+    if request.param == "redis" and opened:
+        async for customer in opened[0].scan():
+            await opened[0].delete(customer.id)
+    for backend in opened:
+        await backend.close()
+
+
+@pytest.fixture
+def storage(open_storage):
+    """Create each customer storage backend."""
+    return open_storage()
+
+
+@pytest.fixture
+def customer_repository(storage) -> CustomerRepository:
+    """Create a customer repository on top of a storage backend."""
+    return CustomerRepository(storage)
+
+
+def make_customer(email: str = "user@example.com") -> Customer:
+    """Create a customer with every optional field populated."""
+    customer = Customer.create(
+        email=email,
+        password_hash="hashed",
+        name="Test User",
+        plan_tier=PlanTier.PRO,
+    )
+    return replace(
+        customer,
+        last_login_at=datetime(2024, 1, 2, 3, 4, 5),
+        stripe_customer_id="cus_123",
+        metadata={"source": "test"},
+    )
+
+
+@pytest.mark.unit
+class TestCustomerRepository:
+    """Test CustomerRepository CRUD against each storage backend."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_by_id(self, customer_repository):
+        """Test creating a customer and retrieving it by ID."""
+        customer = await customer_repository.create(
+            email="user@example.com", password="secret", name="Test User"
+        )
+
+        retrieved = await customer_repository.get_by_id(customer.id)
+
+        assert retrieved == customer
+        assert retrieved.password_hash != "secret"
+
+    @pytest.mark.asyncio
+    async def test_get_by_email(self, customer_repository):
+        """Test retrieving a customer by email, ignoring case."""
+        customer = await customer_repository.create(email="user@example.com", password="secret")
+
+        assert await customer_repository.get_by_email("user@example.com") == customer
+        assert await customer_repository.get_by_email("USER@example.com") == customer
+        assert await customer_repository.get_by_email("other@example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_email_raises(self, customer_repository):
+        """Test that an email can only be registered once."""
+        await customer_repository.create(email="user@example.com", password="secret")
+
+        with pytest.raises(ValueError):
+            await customer_repository.create(email="user@example.com", password="secret")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_from_another_instance(self, open_storage):
+        """Test that an email taken via one repository is rejected by a fresh one."""
+        first = CustomerRepository(open_storage())
+        customer = await first.create(email="user@example.com", password="secret")
+
+        second = CustomerRepository(open_storage())
+        with pytest.raises(ValueError):
+            await second.create(email="User@example.com", password="secret")
+        created = await second.bulk_create([
+            {"email": "user@example.com", "password": "secret"},
+            {"email": "other@example.com", "password": "secret"},
+        ])
+        assert [c.email for c in created] == ["other@example.com"]
+        with pytest.raises(ValueError):
+            await second.update(replace(created[0], email="user@example.com"))
+
+        assert await CustomerRepository(open_storage()).get_by_email("user@example.com") == customer
+        assert await second.get_by_email("other@example.com") == created[0]
+
+    @pytest.mark.asyncio
+    async def test_update_plan_moves_indexes(self, customer_repository):
+        """Test that updates are visible to filtered queries and storage."""
+        customer = await customer_repository.create(email="user@example.com", password="secret")
+
+        upgraded = await customer_repository.upgrade_plan(customer.id, PlanTier.PRO)
+
+        assert upgraded.plan_tier == PlanTier.PRO
+        assert upgraded.subscription_status == SubscriptionStatus.ACTIVE
+        assert await customer_repository.count(plan_tier=PlanTier.FREE) == 0
+        assert await customer_repository.list_all(plan_tier=PlanTier.PRO) == [upgraded]
+
+        restarted = CustomerRepository(customer_repository._storage)
+        assert await restarted.get_by_id(customer.id) == upgraded
+
+    @pytest.mark.asyncio
+    async def test_update_email(self, customer_repository):
+        """Test that changing email re-keys the email index."""
+        customer = await customer_repository.create(email="old@example.com", password="secret")
+
+        await customer_repository.update(replace(customer, email="New@Example.com"))
+
+        assert await customer_repository.get_by_email("old@example.com") is None
+        updated = await customer_repository.get_by_email("new@example.com")
+        assert updated is not None
+        assert updated.id == customer.id
+
+    @pytest.mark.asyncio
+    async def test_update_missing_customer_raises(self, customer_repository):
+        """Test that updating an unknown customer raises."""
+        with pytest.raises(ValueError):
+            await customer_repository.update(make_customer())
+
+    @pytest.mark.asyncio
+    async def test_delete_is_soft(self, customer_repository):
+        """Test that delete marks the customer cancelled and keeps the record."""
+        customer = await customer_repository.create(email="user@example.com", password="secret")
+
+        assert await customer_repository.delete(customer.id) is True
+        assert await customer_repository.delete(uuid4()) is False
+
+        cancelled = await customer_repository.get_by_id(customer.id)
+        assert cancelled.status == CustomerStatus.CANCELLED
+        assert cancelled.cancelled_at is not None
+        assert await customer_repository.count(status=CustomerStatus.CANCELLED) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_order_is_stable(self, customer_repository):
+        """Test that pages keep their order across updates and restarts."""
+        for i in range(4):
+            await customer_repository.create(email=f"user{i}@example.com", password="secret")
+        active = await customer_repository.list_all(status=CustomerStatus.ACTIVE)
+        
+        await customer_repository.suspend(active[0].id)
+        await customer_repository.reactivate(active[0].id)
+        
+        expected = [c.id for c in active]
+        assert [c.id for c in await customer_repository.list_all(status=CustomerStatus.ACTIVE)] == expected
+        assert [c.id for c in await customer_repository.list_all()] == expected
+        page, total = await customer_repository.query(status=CustomerStatus.ACTIVE, limit=2, offset=1)
+        assert [c.id for c in page] == expected[1:3]
+        assert total == 4
+        
+        restarted = CustomerRepository(customer_repository._storage)
+        await restarted.load()
+        assert [c.id for c in await restarted.list_all(plan_tier=PlanTier.FREE)] == expected
+
+    @pytest.mark.asyncio
+    async def test_load_warms_indexes_from_storage(self, customer_repository):
+        """Test that a new repository on the same storage sees existing customers."""
+        customer = await customer_repository.create(email="user@example.com", password="secret")
+
+        restarted = CustomerRepository(customer_repository._storage)
+        loaded = await restarted.load()
+
+        assert loaded == 1
+        assert await restarted.count(status=CustomerStatus.ACTIVE) == 1
+        assert await restarted.get_by_email("user@example.com") == customer
+
+
+@pytest.mark.unit
+class TestCustomerStorage:
+    """Test that each storage backend round-trips customer records."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, storage):
+        """Test that a stored customer is read back unchanged."""
+        customer = make_customer()
+
+        await storage.set(customer)
+
+        assert await storage.get(customer.id) == customer
+        assert await storage.get_by_email(customer.email) == customer
+        assert [c async for c in storage.scan()] == [customer]
+
+    @pytest.mark.asyncio
+    async def test_set_duplicate_email_raises(self, storage):
+        """Test that a second customer can't take an email or replace its owner."""
+        customer = make_customer()
+        await storage.set(customer)
+
+        with pytest.raises(DuplicateEmailError):
+            await storage.set(make_customer())
+        await storage.set(replace(customer, name="Renamed"))
+
+        assert (await storage.get_by_email(customer.email)).name == "Renamed"
+        assert [c.id async for c in storage.scan()] == [customer.id]
+
+    @pytest.mark.asyncio
+    async def test_delete(self, storage):
+        """Test that deleted customers are gone from every lookup."""
+        customer = make_customer()
+        await storage.set(customer)
+
+        await storage.delete(customer.id)
+
+        assert await storage.get(customer.id) is None
+        assert await storage.get_by_email(customer.email) is None
+        assert [c async for c in storage.scan()] == []
+
+    @pytest.mark.asyncio
+    async def test_get_missing(self, storage):
+        """Test that unknown ids and emails return None."""
+        assert await storage.get(uuid4()) is None
+        assert await storage.get_by_email("missing@example.com") is None
+
+
+@pytest.mark.unit
+class TestCustomerRepositoryEmailIndex:
+    """Test that the email index is keyed by the normalized email."""
+
+    @pytest.mark.asyncio
+    async def test_mixed_case_signup_then_suspend(self, customer_repository):
+        """Test suspending a customer who signed up with a mixed-case email."""
+        customer = await customer_repository.create(
+            email="Foo@Example.com", password="secret-password"
+        )
+
+        suspended = await customer_repository.suspend(customer.id)
+
+        assert suspended.status == CustomerStatus.SUSPENDED
+        retrieved = await customer_repository.get_by_email("foo@example.com")
+        assert retrieved is not None
+        assert retrieved.status == CustomerStatus.SUSPENDED
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_differs_only_in_case(self, customer_repository):
+        """Test that emails differing only in case are treated as duplicates."""
+        await customer_repository.create(email="foo@example.com", password="secret")
+
+        with pytest.raises(ValueError):
+            await customer_repository.create(email="FOO@example.com", password="secret")
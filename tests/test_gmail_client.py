@@ -0,0 +1,218 @@
+"""
+Unit tests for the Gmail client's /batch requests.
+
+The HTTP layer is an httpx MockTransport that answers with canned
+multipart/mixed responses, so no Google credentials or network are needed.
+"""
+
+import json
+from email.parser import BytesParser
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple
+
+import httpx
+import pytest
+
+from src.domain.exceptions import GmailAPIError
+from src.infrastructure.gmail_client import GMAIL_API_HOST, GmailClient
+
+# (Content-ID, status line, JSON body or None) per response part
+ResponsePart = Tuple[str, str, Optional[dict]]
+
+
+def parse_batch_request(request: httpx.Request) -> List[Tuple[str, str]]:
+    """Return (Content-ID, request line) for each sub-request."""
+    envelope = BytesParser().parsebytes(
+        f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+        + request.content
+    )
+    return [
+        (
+            part["Content-ID"],
+            part.get_payload(decode=True).split(b"\r\n", 1)[0].decode(),
+        )
+        for part in envelope.get_payload()
+    ]
+
+
+def batch_response(parts: List[ResponsePart]) -> httpx.Response:
+    """Build a multipart/mixed batch response from canned parts."""
+    boundary = "batch_response"
+    chunks = []
+    for content_id, status_line, body in parts:
+        payload = json.dumps(body) if body is not None else ""
+        chunks.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: {content_id}\r\n\r\n"
+            f"{status_line}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{payload}\r\n"
+        )
+    chunks.append(f"--{boundary}--\r\n")
+    return httpx.Response(
+        200,
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        content="".join(chunks).encode(),
+    )
+
+
+def make_client(handler: Callable[[httpx.Request], httpx.Response]) -> GmailClient:
+    """Create a GmailClient whose HTTP calls go to `handler`."""
+    client = GmailClient.__new__(GmailClient)
+    client._credentials = SimpleNamespace(valid=True, token="test-token")
+    client._http = httpx.AsyncClient(
+        base_url=GMAIL_API_HOST, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def echo_ids(request: httpx.Request) -> httpx.Response:
+    """Answer every sub-request with 200 and the message id from its path."""
+    parts: List[ResponsePart] = []
+    for content_id, request_line in parse_batch_request(request):
+        message_id = request_line.split()[1].split("/")[-2]
+        response_id = content_id.replace("<", "<response-", 1)
+        parts.append((response_id, "HTTP/1.1 200 OK", {"id": message_id}))
+    return batch_response(parts)
+
+
+@pytest.mark.unit
+class TestBatchExecute:
+    """Test GmailClient.batch_execute request building and response parsing."""
+
+    @pytest.mark.asyncio
+    async def test_sends_one_multipart_request(self):
+        """Test that sub-requests are numbered and addressed under the API root."""
+        seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return echo_ids(request)
+
+        client = make_client(handler)
+        await client.batch_execute([
+            ("POST", "users/me/messages/a/trash", None),
+            ("POST", "/users/me/messages/b/modify", {"removeLabelIds": ["INBOX"]}),
+        ])
+        await client.aclose()
+
+        assert len(seen) == 1
+        assert seen[0].url.path == "/batch/gmail/v1"
+        assert seen[0].headers["Authorization"] == "Bearer test-token"
+        assert parse_batch_request(seen[0]) == [
+            ("<item-0>", "POST /gmail/v1/users/me/messages/a/trash HTTP/1.1"),
+            ("<item-1>", "POST /gmail/v1/users/me/messages/b/modify HTTP/1.1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_responses_mapped_by_content_id(self):
+        """Test that out-of-order response parts land at their request's index."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return batch_response([
+                ("<response-item-2>", "HTTP/1.1 200 OK", {"id": "c"}),
+                ("<response-item-0>", "HTTP/1.1 200 OK", {"id": "a"}),
+                ("<response-item-1>", "HTTP/1.1 200 OK", {"id": "b"}),
+            ])
+
+        client = make_client(handler)
+        results = await client.batch_execute([
+            ("POST", f"users/me/messages/{message_id}/trash", None)
+            for message_id in ("a", "b", "c")
+        ])
+        await client.aclose()
+
+        assert results == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+    @pytest.mark.asyncio
+    async def test_non_2xx_part_is_an_error_result(self):
+        """Test that failed or missing parts carry an 'error' key."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return batch_response([
+                ("<response-item-0>", "HTTP/1.1 200 OK", {"id": "a"}),
+                (
+                    "<response-item-1>",
+                    "HTTP/1.1 404 Not Found",
+                    {"error": {"code": 404, "message": "Requested entity was not found."}},
+                ),
+                ("<response-item-2>", "HTTP/1.1 503 Service Unavailable", None),
+            ])
+
+        client = make_client(handler)
+        results = await client.batch_execute([
+            ("POST", f"users/me/messages/{message_id}/trash", None)
+            for message_id in ("a", "b", "c", "d")
+        ])
+        await client.aclose()
+
+        assert results[0] == {"id": "a"}
+        assert results[1]["error"]["code"] == 404
+        assert results[2]["error"]["code"] == 503
+        assert results[3]["error"]["message"] == "No response for batch item"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises_gmail_api_error(self):
+        """Test that a non-2xx batch envelope raises GmailAPIError."""
+        client = make_client(lambda request: httpx.Response(429))
+
+        with pytest.raises(GmailAPIError) as exc_info:
+            await client.batch_execute([("POST", "users/me/messages/a/trash", None)])
+        await client.aclose()
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_more_than_limit_raises(self):
+        """Test that callers must chunk above 100 sub-requests."""
+        client = make_client(echo_ids)
+
+        with pytest.raises(ValueError):
+            await client.batch_execute([("POST", "users/me/messages/a/trash", None)] * 101)
+        await client.aclose()
+
+
+@pytest.mark.unit
+class TestBatchRun:
+    """Test chunking and result counting across /batch round trips."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_one_hundred(self):
+        """Test that 250 messages go out as batches of 100, 100 and 50."""
+        batch_sizes: List[int] = []
+        trashed: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sub_requests = parse_batch_request(request)
+            batch_sizes.append(len(sub_requests))
+            trashed.extend(line.split()[1].split("/")[-2] for _, line in sub_requests)
+            return echo_ids(request)
+
+        client = make_client(handler)
+        message_ids = [f"msg{i}" for i in range(250)]
+        results = await client.batch_trash_messages(message_ids)
+        await client.aclose()
+
+        assert sorted(batch_sizes) == [50, 100, 100]
+        assert sorted(trashed) == sorted(message_ids)
+        assert results == {"success": 250, "failed": 0}
+
+    @pytest.mark.asyncio
+    async def test_counts_failed_parts_and_chunks(self):
+        """Test that failed sub-requests and failed round trips are counted."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            sub_requests = parse_batch_request(request)
+            if len(sub_requests) < 100:
+                return httpx.Response(500)
+            parts: List[ResponsePart] = [
+                (content_id.replace("<", "<response-", 1), "HTTP/1.1 200 OK", {})
+                for content_id, _ in sub_requests
+            ]
+            parts[0] = (parts[0][0], "HTTP/1.1 400 Bad Request", None)
+            return batch_response(parts)
+
+        client = make_client(handler)
+        results = await client.batch_trash_messages([f"msg{i}" for i in range(130)])
+        await client.aclose()
+
+        # First chunk: 99 succeed, 1 fails; the 30-message chunk fails outright
+        assert results == {"success": 99, "failed": 31}
@@ -0,0 +1,296 @@
+"""
+Unit tests for Gmail cleanup persistence.
+
+Tests run storage, listing and keyset pagination. Repository tests run
+against the in-memory backend and, when TEST_DATABASE_URL points at a
+PostgreSQL database, against PostgresGmailCleanupRepository as well.
+"""
+
+import asyncio
+import contextlib
+import os
+from datetime import datetime, timedelta
+from urllib.parse import urlencode, urlsplit, urlunsplit
+from uuid import uuid4
+
+import pytest
+
+from src.domain.metrics import ActionStatus, CleanupAction, CleanupRun, CleanupStatus
+from src.infrastructure.gmail_persistence import (
+    InMemoryGmailCleanupRepository,
+    PostgresGmailCleanupRepository,
+    POSTGRES_SCHEMA,
+)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def make_run(
+    run_id: str,
+    started_at: datetime,
+    user_id: str = "user123",
+    actions: int = 0,
+) -> CleanupRun:
+    """Create a completed cleanup run with `actions` successful archives."""
+    return CleanupRun(
+        id=run_id,
+        user_id=user_id,
+        status=CleanupStatus.COMPLETED,
+        policy_name="Test Policy",
+        started_at=started_at,
+        completed_at=started_at + timedelta(seconds=5),
+        actions=[
+            CleanupAction(
+                id=f"{run_id}_action{i}",
+                thread_id=f"thread{i}",
+                action_type="archive",
+                status=ActionStatus.SUCCESS,
+            )
+            for i in range(actions)
+        ],
+    )
+
+
+async def collect_pages(repository, user_id: str, limit: int):
+    """Walk every keyset page and return the run ids in order."""
+    run_ids = []
+    cursor = None
+    while True:
+        runs, cursor = await repository.list_runs_page(user_id, limit=limit, cursor=cursor)
+        run_ids.extend(run.id for run in runs)
+        if cursor is None:
+            return run_ids
+
+
+def _with_search_path(url: str, schema: str) -> str:
+    """Add a search_path server setting to a connection URL."""
+    parts = urlsplit(url)
+    query = "&".join(filter(None, [parts.query, urlencode({"search_path": schema})]))
+    return urlunsplit(parts._replace(query=query))
+
+
+@pytest.fixture(params=[
+    "memory",
+    pytest.param("postgres", marks=[
+        pytest.mark.postgres,
+        pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"),
+    ]),
+])
+async def repository(request):
+    """Create each cleanup repository; Postgres runs in a throwaway schema."""
+    if request.param == "memory":
+        yield InMemoryGmailCleanupRepository()
+        return
+
+    import asyncpg
+
+    schema = f"test_{uuid4().hex}"
+    conn = await asyncpg.connect(TEST_DATABASE_URL)
+    try:
+        await conn.execute(f'CREATE SCHEMA "{schema}"')
+        await conn.execute(f'SET search_path TO "{schema}"')
+        await conn.execute(POSTGRES_SCHEMA)
+        repo = PostgresGmailCleanupRepository(
+            _with_search_path(TEST_DATABASE_URL, schema),
+            pool_min_size=1,
+            pool_max_size=4,
+        )
+        yield repo
+        await repo.close()
+    finally:
+        await conn.execute(f'DROP SCHEMA "{schema}" CASCADE')
+        await conn.close()
+
+
+@pytest.mark.unit
+class TestCleanupRunStorage:
+    """Test saving, loading and listing cleanup runs."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_run(self, repository):
+        """Test that a saved run is read back with its actions."""
+        run = make_run("run1", datetime(2024, 1, 1, 12, 0, 0), actions=3)
+
+        await repository.save_run(run)
+        retrieved = await repository.get_run("user123", "run1")
+
+        assert retrieved is not None
+        assert retrieved.id == "run1"
+        assert retrieved.status == CleanupStatus.COMPLETED
+        assert retrieved.started_at == run.started_at
+        assert [a.id for a in retrieved.actions] == [a.id for a in run.actions]
+        assert all(a.status == ActionStatus.SUCCESS for a in retrieved.actions)
+
+    @pytest.mark.asyncio
+    async def test_save_again_replaces_run(self, repository):
+        """Test that re-saving a run replaces it and its actions."""
+        run = make_run("run1", datetime(2024, 1, 1), actions=150)
+        await repository.save_run(run)
+
+        run.status = CleanupStatus.FAILED
+        run.started_at += timedelta(minutes=1)
+        run.actions = run.actions[:2]
+        await repository.save_run(run)
+
+        retrieved = await repository.get_run("user123", "run1")
+        assert retrieved.status == CleanupStatus.FAILED
+        assert [a.id for a in retrieved.actions] == ["run1_action0", "run1_action1"]
+        assert [r.id for r in await repository.list_runs("user123")] == ["run1"]
+        assert await repository.get_run_count("user123") == 1
+
+    @pytest.mark.asyncio
+    async def test_get_run_checks_owner(self, repository):
+        """Test that one user can't read another user's run."""
+        await repository.save_run(make_run("run1", datetime(2024, 1, 1)))
+
+        assert await repository.get_run("someone_else", "run1") is None
+        assert await repository.get_run("user123", "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_list_runs_most_recent_first(self, repository):
+        """Test list_runs ordering, offset and count."""
+        started = datetime(2024, 1, 1)
+        for i in range(5):
+            await repository.save_run(make_run(f"run{i}", started + timedelta(minutes=i)))
+
+        assert [r.id for r in await repository.list_runs("user123")] == [
+            "run4", "run3", "run2", "run1", "run0",
+        ]
+        assert [r.id for r in await repository.list_runs("user123", limit=2, offset=1)] == [
+            "run3", "run2",
+        ]
+        assert await repository.list_runs("user123", offset=10) == []
+        assert await repository.get_run_count("user123") == 5
+
+    @pytest.mark.asyncio
+    async def test_pagination_matches_list_runs(self, repository):
+        """Test that walking keyset pages yields the same order as list_runs."""
+        started = datetime(2024, 1, 1)
+        for i in range(7):
+            # Pairs of runs share a start time
+            await repository.save_run(make_run(f"run{i}", started + timedelta(minutes=i // 2)))
+
+        listed = [r.id for r in await repository.list_runs("user123", limit=100)]
+
+        for limit in (1, 2, 3, 7, 10):
+            assert await collect_pages(repository, "user123", limit=limit) == listed
+
+
+@pytest.mark.unit
+class TestListRunsPage:
+    """Test keyset pagination of cleanup runs."""
+
+    @pytest.mark.asyncio
+    async def test_runs_sharing_a_timestamp_span_pages(self, repository):
+        """Test that runs with equal started_at are not skipped at a page boundary."""
+        started = datetime(2024, 1, 1, 12, 0, 0)
+        for run_id in ("run_a", "run_b", "run_c", "run_d"):
+            await repository.save_run(make_run(run_id, started))
+        await repository.save_run(make_run("run_old", started - timedelta(hours=1)))
+
+        run_ids = await collect_pages(repository, "user123", limit=2)
+
+        assert run_ids == ["run_d", "run_c", "run_b", "run_a", "run_old"]
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_is_started_at_and_run_id(self, repository):
+        """Test that the cursor carries both keyset columns."""
+        started = datetime(2024, 1, 1, 12, 0, 0)
+        await repository.save_run(make_run("run_a", started))
+        await repository.save_run(make_run("run_b", started))
+
+        runs, cursor = await repository.list_runs_page("user123", limit=1)
+
+        assert [run.id for run in runs] == ["run_b"]
+        assert cursor == (started, "run_b")
+
+
+class FakeConnection:
+    """Records the run ids upserted by each transaction."""
+
+    def __init__(self, failing_run_ids=()):
+        self.failing_run_ids = set(failing_run_ids)
+        self.upserted = []
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def executemany(self, sql, records):
+        if "gmail_cleanup_runs" in sql:
+            run_ids = [record[0] for record in records]
+            if self.failing_run_ids.intersection(run_ids):
+                raise RuntimeError("bad run")
+            self.upserted.append(run_ids)
+
+    async def execute(self, sql, *args):
+        pass
+
+    async def copy_records_to_table(self, table, records, columns):
+        pass
+
+
+class FakePool:
+    """Hands out a single FakeConnection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+    async def close(self):
+        pass
+
+
+def make_postgres_repository(conn: FakeConnection) -> PostgresGmailCleanupRepository:
+    """Create a Postgres repository whose pool is `conn`."""
+    repo = PostgresGmailCleanupRepository("postgresql://unused")
+    repo._pool = FakePool(conn)
+    return repo
+
+
+@pytest.mark.unit
+class TestPostgresRunWriter:
+    """Test the batching background writer behind save_run."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_share_a_transaction(self):
+        """Test that runs saved together are written as one batch."""
+        conn = FakeConnection()
+        repo = make_postgres_repository(conn)
+        runs = [make_run(f"run{i}", datetime(2024, 1, 1)) for i in range(5)]
+
+        await asyncio.gather(*(repo.save_run(run) for run in runs))
+        await repo.close()
+
+        assert conn.upserted == [[run.id for run in runs]]
+
+    @pytest.mark.asyncio
+    async def test_repeated_save_in_a_batch_is_written_once(self):
+        """Test that a run queued twice is upserted once and both callers return."""
+        conn = FakeConnection()
+        repo = make_postgres_repository(conn)
+        run = make_run("run1", datetime(2024, 1, 1))
+
+        await asyncio.gather(repo.save_run(run), repo.save_run(run))
+        await repo.close()
+
+        assert conn.upserted == [["run1"]]
+
+    @pytest.mark.asyncio
+    async def test_bad_run_fails_alone(self):
+        """Test that a failing run is retried alone and only its caller sees the error."""
+        conn = FakeConnection(failing_run_ids={"bad"})
+        repo = make_postgres_repository(conn)
+        runs = [make_run(run_id, datetime(2024, 1, 1)) for run_id in ("good1", "bad", "good2")]
+
+        results = await asyncio.gather(
+            *(repo.save_run(run) for run in runs), return_exceptions=True
+        )
+        await repo.close()
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], RuntimeError)
+        assert conn.upserted == [["good1"], ["good2"]]
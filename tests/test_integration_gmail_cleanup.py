@@ -1,6 +1,8 @@
 """
 Integration tests for Gmail cleanup API with persistence and observability.
 """
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from typing import AsyncGenerator, List, Dict, Any
@@ -16,7 +18,8 @@ from src.domain.email_thread import (
 from src.domain.metrics import CleanupRun, CleanupStatus
 from src.infrastructure.gmail_persistence import InMemoryGmailCleanupRepository
 from src.infrastructure.gmail_observability import GmailCleanupObservability
-from src.infrastructure.observability import ObservabilityProvider
+from src.infrastructure.observability import ObservabilityProvider, StructuredLogger
+from src.rate_limiting import RateLimitError
 
 
 # Mock Gmail Client for testing
@@ -366,6 +369,42 @@ async def test_dry_run_mode(
     assert len(mock_gmail_client.executed_actions) == 0
 
 
+class FullOnceRateLimiter:
+    """Rate limiter whose first check reports a full window."""
+    
+    def __init__(self):
+        self.checks = []
+    
+    async def check_and_record(self, tokens: int, estimated_cost: float, user_id: str = "default"):
+        self.checks.append(user_id)
+        if len(self.checks) == 1:
+            raise RateLimitError("Too many requests per minute", "requests_per_minute", retry_after=0)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_execute_cleanup_checks_rate_limiter(mock_gmail_client: MockGmailClient):
+    """Test that every Gmail action is recorded with the rate limiter."""
+    from src.application.gmail_cleanup_use_cases import ExecuteCleanupUseCase
+    
+    policy = CleanupPolicy(
+        id="policy1",
+        user_id="user123",
+        name="Rate Limit Test",
+        rules=[CleanupRule(sender_domain="@linkedin.com", action=CleanupAction.ARCHIVE)],
+        dry_run=False,
+    )
+    rate_limiter = FullOnceRateLimiter()
+    
+    use_case = ExecuteCleanupUseCase(mock_gmail_client, rate_limiter=rate_limiter)
+    run = await use_case.execute("user123", policy)
+    
+    assert run.status == CleanupStatus.COMPLETED
+    assert len(mock_gmail_client.executed_actions) > 0
+    # The refused first check is retried after waiting, then one per action
+    assert rate_limiter.checks == ["user123"] * (len(mock_gmail_client.executed_actions) + 1)
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_observability_metrics_recorded(
@@ -386,6 +425,51 @@ async def test_observability_metrics_recorded(
     assert True  # If we got here, metrics were recorded successfully
 
 
+class RecordingProvider(StructuredLogger):
+    """Observability provider that keeps every recorded metric sample."""
+    
+    def __init__(self):
+        super().__init__()
+        self.samples = []
+    
+    def record_metrics(self, samples):
+        self.samples.extend(samples)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_mailbox_gauges_hold_latest_value(monkeypatch):
+    """Test that gauges throttled within a window are written with the latest value."""
+    from src.infrastructure import gmail_observability
+    
+    monkeypatch.setattr(gmail_observability, "GAUGE_MIN_INTERVAL_SECONDS", 0.2)
+    provider = RecordingProvider()
+    observability = GmailCleanupObservability(provider)
+    
+    def health_scores():
+        return [
+            value for name, value, _ in provider.samples
+            if name == "gmail_mailbox_health_score"
+        ]
+    
+    for score in (10.0, 20.0, 30.0):
+        observability.log_analysis_completed("user123", 5, 1, score)
+    await observability._buffer.flush()
+    assert health_scores() == [10.0]
+    
+    # The held value is written when the window ends
+    await asyncio.sleep(0.3)
+    await observability._buffer.flush()
+    assert health_scores() == [10.0, 30.0]
+    
+    # ... or on flush, without waiting for the window
+    observability.log_analysis_completed("user123", 5, 1, 40.0)
+    await observability._buffer.flush()
+    assert health_scores() == [10.0, 30.0]
+    await observability.flush()
+    assert health_scores() == [10.0, 30.0, 40.0]
+
+
 @pytest.mark.integration
 async def test_concurrent_cleanup_runs(
     mock_gmail_client: MockGmailClient,
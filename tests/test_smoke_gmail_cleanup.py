@@ -14,7 +14,7 @@ and production code paths.
 """
 import pytest
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from unittest.mock import MagicMock
 
 from src.domain.cleanup_policy import CleanupPolicy, RetentionPolicy, CleanupAction
@@ -39,12 +39,18 @@ class MockGmailClient:
         self.executed_actions = []
         self.rate_limit_hits = 0
     
-    def list_threads(self, query: str = '', max_results: int = 100) -> List[EmailThread]:
-        """Generate test threads."""
+    def list_threads(
+        self,
+        query: str = '',
+        max_results: int = 100,
+        label_ids: Optional[List[str]] = None,
+    ) -> List[EmailThread]:
+        """Generate test threads; max_results=0 returns the whole inbox."""
         now = datetime.now()
         threads = []
+        count = min(self.inbox_size, max_results) if max_results else self.inbox_size
         
-        for i in range(min(self.inbox_size, max_results)):
+        for i in range(count):
             category = EmailCategory.PROMOTIONS if i % 3 == 0 else EmailCategory.PRIMARY
             age_days = (i % 180)
             is_starred = i == 0
@@ -264,6 +270,19 @@ def test_large_inbox_processing():
     print(f"\n✓ Large inbox: processed {run.before_snapshot.thread_count} threads")
 
 
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_default_iter_threads_streams_whole_inbox():
+    """Verify the default iter_threads yields every thread, not the first page."""
+    from src.domain.gmail_interfaces import IGmailClient
+    
+    large_client = MockGmailClient(inbox_size=250)
+    
+    threads = [thread async for thread in IGmailClient.iter_threads(large_client)]
+    
+    assert [thread.id for thread in threads] == [f"thread{i}" for i in range(250)]
+
+
 # ============================================================================
 # Safety Guardrails Tests
 # ============================================================================
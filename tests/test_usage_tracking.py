@@ -0,0 +1,108 @@
+"""
+Unit tests for the usage tracking service.
+
+Tests per-period usage records, resets and expiry of old records.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.usage_tracking import UsageTrackingService
+
+
+@pytest.fixture
+def usage_tracking() -> UsageTrackingService:
+    """Create an empty usage tracking service."""
+    return UsageTrackingService()
+
+
+@pytest.mark.unit
+class TestUsageRecords:
+    """Test recording and reading usage across periods."""
+
+    def test_usage_accumulates_per_period(self, usage_tracking):
+        """Test that emails and cleanups add up within each period only."""
+        customer_id = uuid4()
+
+        usage_tracking.record_emails_processed(customer_id, 10, period="2024-01")
+        usage_tracking.record_cleanup_executed(customer_id, 5, period="2024-01")
+        usage_tracking.record_cleanup_executed(customer_id, 7, period="2024-02")
+
+        january = usage_tracking.get_usage(customer_id, "2024-01")
+        february = usage_tracking.get_usage(customer_id, "2024-02")
+        assert (january.emails_processed, january.cleanups_executed) == (15, 1)
+        assert (february.emails_processed, february.cleanups_executed) == (7, 1)
+
+    def test_get_usage_without_records(self, usage_tracking):
+        """Test that unknown customers and periods read as zero without being stored."""
+        customer_id = uuid4()
+        usage_tracking.record_emails_processed(customer_id, 10, period="2024-01")
+
+        assert usage_tracking.get_usage(customer_id, "2024-03").emails_processed == 0
+        assert usage_tracking.get_usage(uuid4(), "2024-01").emails_processed == 0
+        assert list(usage_tracking._usage_db) == [customer_id.int]
+        assert list(usage_tracking._usage_db[customer_id.int]) == ["2024-01"]
+
+    def test_daily_cleanup_count(self, usage_tracking):
+        """Test that each cleanup counts toward today's total."""
+        customer_id = uuid4()
+
+        usage_tracking.record_cleanup_executed(customer_id, 1)
+        usage_tracking.record_cleanup_executed(customer_id, 1)
+
+        assert usage_tracking.get_daily_cleanup_count(customer_id) == 2
+        assert usage_tracking.get_daily_cleanup_count(uuid4()) == 0
+
+    def test_reset_usage_clears_one_period(self, usage_tracking):
+        """Test that a reset clears only the given period and drops emptied entries."""
+        customer_id = uuid4()
+        usage_tracking.record_cleanup_executed(customer_id, 5, period="2024-01")
+        usage_tracking.record_cleanup_executed(customer_id, 7, period="2024-02")
+
+        usage_tracking.reset_usage(customer_id, "2024-01")
+
+        assert usage_tracking.get_usage(customer_id, "2024-01").emails_processed == 0
+        assert usage_tracking.get_usage(customer_id, "2024-02").emails_processed == 7
+        assert usage_tracking.get_daily_cleanup_count(customer_id) == 0
+
+        usage_tracking.reset_usage(customer_id, "2024-02")
+        usage_tracking.reset_usage(uuid4(), "2024-02")
+
+        assert customer_id.int not in usage_tracking._usage_db
+        assert len(usage_tracking._usage_db) == 0
+        assert "2024-02" not in usage_tracking._by_period
+
+
+@pytest.mark.unit
+class TestCleanupOldRecords:
+    """Test expiry of usage records older than the retention window."""
+
+    def test_counts_deleted_records(self, usage_tracking):
+        """Test that only expired records are deleted and counted."""
+        old_customer, active_customer = uuid4(), uuid4()
+        current_period = datetime.utcnow().strftime("%Y-%m")
+        usage_tracking.record_emails_processed(old_customer, 1, period="2000-01")
+        usage_tracking.record_emails_processed(old_customer, 1, period="2000-02")
+        usage_tracking.record_emails_processed(active_customer, 1, period="2000-01")
+        usage_tracking.record_emails_processed(active_customer, 1, period=current_period)
+
+        assert usage_tracking.cleanup_old_records(months_to_keep=12) == 3
+        assert usage_tracking.cleanup_old_records(months_to_keep=12) == 0
+
+        assert usage_tracking.get_usage(active_customer, current_period).emails_processed == 1
+        assert usage_tracking.get_usage(active_customer, "2000-01").emails_processed == 0
+
+    def test_drops_emptied_customers(self, usage_tracking):
+        """Test that customers left without records are removed entirely."""
+        old_customer, active_customer = uuid4(), uuid4()
+        current_period = datetime.utcnow().strftime("%Y-%m")
+        usage_tracking.record_emails_processed(old_customer, 1, period="2000-01")
+        usage_tracking.record_emails_processed(active_customer, 1, period=current_period)
+        usage_tracking.record_emails_processed(active_customer, 1, period="2000-01")
+
+        assert usage_tracking.cleanup_old_records(months_to_keep=12) == 2
+
+        assert list(usage_tracking._usage_db) == [active_customer.int]
+        assert list(usage_tracking._by_period) == [current_period]